@@ -0,0 +1,68 @@
+"""Benchmark Motion task parsing: per-item, bulk and trusted bulk."""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, List
+
+from src.core.models.task import Task
+
+
+def make_payload(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """Build a synthetic /tasks payload resembling a large workspace."""
+    rng = random.Random(seed)
+    base = datetime(2024, 3, 1, tzinfo=timezone.utc)
+    statuses = ["todo", "in_progress", "done", "archived"]
+    priorities = ["low", "medium", "high", "urgent"]
+    payload = []
+    for i in range(count):
+        start = base + timedelta(days=rng.randrange(60), hours=rng.randrange(8, 18))
+        payload.append({
+            "id": f"task_{i}",
+            "name": f"Task {i}",
+            "status": {"name": rng.choice(statuses).upper()},
+            "priority": rng.choice(priorities).upper(),
+            "description": "Synthetic benchmark task",
+            "due_date": (start + timedelta(days=2)).strftime("%Y-%m-%dT%H:00:00Z"),
+            "scheduledStart": start.strftime("%Y-%m-%dT%H:00:00Z"),
+            "scheduledEnd": (start + timedelta(hours=1)).strftime("%Y-%m-%dT%H:00:00Z"),
+            "project_id": f"proj_{rng.randrange(50)}",
+            "assignee_id": f"user_{rng.randrange(20)}",
+            "created_at": base.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "updated_at": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "tags": ["benchmark"],
+            "workspaceId": "ws_1",
+        })
+    return payload
+
+
+def run(name: str, parse: Callable[[], List[Task]], count: int, repeat: int) -> float:
+    """Time a parser and print its best throughput."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        tasks = parse()
+        best = min(best, time.perf_counter() - started)
+    assert len(tasks) == count
+    rate = count / best
+    print(f"{name:<14} {best * 1000:9.1f} ms {rate:12,.0f} tasks/sec")
+    return rate
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tasks", type=int, default=10_000, help="Number of tasks per payload")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per parser (best is reported)")
+    args = parser.parse_args()
+
+    payload = make_payload(args.tasks)
+    print(f"Parsing {args.tasks:,} tasks, best of {args.repeat}")
+    baseline = run("from_api_data", lambda: [Task.from_api_data(d) for d in payload], args.tasks, args.repeat)
+    bulk = run("bulk", lambda: Task.bulk_from_api_data(payload), args.tasks, args.repeat)
+    trusted = run("bulk trusted", lambda: Task.bulk_from_api_data(payload, trusted=True), args.tasks, args.repeat)
+    print(f"bulk speedup: {bulk / baseline:.2f}x, trusted speedup: {trusted / baseline:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
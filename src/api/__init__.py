@@ -1,5 +1,6 @@
 """API clients for external services."""
 
+from .async_motion import AsyncMotionClient
 from .motion import MotionClient
 
-__all__ = ["MotionClient"] 
\ No newline at end of file
+__all__ = ["AsyncMotionClient", "MotionClient"] 
\ No newline at end of file
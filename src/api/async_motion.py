@@ -0,0 +1,150 @@
+"""Asyncio client for the Motion API."""
+
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
+
+from src.api.motion import MotionClient
+from src.core.models.calendar import CalendarEventCollection
+from src.core.models.task import Task, TaskCollection
+from src.utils.config import MotionAPIConfig
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class AsyncMotionClient:
+    """
+    Asyncio client for the Motion API.
+
+    Exposes the same operations as MotionClient as coroutines, returning the same
+    Task/CalendarEvent models and raising the same MotionAPIError. Requests are
+    dispatched onto a bounded worker pool backed by a shared keep-alive connection
+    pool, so at most ``max_connections`` requests are in flight at any time and
+    independent calls (e.g. tasks and events) can be awaited together.
+    """
+
+    def __init__(
+        self,
+        config: MotionAPIConfig,
+        max_connections: int = 10,
+        client: Optional[MotionClient] = None,
+    ):
+        """
+        Initialize the async Motion API client.
+
+        Args:
+            config: Motion API configuration containing credentials and base URL.
+            max_connections: Maximum number of concurrent requests and pooled connections.
+            client: Optional pre-built MotionClient to share (e.g. across users).
+        """
+        if max_connections < 1:
+            raise ValueError("max_connections must be at least 1")
+        self.config = config
+        self.max_connections = max_connections
+        self.client = client or MotionClient(config, pool_maxsize=max_connections)
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_connections,
+            thread_name_prefix="motion-async",
+        )
+
+    async def __aenter__(self) -> "AsyncMotionClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Shut down the worker pool and close pooled connections."""
+        self._executor.shutdown(wait=True)
+        self.client.close()
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking MotionClient call on the bounded worker pool."""
+        loop = asyncio.get_running_loop()
+        # Carry context variables (e.g. the retry deadline) into the worker thread
+        context = contextvars.copy_context()
+        return await loop.run_in_executor(
+            self._executor,
+            functools.partial(context.run, func, *args, **kwargs),
+        )
+
+    async def get_tasks(
+        self,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        due_date: Optional[datetime] = None,
+    ) -> TaskCollection:
+        """Get tasks from Motion API. See MotionClient.get_tasks."""
+        return await self._run(
+            self.client.get_tasks,
+            project_id=project_id,
+            status=status,
+            assignee_id=assignee_id,
+            due_date=due_date,
+        )
+
+    async def get_task(self, task_id: str) -> Task:
+        """Get a single task by ID. See MotionClient.get_task."""
+        return await self._run(self.client.get_task, task_id)
+
+    async def create_task(self, task_data: Dict[str, Any]) -> Task:
+        """Create a new task. See MotionClient.create_task."""
+        return await self._run(self.client.create_task, task_data)
+
+    async def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Task:
+        """Update an existing task. See MotionClient.update_task."""
+        return await self._run(self.client.update_task, task_id, task_data)
+
+    async def delete_task(self, task_id: str) -> None:
+        """Delete a task. See MotionClient.delete_task."""
+        await self._run(self.client.delete_task, task_id)
+
+    async def get_tasks_scheduled_for_today(self, params: dict = None) -> TaskCollection:
+        """Get tasks scheduled for today. See MotionClient.get_tasks_scheduled_for_today."""
+        return await self._run(self.client.get_tasks_scheduled_for_today, params)
+
+    async def get_calendar_events(
+        self,
+        start_date: datetime,
+        end_date: datetime = None,
+    ) -> CalendarEventCollection:
+        """Get calendar events for a date range. See MotionClient.get_calendar_events."""
+        return await self._run(self.client.get_calendar_events, start_date, end_date)
+
+    async def get_tasks_and_events(
+        self,
+        start_date: datetime,
+        end_date: datetime = None,
+        params: dict = None,
+    ) -> Tuple[TaskCollection, CalendarEventCollection]:
+        """
+        Fetch today's tasks and calendar events concurrently.
+
+        Args:
+            start_date: The start date for events
+            end_date: The end date for events (optional, defaults to start_date + 1 day)
+            params: Optional query parameters for the task request
+
+        Returns:
+            Tuple[TaskCollection, CalendarEventCollection]: Tasks and events
+
+        Raises:
+            MotionAPIError: If either API request fails
+        """
+        tasks, events = await asyncio.gather(
+            self.get_tasks_scheduled_for_today(params),
+            self.get_calendar_events(start_date, end_date),
+        )
+        logger.debug(
+            "fetched_tasks_and_events",
+            task_count=len(tasks),
+            event_count=len(events),
+        )
+        return tasks, events
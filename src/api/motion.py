@@ -1,50 +1,134 @@
 """Motion API client for retrieving task data."""
 
+import contextvars
+import hashlib
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple, Union
 
 import requests
 from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
 
 from src.core.models.task import Task, TaskCollection
 from src.core.models.calendar import CalendarEvent, CalendarEventCollection
+from src.core.models.quarantine import Quarantine
+from src.utils.adaptive_rate import AdaptiveRateController, global_rate_controller
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, global_circuit_breakers
 from src.utils.config import MotionAPIConfig
-from src.utils.exceptions import MotionAPIError, retry_on_error
+from src.utils.exceptions import DailyDigestError, MotionAPIError
+from src.utils.http_cache import ResponseCache
 from src.utils.logging import get_logger
-from src.utils.rate_limiter import global_rate_limiter
+from src.utils.response_capture import ResponseCapture
+from src.utils.retry import RetryPolicy, attempt_timeout, remaining_time, status_code_of
+from src.utils.singleflight import SingleFlight, global_singleflight
 
 logger = get_logger(__name__)
 
+# Default retry policy for Motion API calls
+DEFAULT_RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=0.5, max_delay=8.0)
+
+# Methods that are safe to repeat after an ambiguous failure
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+# Default cache TTLs (seconds) per endpoint pattern
+DEFAULT_CACHE_TTLS = {
+    "/tasks": 60.0,
+    "/tasks/*": 120.0,
+    "/events": 300.0,
+}
+
+
+@dataclass
+class BulkResult:
+    """Outcome of a single item in a bulk task operation."""
+    index: int
+    task_id: Optional[str] = None
+    task: Optional[Task] = None
+    error: Optional[DailyDigestError] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the operation succeeded for this item."""
+        return self.error is None
+
+
+def _cache_endpoint(endpoint: str) -> str:
+    """Normalize an endpoint path for cache TTL matching and invalidation."""
+    return "/" + endpoint.strip("/")
+
+
+def _rate_endpoint(endpoint: str) -> str:
+    """Key an endpoint for adaptive rate control by its top-level resource."""
+    return "motion:/" + endpoint.strip("/").split("/", 1)[0]
+
 
 class MotionClient:
     """Client for interacting with the Motion API."""
 
-    def __init__(self, config: MotionAPIConfig):
+    def __init__(
+        self,
+        config: MotionAPIConfig,
+        pool_maxsize: int = 10,
+        capture: Optional[ResponseCapture] = None,
+        cache: Optional[ResponseCache] = None,
+        singleflight: Optional[SingleFlight] = None,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        quarantine: Optional[Quarantine] = None,
+    ):
         """
         Initialize the Motion API client.
         
         Args:
             config: Motion API configuration containing credentials and base URL.
+            pool_maxsize: Maximum number of pooled keep-alive connections.
+            capture: Optional raw response capture for debugging. Defaults to one
+                configured from MOTION_CAPTURE_* environment variables (off unless
+                MOTION_CAPTURE_ENABLED=true).
+            cache: Optional GET response cache. Defaults to one configured from
+                MOTION_CACHE_* environment variables (off unless
+                MOTION_CACHE_ENABLED=true).
+            singleflight: Optional single-flight group used to coalesce identical
+                in-flight GETs. Defaults to the process-wide group.
+            rate_controller: Optional adaptive per-endpoint rate controller tuned
+                from 429s and rate-limit headers. Defaults to the process-wide one.
+            retry_policy: Optional policy for retrying failed requests. Retries
+                share the caller's deadline (see src.utils.retry.deadline).
+            circuit_breakers: Optional registry of per-endpoint circuit breakers.
+                Defaults to the process-wide registry.
+            quarantine: Optional quarantine enabling tolerant parsing: malformed
+                tasks and events are recorded there and skipped instead of
+                failing the whole response. Defaults to one configured from
+                MOTION_QUARANTINE_* environment variables (off unless
+                MOTION_QUARANTINE_ENABLED=true).
         """
         self.config = config
+        self.pool_maxsize = pool_maxsize
+        self.capture = capture if capture is not None else ResponseCapture.from_env()
+        self.cache = cache if cache is not None else ResponseCache.from_env(endpoint_ttls=DEFAULT_CACHE_TTLS)
+        self.singleflight = singleflight if singleflight is not None else global_singleflight
+        self.rate_controller = rate_controller if rate_controller is not None else global_rate_controller
+        self.retry_policy = retry_policy or DEFAULT_RETRY_POLICY
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else global_circuit_breakers
+        self.quarantine = quarantine if quarantine is not None else Quarantine.from_env()
+        # Keep cached and coalesced responses separate per API key (i.e. per workspace/user)
+        self._cache_vary = hashlib.sha256(config.motion_api_key.encode("utf-8")).hexdigest()[:16]
         self.session = self._create_session()
-        print(f"[DEBUG] Using API Key: {self.config.motion_api_key[:8]}...")
+        logger.debug("motion_client_initialized", api_key_prefix=self.config.motion_api_key[:8])
 
     def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic."""
+        """Create a pooled requests session (retries are handled by the retry policy)."""
         session = requests.Session()
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,  # number of retries
-            backoff_factor=0.5,  # wait 0.5, 1, 2 seconds between retries
-            status_forcelist=[429, 500, 502, 503, 504],  # retry on these status codes
+        # No transport-level retries; each attempt must pass through the rate limiter
+        adapter = HTTPAdapter(
+            max_retries=0,
+            pool_connections=self.pool_maxsize,
+            pool_maxsize=self.pool_maxsize,
         )
-        
-        # Mount the retry strategy to both http and https
-        adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
@@ -58,16 +142,63 @@ class MotionClient:
         
         return session
 
-    def _enforce_rate_limit(self) -> None:
-        """Enforce rate limiting for API requests."""
-        if not global_rate_limiter.acquire(wait=True):
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self.session.close()
+
+    def _parse_tasks(self, items: List[Dict[str, Any]]) -> List[Task]:
+        """Parse raw tasks, skipping malformed ones when a quarantine is configured."""
+        tasks = Task.bulk_from_api_data(items, quarantine=self.quarantine)
+        self._log_ingest("task", len(items), len(tasks))
+        return tasks
+
+    def _parse_events(self, items: List[Dict[str, Any]]) -> List[CalendarEvent]:
+        """Parse raw events, skipping malformed ones when a quarantine is configured."""
+        events = CalendarEvent.bulk_from_api_data(items, quarantine=self.quarantine)
+        self._log_ingest("event", len(items), len(events))
+        return events
+
+    def _log_ingest(self, kind: str, received: int, parsed: int) -> None:
+        """Report how many records of a batch were quarantined."""
+        if parsed < received:
+            logger.warning(
+                "records_quarantined",
+                kind=kind,
+                received=received,
+                parsed=parsed,
+                quarantined=received - parsed,
+                total_quarantined=self.quarantine.stats()["quarantined"],
+            )
+
+    def _invalidate_cache(self, *endpoints: str) -> None:
+        """Drop cached responses for endpoints affected by a write."""
+        if self.cache is not None:
+            self.cache.invalidate(_cache_endpoint(e) for e in endpoints)
+
+    @staticmethod
+    def _record_outcome(breaker: CircuitBreaker, status_code: Any) -> None:
+        """Count server errors against the endpoint's breaker; anything else is a success."""
+        if isinstance(status_code, int) and status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+    def _enforce_rate_limit(self, endpoint: str) -> None:
+        """
+        Enforce rate limiting for API requests.
+        
+        The adaptive controller applies any server-requested pause and tunes
+        the account-wide limiter from responses. Waiting is bounded by the
+        current deadline.
+        """
+        rate_key = _rate_endpoint(endpoint)
+        if not self.rate_controller.acquire(rate_key, wait=True, timeout=remaining_time()):
             raise MotionAPIError(
                 message="Rate limit exceeded",
                 status_code=429,
-                details={"retry_after": global_rate_limiter.get_current_usage()[1]},
+                details={"retry_after": self.rate_controller.retry_after(rate_key)},
             )
 
-    @retry_on_error(max_attempts=3, delay=1.0, backoff=2.0, exceptions=(requests.RequestException,))
     def _make_request(
         self,
         method: str,
@@ -78,6 +209,9 @@ class MotionClient:
         """
         Make a request to the Motion API.
         
+        Concurrent identical GETs (same URL, params and API key) are coalesced
+        into a single network call whose parsed result is shared by all callers.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint path
@@ -90,8 +224,100 @@ class MotionClient:
         Raises:
             MotionAPIError: If the request fails
         """
+        if method.upper() != "GET":
+            return self._request_with_retry(method, endpoint, params=params, json=json)
         url = f"{self.config.motion_api_url.rstrip('/')}/{endpoint.lstrip('/')}"
-        self._enforce_rate_limit()
+        key = ResponseCache.make_key(method, url, params, vary=self._cache_vary)
+        return self.singleflight.do(key, self._request_with_retry, method, endpoint, params=params, json=json)
+
+    def _request_with_retry(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a request under the client's retry policy and the current deadline.
+        
+        Non-idempotent requests (POST, PATCH) are only retried when the server
+        rejected them with a 429, since any other failure may have been applied.
+        Errors without a status are only retried if they came from the transport.
+        """
+        idempotent = method.upper() in IDEMPOTENT_METHODS
+        
+        def retryable(error: BaseException) -> bool:
+            status = status_code_of(error)
+            if not idempotent and status != 429:
+                return False
+            if status is None and not isinstance(getattr(error, "cause", None), requests.RequestException):
+                return False
+            return self.retry_policy.is_retryable(error)
+        
+        return self.retry_policy.call(
+            self._send_request,
+            method,
+            endpoint,
+            params=params,
+            json=json,
+            operation=f"motion {method.upper()} {_cache_endpoint(endpoint)}",
+            retry_on=retryable,
+            exceptions=(MotionAPIError,),
+        )
+
+    def _send_request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Send a single attempt to the Motion API, consulting the response cache.
+        
+        If the endpoint's circuit breaker is open, a cached (even stale) GET
+        response is served instead; without one the call fails fast.
+        
+        Args:
+            method: HTTP method (GET, POST, etc.)
+            endpoint: API endpoint path
+            params: Optional query parameters
+            json: Optional JSON request body
+            
+        Returns:
+            Dict[str, Any]: API response data
+            
+        Raises:
+            MotionAPIError: If the request fails
+        """
+        url = f"{self.config.motion_api_url.rstrip('/')}/{endpoint.lstrip('/')}"
+        
+        # Serve fresh cached GET responses without touching the network
+        cache_key = None
+        cached = None
+        if self.cache is not None and method.upper() == "GET":
+            cache_key = self.cache.make_key(method, url, params, vary=self._cache_vary)
+            cached = self.cache.lookup(cache_key)
+            if cached is not None and cached.is_fresh():
+                return cached.value
+        
+        breaker = self.circuit_breakers.get(_rate_endpoint(endpoint))
+        if not breaker.allow_request():
+            if cached is not None:
+                logger.warning("circuit_open_serving_stale", breaker=breaker.name, url=url)
+                return cached.value
+            raise MotionAPIError(
+                message=f"Motion API unavailable: circuit breaker '{breaker.name}' is open",
+                details={"circuit": breaker.name},
+                cause=breaker.open_error(),
+            )
+        
+        try:
+            self._enforce_rate_limit(endpoint)
+            timeout = attempt_timeout(10.0)  # 10 seconds, capped by the deadline
+        except BaseException:
+            breaker.release()
+            raise
 
         # Set headers per request type
         headers = {
@@ -101,7 +327,10 @@ class MotionClient:
         if method.upper() in ("POST", "PUT", "PATCH"):
             headers["Content-Type"] = "application/json"
             headers["Authorization"] = f"Bearer {self.config.motion_api_key}"
+        if cached is not None and cached.can_revalidate():
+            headers.update(cached.conditional_headers())
 
+        response = None
         try:
             logger.debug(
                 "making_api_request",
@@ -117,8 +346,9 @@ class MotionClient:
                 params=params,
                 json=json,
                 headers=headers,  # override session headers
-                timeout=10.0,  # 10 second timeout
+                timeout=timeout,
             )
+            self._record_outcome(breaker, response.status_code)
             
             # Log the response status
             logger.debug(
@@ -126,15 +356,28 @@ class MotionClient:
                 status_code=response.status_code,
                 url=url,
             )
+            self.rate_controller.record_response(
+                _rate_endpoint(endpoint), response.status_code, response.headers
+            )
+            
+            # Stale cache entry confirmed unchanged by the server
+            if cached is not None and response.status_code == 304:
+                return self.cache.refresh(cached, response.headers).value
             
             # Raise for bad status codes
             response.raise_for_status()
             
-            return response.json()
+            data = response.json()
+            if cache_key is not None:
+                self.cache.store(cache_key, _cache_endpoint(endpoint), data, response.headers)
+            return data
             
         except requests.exceptions.RequestException as e:
             # Convert to our custom error type
             status_code = getattr(e.response, "status_code", None) if hasattr(e, "response") else None
+            if response is None:
+                # Connection errors and timeouts never produced a response
+                breaker.record_failure()
             error_details = None
             
             if hasattr(e, "response") and e.response is not None:
@@ -143,6 +386,15 @@ class MotionClient:
                 except ValueError:
                     error_details = {"text": e.response.text}
             
+            # Let the retry policy wait as long as the server asked (Retry-After / reset)
+            if status_code == 429:
+                retry_after = self.rate_controller.retry_after(_rate_endpoint(endpoint))
+                if retry_after > 0:
+                    error_details = {
+                        **(error_details if isinstance(error_details, dict) else {}),
+                        "retry_after": retry_after,
+                    }
+            
             error_message = f"Motion API request failed: {str(e)}"
             if error_details and isinstance(error_details, dict):
                 if 'error' in error_details:
@@ -178,39 +430,18 @@ class MotionClient:
         Raises:
             MotionAPIError: If the API request fails
         """
-        params = {}
-        if project_id:
-            params["project_id"] = project_id
-        if status:
-            params["status"] = status
-        if assignee_id:
-            params["assignee_id"] = assignee_id
-        if due_date:
-            params["due_date"] = due_date.isoformat()
+        params = self._build_task_params(project_id, status, assignee_id, due_date)
         
-        print(f"[DEBUG] Calling get_tasks with params: {params}")
         try:
             response = self._make_request(
                 method="GET",
                 endpoint="/tasks",
                 params=params,
             )
-            import json
-            print("[DEBUG] Raw /tasks API response:")
-            print(json.dumps(response, indent=2))
-            # Write the full response to a markdown file for inspection
-            with open("motion_api_tasks_response.md", "w", encoding="utf-8") as f:
-                f.write("```json\n")
-                f.write(json.dumps(response, indent=2))
-                f.write("\n```")
+            self.capture.record("/tasks", params, response)
             # Convert API response to Task objects
-            tasks = [
-                Task.from_api_data(task_data)
-                for task_data in response.get("tasks", [])
-            ]
-            print(f"[DEBUG] Parsed {len(tasks)} tasks from API response.")
-            for t in tasks:
-                print(f"  - Task: id={t.id}, title={t.title}, status={getattr(t, 'status', None)}, scheduled_start={getattr(t, 'scheduled_start', None)}")
+            tasks = self._parse_tasks(response.get("tasks", []))
+            logger.debug("tasks_parsed", count=len(tasks), params=params)
             return TaskCollection(tasks=tasks)
             
         except MotionAPIError as e:
@@ -224,6 +455,134 @@ class MotionClient:
             )
             raise
 
+    @staticmethod
+    def _build_task_params(
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        due_date: Optional[datetime] = None,
+        updated_since: Optional[datetime] = None,
+    ) -> Dict[str, Any]:
+        """Build query parameters for the /tasks endpoint."""
+        params: Dict[str, Any] = {}
+        if project_id:
+            params["project_id"] = project_id
+        if status:
+            params["status"] = status
+        if assignee_id:
+            params["assignee_id"] = assignee_id
+        if due_date:
+            params["due_date"] = due_date.isoformat()
+        if updated_since:
+            params["updated_since"] = updated_since.isoformat()
+        return params
+
+    def _fetch_task_page(self, params: Dict[str, Any], cursor: Optional[str]) -> Dict[str, Any]:
+        """Fetch a single page of /tasks, starting at the given cursor."""
+        page_params = dict(params)
+        if cursor:
+            page_params["cursor"] = cursor
+        response = self._make_request(
+            method="GET",
+            endpoint="/tasks",
+            params=page_params,
+        )
+        self.capture.record("/tasks", page_params, response)
+        return response
+
+    def iter_tasks(
+        self,
+        project_id: Optional[str] = None,
+        status: Optional[str] = None,
+        assignee_id: Optional[str] = None,
+        due_date: Optional[datetime] = None,
+        max_pages: Optional[int] = None,
+        max_items: Optional[int] = None,
+        prefetch: bool = True,
+        updated_since: Optional[datetime] = None,
+    ) -> Iterator[Task]:
+        """
+        Iterate over all tasks, following the /tasks pagination cursor.
+        
+        Pages are parsed and yielded one at a time so memory stays bounded by the
+        page size. With prefetch enabled, the next page is requested in the
+        background while the current page is being parsed and consumed.
+        
+        Args:
+            project_id: Optional project ID to filter tasks
+            status: Optional status to filter tasks
+            assignee_id: Optional assignee ID to filter tasks
+            due_date: Optional due date to filter tasks
+            max_pages: Optional maximum number of pages to fetch
+            max_items: Optional maximum number of tasks to yield
+            prefetch: Whether to fetch the next page in the background
+            updated_since: Optional watermark; only tasks updated after it are returned
+            
+        Yields:
+            Task: Tasks in API order
+            
+        Raises:
+            MotionAPIError: If an API request fails
+        """
+        if max_pages is not None and max_pages < 1:
+            return
+        if max_items is not None and max_items < 1:
+            return
+        
+        params = self._build_task_params(project_id, status, assignee_id, due_date, updated_since)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="motion-prefetch") if prefetch else None
+        pending: Optional[Future] = None
+        pages = 0
+        yielded = 0
+        
+        try:
+            response = self._fetch_task_page(params, None)
+            while True:
+                pages += 1
+                next_cursor = (response.get("meta") or {}).get("nextCursor")
+                page_tasks = response.get("tasks", [])
+                
+                more_pages = bool(next_cursor) and (max_pages is None or pages < max_pages)
+                if max_items is not None and yielded + len(page_tasks) >= max_items:
+                    more_pages = False
+                if more_pages and executor is not None:
+                    pending = executor.submit(
+                        contextvars.copy_context().run, self._fetch_task_page, params, next_cursor
+                    )
+                
+                logger.debug(
+                    "task_page_received",
+                    page=pages,
+                    page_size=len(page_tasks),
+                    has_next=bool(next_cursor),
+                )
+                
+                for task in self._parse_tasks(page_tasks):
+                    yield task
+                    yielded += 1
+                    if max_items is not None and yielded >= max_items:
+                        return
+                
+                if not more_pages:
+                    return
+                if pending is not None:
+                    response = pending.result()
+                    pending = None
+                else:
+                    response = self._fetch_task_page(params, next_cursor)
+        except MotionAPIError as e:
+            logger.error(
+                "failed_to_iterate_tasks",
+                page=pages + 1,
+                error=str(e),
+            )
+            raise
+        finally:
+            if pending is not None:
+                pending.cancel()
+            if executor is not None:
+                executor.shutdown(wait=False)
+
     def get_task(self, task_id: str) -> Task:
         """
         Get a single task by ID.
@@ -282,6 +641,8 @@ class MotionClient:
                 error=str(e),
             )
             raise
+        finally:
+            self._invalidate_cache("/tasks")
 
     def update_task(self, task_id: str, task_data: Dict[str, Any]) -> Task:
         """
@@ -314,6 +675,8 @@ class MotionClient:
                 error=str(e),
             )
             raise
+        finally:
+            self._invalidate_cache("/tasks", f"/tasks/{task_id}")
 
     def delete_task(self, task_id: str) -> None:
         """
@@ -338,63 +701,157 @@ class MotionClient:
                 error=str(e),
             )
             raise
+        finally:
+            self._invalidate_cache("/tasks", f"/tasks/{task_id}")
+
+    def _run_bulk(
+        self,
+        operation: str,
+        func: Callable[..., Optional[Task]],
+        items: Iterable[Tuple[Optional[str], Tuple[Any, ...]]],
+        max_workers: int,
+    ) -> List[BulkResult]:
+        """
+        Run a task operation over many items on a bounded worker pool.
+        
+        Every request still passes through the shared rate limiter. Bounding the
+        pool keeps at most ``max_workers`` bulk requests waiting on the limiter at
+        any time, so other callers are interleaved rather than queued behind the
+        whole batch.
+        
+        Args:
+            operation: Operation name used in logs
+            func: Single-item client method to call
+            items: (task_id, args) pairs to call ``func`` with
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List[BulkResult]: One result per item, in input order
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        
+        def run_one(index: int, task_id: Optional[str], args: Tuple[Any, ...]) -> BulkResult:
+            try:
+                return BulkResult(index=index, task_id=task_id, task=func(*args))
+            except DailyDigestError as e:
+                return BulkResult(index=index, task_id=task_id, error=e)
+        
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"motion-{operation}") as executor:
+            # Each worker runs in a copy of the caller's context so the deadline applies
+            futures = [
+                executor.submit(contextvars.copy_context().run, run_one, index, task_id, args)
+                for index, (task_id, args) in enumerate(items)
+            ]
+            results = [future.result() for future in futures]
+        
+        failed = sum(1 for result in results if not result.ok)
+        logger.info(
+            "bulk_operation_completed",
+            operation=operation,
+            total=len(results),
+            succeeded=len(results) - failed,
+            failed=failed,
+        )
+        return results
+
+    def bulk_create_tasks(
+        self,
+        tasks: Iterable[Dict[str, Any]],
+        max_workers: int = 4,
+    ) -> List[BulkResult]:
+        """
+        Create many tasks concurrently.
+        
+        Args:
+            tasks: Task data for each task to create
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List[BulkResult]: Per-task results in input order; failures carry the
+                error instead of aborting the batch
+        """
+        return self._run_bulk(
+            "create",
+            self.create_task,
+            ((None, (task_data,)) for task_data in tasks),
+            max_workers,
+        )
+
+    def bulk_update_tasks(
+        self,
+        updates: Union[Mapping[str, Dict[str, Any]], Iterable[Tuple[str, Dict[str, Any]]]],
+        max_workers: int = 4,
+    ) -> List[BulkResult]:
+        """
+        Update many tasks concurrently.
+        
+        Args:
+            updates: Mapping or iterable of (task_id, task_data) pairs
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List[BulkResult]: Per-task results in input order; failures carry the
+                error instead of aborting the batch
+        """
+        pairs = updates.items() if isinstance(updates, Mapping) else updates
+        return self._run_bulk(
+            "update",
+            self.update_task,
+            ((task_id, (task_id, task_data)) for task_id, task_data in pairs),
+            max_workers,
+        )
+
+    def bulk_delete_tasks(
+        self,
+        task_ids: Iterable[str],
+        max_workers: int = 4,
+    ) -> List[BulkResult]:
+        """
+        Delete many tasks concurrently.
+        
+        Args:
+            task_ids: IDs of the tasks to delete
+            max_workers: Maximum number of concurrent requests
+            
+        Returns:
+            List[BulkResult]: Per-task results in input order; failures carry the
+                error instead of aborting the batch
+        """
+        return self._run_bulk(
+            "delete",
+            self.delete_task,
+            ((task_id, (task_id,)) for task_id in task_ids),
+            max_workers,
+        )
 
     def get_tasks_scheduled_for_today(self, params: dict = None) -> TaskCollection:
         """
         Get tasks scheduled for today from Motion API, or for a custom date if params['due_date'] is provided.
         If params is provided, pass it to the API request.
         """
-        print(f"[DEBUG] Calling get_tasks_scheduled_for_today with params: {params}")
         try:
+            response = self._make_request(
+                method="GET",
+                endpoint="/tasks",
+                params=params,
+            )
+            self.capture.record("/tasks", params, response)
+            tasks = self._parse_tasks(response.get("tasks", []))
             if params is not None:
-                response = self._make_request(
-                    method="GET",
-                    endpoint="/tasks",
-                    params=params,
-                )
-                import json
-                print("[DEBUG] Raw /tasks API response (scheduled for today):")
-                print(json.dumps(response, indent=2))
-                # Write the full response to a markdown file for inspection
-                with open("motion_api_tasks_response.md", "w", encoding="utf-8") as f:
-                    f.write("```json\n")
-                    f.write(json.dumps(response, indent=2))
-                    f.write("\n```")
-                tasks = [
-                    Task.from_api_data(task_data)
-                    for task_data in response.get("tasks", [])
-                ]
-                print(f"[DEBUG] Parsed {len(tasks)} tasks from API response (scheduled for today).")
-                for t in tasks:
-                    print(f"  - Task: id={t.id}, title={t.title}, status={getattr(t, 'status', None)}, scheduled_start={getattr(t, 'scheduled_start', None)}")
+                logger.debug("tasks_parsed", count=len(tasks), params=params)
                 return TaskCollection(tasks=tasks)
-            else:
-                # Get all tasks (we'll filter client-side)
-                print("[DEBUG] No params provided, fetching all tasks for client-side filtering.")
-                response = self._make_request(
-                    method="GET",
-                    endpoint="/tasks",
-                )
-                import json
-                print("[DEBUG] Raw /tasks API response (all tasks):")
-                print(json.dumps(response, indent=2))
-                # Write the full response to a markdown file for inspection
-                with open("motion_api_tasks_response.md", "w", encoding="utf-8") as f:
-                    f.write("```json\n")
-                    f.write(json.dumps(response, indent=2))
-                    f.write("\n```")
-                tasks = [
-                    Task.from_api_data(task_data)
-                    for task_data in response.get("tasks", [])
-                ]
-                print(f"[DEBUG] Parsed {len(tasks)} tasks from API response (all tasks). Filtering by scheduled date.")
-                all_tasks = TaskCollection(tasks=tasks)
-                today = datetime.now(timezone.utc)
-                filtered = all_tasks.filter_by_scheduled_date(today)
-                print(f"[DEBUG] {len(filtered)} tasks remain after filtering by scheduled date (today={today.date()}).")
-                for t in filtered:
-                    print(f"  - Task: id={t.id}, title={t.title}, status={getattr(t, 'status', None)}, scheduled_start={getattr(t, 'scheduled_start', None)}")
-                return filtered
+            
+            # No params: all tasks were fetched, filter client-side
+            today = datetime.now(timezone.utc)
+            filtered = TaskCollection(tasks=tasks).filter_by_scheduled_date(today)
+            logger.debug(
+                "tasks_filtered_by_scheduled_date",
+                fetched=len(tasks),
+                remaining=len(filtered),
+                date=today.date().isoformat(),
+            )
+            return filtered
         except MotionAPIError as e:
             logger.error(
                 "failed_to_get_today_tasks",
@@ -425,10 +882,7 @@ class MotionClient:
                 endpoint="/events",
                 params=params,
             )
-            events = [
-                CalendarEvent.from_api_data(event_data)
-                for event_data in response.get("events", [])
-            ]
+            events = self._parse_events(response.get("events", []))
             return CalendarEventCollection(events)
         except MotionAPIError as e:
             logger.error(
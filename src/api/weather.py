@@ -9,12 +9,13 @@ from typing import Optional, Dict, Any, List
 from urllib.parse import urljoin
 
 import requests
-from requests.adapters import HTTPAdapter
-from requests.packages.urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+from src.utils.adaptive_rate import AdaptiveRateController, global_rate_controller
+from src.utils.circuit_breaker import CircuitBreakerRegistry, global_circuit_breakers
 from src.utils.config import WeatherAPIConfig
 from src.utils.exceptions import WeatherAPIError
+from src.utils.retry import RetryPolicy, attempt_timeout, remaining_time
 
 # Load environment variables
 load_dotenv()
@@ -34,24 +35,24 @@ class WeatherAPI:
         timeout: int = 10,
         max_retries: int = 3,
         initial_retry_delay: int = 5,
-        max_requests_per_day: int = 1000
+        max_requests_per_day: int = 1000,
+        rate_controller: Optional[AdaptiveRateController] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
     ):
         """Initialize the Google Weather API client."""
         self.config = config
+        self.rate_controller = rate_controller if rate_controller is not None else global_rate_controller
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else global_circuit_breakers
         self.timeout = timeout
         self.max_requests_per_day = max_requests_per_day
         self._request_count = 0
         self._last_reset = datetime.now()
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=max_retries,
-            backoff_factor=initial_retry_delay,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["GET"]
+        self.retry_policy = RetryPolicy(
+            max_attempts=max_retries + 1,
+            base_delay=initial_retry_delay,
+            max_delay=initial_retry_delay * 8,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.session = requests.Session()
         self.session.headers.update({
             "Accept": "application/json",
         })
@@ -68,19 +69,56 @@ class WeatherAPI:
             )
 
     def _make_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make a GET request under the retry policy and the current deadline."""
         self._check_rate_limit()
+        return self.retry_policy.call(
+            self._send_request,
+            endpoint,
+            params,
+            operation=f"weather {endpoint}",
+            exceptions=(WeatherAPIError,),
+        )
+
+    def _send_request(self, endpoint: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Send a single request attempt to the Weather API."""
+        rate_key = f"weather:{endpoint}"
+        breaker = self.circuit_breakers.get(rate_key)
+        if not breaker.allow_request():
+            raise WeatherAPIError(
+                message=f"Weather API unavailable: circuit breaker '{breaker.name}' is open",
+                status_code=None,
+                cause=breaker.open_error()
+            )
+        if not self.rate_controller.acquire(rate_key, wait=True, timeout=remaining_time()):
+            breaker.release()
+            raise WeatherAPIError(
+                message="Rate limit exceeded",
+                status_code=429
+            )
         url = f"https://weather.googleapis.com/v1/{endpoint}"
-        params = params or {}
+        params = dict(params or {})
         params["key"] = self.config.weather_api_key
         params["unitsSystem"] = "METRIC"
         try:
             logger.debug(f"Making request to {url} with params {params}")
-            response = self.session.get(
-                url,
-                params=params,
-                timeout=self.timeout
-            )
+            try:
+                response = self.session.get(
+                    url,
+                    params=params,
+                    timeout=attempt_timeout(self.timeout)
+                )
+            except requests.exceptions.RequestException:
+                breaker.record_failure()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+            if isinstance(response.status_code, int) and response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
             self._request_count += 1
+            self.rate_controller.record_response(rate_key, response.status_code, response.headers)
             try:
                 response.raise_for_status()
             except requests.exceptions.HTTPError as e:
@@ -90,9 +128,11 @@ class WeatherAPI:
                     error_msg = error_json.get("error", {}).get("message", str(e))
                 except Exception:
                     error_msg = str(e)
+                retry_after = self.rate_controller.retry_after(rate_key) if status_code == 429 else 0.0
                 raise WeatherAPIError(
                     message=error_msg,
-                    status_code=status_code
+                    status_code=status_code,
+                    details={"retry_after": retry_after} if retry_after > 0 else None
                 )
             data = response.json()
             if "error" in data:
@@ -9,21 +9,23 @@ utilities.
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from zoneinfo import ZoneInfo
 
 from pydantic import BaseModel, Field, field_validator, model_validator
 
+from src.core.models.event_index import EventIntervalIndex
+from src.core.models.quarantine import Quarantine
+from src.core.models.recurrence import occurrence_cache, parse_rule
 from src.utils.exceptions import ValidationError
 from src.utils.logging import get_logger
 from src.utils.timezone import (
     SYDNEY_TIMEZONE,
     DEFAULT_TIMEZONE,
     validate_timezone,
-    convert_to_timezone,
     is_dst_transition,
-    get_dst_transition_info,
     format_timezone_info,
+    dst_transition_index,
 )
 
 logger = get_logger(__name__)
@@ -71,6 +73,9 @@ class CalendarEvent(BaseModel):
     calendar_id: Optional[str] = Field(None, description="ID of the calendar containing this event")
     created_at: Optional[datetime] = Field(None, description="When the event was created")
     updated_at: Optional[datetime] = Field(None, description="When the event was last updated")
+    recurrence: Optional[str] = Field(
+        None, description="RRULE for a recurring series; start/end times are the first occurrence"
+    )
     
     # Metadata
     metadata: Dict[str, Any] = Field(default_factory=dict, description="Additional event metadata")
@@ -88,9 +93,9 @@ class CalendarEvent(BaseModel):
     @model_validator(mode="after")
     def validate_times(self) -> "CalendarEvent":
         """Validate event times and ensure end time is after start time."""
-        # Check for DST transitions
-        start_transition, start_dst = get_dst_transition_info(self.start_time, self.start_time.tzinfo)
-        end_transition, end_dst = get_dst_transition_info(self.end_time, self.end_time.tzinfo)
+        # Check for DST transitions (bisect over precomputed transition instants)
+        start_transition = dst_transition_index.is_near_transition(self.start_time)
+        end_transition = dst_transition_index.is_near_transition(self.end_time)
         
         if start_transition or end_transition:
             logger.warning(
@@ -119,17 +124,74 @@ class CalendarEvent(BaseModel):
             )
         return self
     
+    @model_validator(mode="after")
+    def validate_recurrence(self) -> "CalendarEvent":
+        """Make sure the recurrence rule parses."""
+        if self.recurrence:
+            parse_rule(self.recurrence, self.start_time)
+        return self
+    
+    @property
+    def is_recurring(self) -> bool:
+        """Whether the event is a recurring series."""
+        return bool(self.recurrence)
+    
+    def occurrences(self, start: datetime, end: datetime) -> Iterator["CalendarEvent"]:
+        """
+        Get the occurrences of this event that overlap [start, end).
+        
+        A recurring series is expanded only inside the window, through the
+        shared occurrence cache. Occurrences are unvalidated copies of the
+        series with ids of the form ``<series id>_<YYYYMMDDTHHMMSS>``.
+        
+        Args:
+            start: Window start
+            end: Window end (exclusive)
+            
+        Yields:
+            CalendarEvent: Occurrences in start-time order (the event itself
+                if it is not recurring and overlaps the window)
+        """
+        if not self.recurrence:
+            if self.start_time < end and self.end_time > start:
+                yield self
+            return
+        duration = self.end_time - self.start_time
+        for occurrence_start in occurrence_cache.starts(
+            self.recurrence, self.start_time, start, end, duration
+        ):
+            yield self.model_copy(update={
+                "id": f"{self.id}_{occurrence_start:%Y%m%dT%H%M%S}",
+                "start_time": occurrence_start,
+                "end_time": occurrence_start + duration,
+                "recurrence": None,
+                "metadata": {**self.metadata, "series_id": self.id},
+            })
+    
     def to_sydney_time(self) -> "CalendarEvent":
         """Convert event times to Sydney timezone."""
-        return CalendarEvent(
-            **{
-                **self.model_dump(),
-                "start_time": convert_to_timezone(self.start_time, SYDNEY_TIMEZONE),
-                "end_time": convert_to_timezone(self.end_time, SYDNEY_TIMEZONE),
-                "created_at": convert_to_timezone(self.created_at, SYDNEY_TIMEZONE) if self.created_at else None,
-                "updated_at": convert_to_timezone(self.updated_at, SYDNEY_TIMEZONE) if self.updated_at else None,
-            }
-        )
+        return self.to_timezone(SYDNEY_TIMEZONE)
+    
+    def to_timezone(self, timezone: ZoneInfo) -> "CalendarEvent":
+        """
+        Convert event times to a timezone.
+        
+        The event has already been validated and conversion keeps every instant
+        unchanged, so the copy skips validation. Returns this event itself if its
+        times are already in the target timezone.
+        
+        Args:
+            timezone: Target timezone
+            
+        Returns:
+            CalendarEvent: Event with times expressed in ``timezone``
+        """
+        update = {
+            name: value.astimezone(timezone)
+            for name in _EVENT_DATETIME_FIELDS
+            if (value := getattr(self, name)) is not None and value.tzinfo is not timezone
+        }
+        return self.model_copy(update=update) if update else self
     
     def get_timezone_info(self) -> Dict[str, Any]:
         """Get detailed timezone information for the event."""
@@ -172,39 +234,132 @@ class CalendarEvent(BaseModel):
         Raises:
             ValidationError: If the data is invalid
         """
+        if not isinstance(data, dict):
+            raise ValidationError(
+                message=f"Invalid event data: expected an object, got {type(data).__name__}",
+                details={"raw_data": data},
+            )
+        
+        field = "id"
         try:
             # Transform API data to match our model
+            event_id = data["id"]
+            field = "title"
+            title = data["title"]
+            field = "start_time"
+            start_time = datetime.fromisoformat(data["start"])
+            field = "end_time"
+            end_time = datetime.fromisoformat(data["end"])
+            field = "status"
             status_val = data.get("status", "confirmed")
             if isinstance(status_val, dict):
                 status_val = status_val.get("name", "confirmed")
+            status = EventStatus(status_val)
+            field = "type"
+            event_type = EventType(data.get("type", "meeting"))
+            field = "created_at"
+            created_at = datetime.fromisoformat(data["created_at"]) if "created_at" in data else None
+            field = "updated_at"
+            updated_at = datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else None
+            field = "recurrence"
+            recurrence = data.get("recurrence")
+            if isinstance(recurrence, list):
+                # Google-style list of RRULE/EXDATE lines
+                recurrence = "\n".join(recurrence)
+            field = None
             event_data = {
-                "id": data["id"],
-                "title": data["title"],
-                "start_time": datetime.fromisoformat(data["start"]),
-                "end_time": datetime.fromisoformat(data["end"]),
-                "status": EventStatus(status_val),
-                "type": EventType(data.get("type", "meeting")),
+                "id": event_id,
+                "title": title,
+                "start_time": start_time,
+                "end_time": end_time,
+                "status": status,
+                "type": event_type,
                 "description": data.get("description"),
                 "location": data.get("location"),
                 "attendees": data.get("attendees", []),
                 "calendar_id": data.get("calendar_id"),
-                "created_at": datetime.fromisoformat(data["created_at"]) if "created_at" in data else None,
-                "updated_at": datetime.fromisoformat(data["updated_at"]) if "updated_at" in data else None,
-                "metadata": {k: v for k, v in data.items() if k not in {
-                    "id", "title", "start", "end", "status", "type",
-                    "description", "location", "attendees", "calendar_id",
-                    "created_at", "updated_at",
-                }},
+                "created_at": created_at,
+                "updated_at": updated_at,
+                "recurrence": recurrence or None,
+                "metadata": {k: v for k, v in data.items() if k not in _EVENT_API_KEYS},
             }
             
             return cls(**event_data)
             
-        except (KeyError, ValueError) as e:
+        except (KeyError, TypeError, ValueError) as e:
             raise ValidationError(
                 message=f"Invalid event data: {str(e)}",
+                field=field,
                 details={"raw_data": data},
                 cause=e,
             )
+    
+    @classmethod
+    def bulk_from_api_data(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        quarantine: Optional[Quarantine] = None,
+    ) -> List["CalendarEvent"]:
+        """
+        Create CalendarEvent instances from a Motion API event list.
+        
+        Args:
+            items: Raw event data from Motion API (e.g. ``response["events"]``)
+            quarantine: Parse tolerantly: invalid items are recorded here and
+                skipped instead of failing the whole batch.
+            
+        Returns:
+            List[CalendarEvent]: Valid events in input order
+            
+        Raises:
+            ValidationError: If any item is invalid and no quarantine is given
+        """
+        if quarantine is None:
+            return [cls.from_api_data(data) for data in items]
+        
+        events = []
+        for data in items:
+            try:
+                events.append(cls.from_api_data(data))
+            except ValidationError as e:
+                quarantine.add("event", data, e)
+        return events
+
+
+# Datetime fields rewritten by timezone conversion
+_EVENT_DATETIME_FIELDS = ("start_time", "end_time", "created_at", "updated_at")
+
+# API keys mapped onto CalendarEvent fields; everything else is kept as metadata
+_EVENT_API_KEYS = frozenset({
+    "id", "title", "start", "end", "status", "type",
+    "description", "location", "attendees", "calendar_id",
+    "created_at", "updated_at", "recurrence",
+})
+
+
+class _EventList(list):
+    """List of events that counts its in-place changes."""
+    
+    version = 0
+
+
+def _counting(name: str):
+    """Wrap a mutating list method so it bumps the list's version."""
+    method = getattr(list, name)
+    
+    def mutate(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+    
+    mutate.__name__ = name
+    return mutate
+
+
+for _name in (
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+    "append", "extend", "insert", "pop", "remove", "clear", "sort", "reverse",
+):
+    setattr(_EventList, _name, _counting(_name))
 
 
 class CalendarEventCollection:
@@ -219,19 +374,66 @@ class CalendarEventCollection:
         """Initialize with a list of calendar events."""
         self.events = events
     
+    @property
+    def events(self) -> List[CalendarEvent]:
+        """The events, as a list that may be changed in place."""
+        return self._events
+    
+    @events.setter
+    def events(self, events: List[CalendarEvent]) -> None:
+        self._events = _EventList(events)
+        self._index: Optional[EventIntervalIndex] = None
+        self._index_version = 0
+    
+    def index(self) -> EventIntervalIndex:
+        """
+        Get the interval index over the events.
+        
+        The index is built on first use and rebuilt after ``events`` is
+        reassigned or changed in place; the list counts its own changes, so
+        checking for staleness is O(1).
+        """
+        if self._index is None or self._index_version != self._events.version:
+            self._index = EventIntervalIndex(self._events)
+            self._index_version = self._events.version
+        return self._index
+    
     def filter_by_date(self, date: datetime) -> "CalendarEventCollection":
         """Filter events to only those occurring on the specified date."""
         date_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
         date_end = date_start + timedelta(days=1)
         
-        filtered_events = [
-            event for event in self.events
-            if (date_start <= event.start_time < date_end)
-            or (date_start <= event.end_time < date_end)
-            or (event.start_time <= date_start and event.end_time >= date_end)
-        ]
+        # Events ending exactly at midnight also count for the day that follows
+        return CalendarEventCollection(self.index().events_in_range(date_start, date_end, inclusive=True))
+    
+    def events_in_range(self, start: datetime, end: datetime) -> "CalendarEventCollection":
+        """Get events overlapping the range [start, end)."""
+        return CalendarEventCollection(self.index().events_in_range(start, end))
+    
+    def overlapping(self, event: CalendarEvent) -> "CalendarEventCollection":
+        """Get the other events whose time overlaps ``event``."""
+        return CalendarEventCollection(self.index().overlapping(event))
+    
+    def expand_recurring(self, start: datetime, end: datetime) -> "CalendarEventCollection":
+        """
+        Replace recurring series with their occurrences overlapping [start, end).
         
-        return CalendarEventCollection(filtered_events)
+        Non-recurring events are kept as they are, so the result still holds
+        events outside the window; returns this collection if nothing recurs.
+        """
+        if not any(event.recurrence for event in self.events):
+            return self
+        expanded: List[CalendarEvent] = []
+        for event in self.events:
+            if event.recurrence:
+                expanded.extend(event.occurrences(start, end))
+            else:
+                expanded.append(event)
+        return CalendarEventCollection(expanded)
+    
+    def all_conflicts(self) -> List[Tuple[CalendarEvent, CalendarEvent]]:
+        """Get every pair of overlapping events, earlier event first."""
+        return self.index().all_conflicts()
     
     def filter_by_status(self, status: EventStatus) -> "CalendarEventCollection":
         """Filter events by status."""
@@ -270,10 +472,22 @@ class CalendarEventCollection:
     
     def to_sydney_time(self) -> "CalendarEventCollection":
         """Convert all events to Sydney timezone."""
-        return CalendarEventCollection([
-            event.to_sydney_time()
-            for event in self.events
-        ])
+        return self.to_timezone(SYDNEY_TIMEZONE)
+    
+    def to_timezone(self, timezone: ZoneInfo) -> "CalendarEventCollection":
+        """
+        Convert all events to a timezone in one pass.
+        
+        Events already in the target timezone are kept as-is; the others are
+        copied without re-running validation.
+        
+        Args:
+            timezone: Target timezone
+            
+        Returns:
+            CalendarEventCollection: Events with times expressed in ``timezone``
+        """
+        return CalendarEventCollection([event.to_timezone(timezone) for event in self.events])
     
     def __len__(self) -> int:
         return len(self.events)
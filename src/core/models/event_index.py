@@ -0,0 +1,175 @@
+"""
+Interval index for calendar event range and overlap queries.
+
+``EventIntervalIndex`` keeps events sorted by start time in an implicit
+balanced tree where every node also records the latest end time in its
+subtree. Range and overlap queries skip whole subtrees that start too late or
+end too early, so they run in O(log n + k) for k matches instead of scanning
+every event.
+
+    index = EventIntervalIndex(events)
+    index.events_in_range(week_start, week_end)
+    index.all_conflicts()
+
+Anything with a start and an end can be indexed by passing ``bounds``, e.g.
+weather alerts keyed by the dates they cover. ``conflicting_pairs`` runs the
+overlap sweep on its own, for callers that already hold events sorted by start.
+"""
+
+from datetime import datetime
+from heapq import heappop, heappush
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from src.core.models.calendar import CalendarEvent
+
+
+T = TypeVar("T")
+
+
+def _event_bounds(event: "CalendarEvent") -> Tuple[datetime, datetime]:
+    return event.start_time, event.end_time
+
+
+def conflicting_pairs(
+    items: Iterable[T],
+    bounds: Optional[Callable[[T], Tuple[Any, Any]]] = None,
+) -> Iterator[Tuple[T, T]]:
+    """
+    Yield every pair of overlapping items.
+
+    Sweeps over start times with a heap of the end times still running, so it
+    runs in O(n log n + k) for k conflicting pairs.
+
+    Args:
+        items: Items sorted by start time
+        bounds: Maps an item to its (start, end); defaults to the event's
+            start and end times
+
+    Yields:
+        Tuple: (earlier, later) pairs, ordered by the later item and then by the
+            earlier item's position
+    """
+    bounds = bounds or _event_bounds
+    active: List[Tuple[Any, int, T]] = []
+    for position, item in enumerate(items):
+        start, end = bounds(item)
+        while active and active[0][0] <= start:
+            heappop(active)
+        for _, _, earlier in sorted(active, key=lambda entry: entry[1]):
+            yield earlier, item
+        heappush(active, (end, position, item))
+
+
+class EventIntervalIndex:
+    """
+    Immutable interval index over calendar events.
+
+    The index is a snapshot: build a new one when the events change. Query
+    results are returned in the order the events were given.
+    """
+
+    __slots__ = ("events", "_bounds", "_order", "_starts", "_ends", "_max_end")
+
+    def __init__(
+        self,
+        events: Sequence["CalendarEvent"],
+        bounds: Optional[Callable[[Any], Tuple[Any, Any]]] = None,
+    ):
+        """
+        Build the index.
+
+        Args:
+            events: Events to index (times must be timezone-aware)
+            bounds: Maps an item to its (start, end); defaults to the event's
+                start and end times
+        """
+        self.events: Tuple["CalendarEvent", ...] = tuple(events)
+        self._bounds = bounds or _event_bounds
+        spans = [self._bounds(event) for event in self.events]
+        self._order = sorted(range(len(spans)), key=lambda p: spans[p][0])
+        self._starts = [spans[p][0] for p in self._order]
+        self._ends = [spans[p][1] for p in self._order]
+        # Node ``mid`` of range [lo, hi) holds the latest end time in that range
+        self._max_end = list(self._ends)
+        self._augment(0, len(self._order))
+
+    def _augment(self, lo: int, hi: int) -> Any:
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        latest = self._max_end[mid]
+        for child in (self._augment(lo, mid), self._augment(mid + 1, hi)):
+            if child is not None and child > latest:
+                latest = child
+        self._max_end[mid] = latest
+        return latest
+
+    def __len__(self) -> int:
+        """Get number of indexed events."""
+        return len(self.events)
+
+    def _search(self, start: Any, end: Any, inclusive: bool) -> List[int]:
+        """Positions of events with start_time < end and end_time > start (>= if inclusive)."""
+        starts, ends, max_end = self._starts, self._ends, self._max_end
+        found = []
+        stack = [(0, len(starts))]
+        while stack:
+            lo, hi = stack.pop()
+            if lo >= hi or starts[lo] >= end:
+                continue
+            mid = (lo + hi) // 2
+            latest = max_end[mid]
+            if latest < start or (latest == start and not inclusive):
+                continue
+            if starts[mid] < end and (ends[mid] > start or (inclusive and ends[mid] == start)):
+                found.append(self._order[mid])
+            stack.append((lo, mid))
+            stack.append((mid + 1, hi))
+        found.sort()
+        return found
+
+    def events_in_range(self, start: Any, end: Any, inclusive: bool = False) -> List["CalendarEvent"]:
+        """
+        Get events overlapping the range [start, end).
+
+        Args:
+            start: Range start
+            end: Range end (exclusive)
+            inclusive: Also include events ending exactly at ``start``
+
+        Returns:
+            List[CalendarEvent]: Matching events
+        """
+        events = self.events
+        return [events[p] for p in self._search(start, end, inclusive)]
+
+    def overlapping(self, event: "CalendarEvent") -> List["CalendarEvent"]:
+        """Get the other events whose time overlaps ``event``."""
+        start, end = self._bounds(event)
+        return [e for e in self.events_in_range(start, end) if e is not event]
+
+    def all_conflicts(self) -> List[Tuple["CalendarEvent", "CalendarEvent"]]:
+        """
+        Get every pair of overlapping events.
+
+        See ``conflicting_pairs``; the index already holds the events in
+        start order, so this runs in O(n log n + k) for k conflicting pairs.
+
+        Returns:
+            List[Tuple[CalendarEvent, CalendarEvent]]: Pairs ordered by the
+                later event's start time; the earlier event comes first
+        """
+        events = self.events
+        return list(conflicting_pairs((events[p] for p in self._order), self._bounds))
@@ -0,0 +1,153 @@
+"""
+Bounded quarantine for records rejected during tolerant ingestion.
+
+When a batch from the Motion API is parsed tolerantly, valid records are kept
+and each invalid one is reduced to a small ``QuarantinedRecord``: a fingerprint
+of the raw payload, its id and the field that failed. The raw payload itself is
+never retained, so a bad upstream batch cannot pin large amounts of memory.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import Counter, deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, List, Optional
+
+from pydantic import ValidationError as PydanticValidationError
+
+from src.utils.exceptions import DailyDigestError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class QuarantinedRecord:
+    """Compact description of a record that failed to parse."""
+    kind: str
+    record_id: Optional[str]
+    field: Optional[str]
+    fingerprint: str
+
+
+def fingerprint(data: Any) -> str:
+    """Stable short hash of a raw record, for spotting repeat offenders."""
+    try:
+        encoded = json.dumps(data, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        encoded = repr(data)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()[:16]
+
+
+def failing_field(error: BaseException) -> Optional[str]:
+    """
+    Work out which field made a record fail to parse.
+
+    Understands application ValidationErrors (``details["field"]``), pydantic
+    validation errors (first error location) and missing keys.
+    """
+    seen = 0
+    while error is not None and seen < 3:
+        if isinstance(error, DailyDigestError):
+            field = error.details.get("field")
+            if field:
+                return str(field)
+            error = error.cause
+        elif isinstance(error, PydanticValidationError):
+            errors = error.errors()
+            loc = [str(part) for part in errors[0]["loc"]] if errors else []
+            return ".".join(loc) or None
+        elif isinstance(error, KeyError):
+            return str(error.args[0]) if error.args else None
+        else:
+            return None
+        seen += 1
+    return None
+
+
+class Quarantine:
+    """
+    Thread-safe, bounded store of rejected records.
+
+    Only the most recent ``max_records`` entries are kept; counts cover every
+    record ever quarantined.
+    """
+
+    def __init__(self, max_records: int = 100):
+        """
+        Initialize the quarantine.
+
+        Args:
+            max_records: Maximum number of quarantined records retained
+        """
+        self.max_records = max_records
+        self._records: Deque[QuarantinedRecord] = deque(maxlen=max_records)
+        self._counts: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls, prefix: str = "MOTION_QUARANTINE_") -> Optional["Quarantine"]:
+        """
+        Create a quarantine from environment variables, or None if tolerant
+        ingestion is disabled.
+
+        Recognized variables (with the given prefix): ENABLED and MAX_RECORDS.
+        """
+        if os.getenv(f"{prefix}ENABLED", "false").lower() != "true":
+            return None
+        return cls(max_records=int(os.getenv(f"{prefix}MAX_RECORDS", "100")))
+
+    def add(self, kind: str, data: Any, error: BaseException) -> QuarantinedRecord:
+        """
+        Quarantine a record that failed to parse.
+
+        Args:
+            kind: Record type, e.g. "task" or "event"
+            data: Raw record (only its fingerprint and id are kept)
+            error: The parse error
+
+        Returns:
+            QuarantinedRecord: The stored entry
+        """
+        record_id = data.get("id") if isinstance(data, dict) else None
+        record = QuarantinedRecord(
+            kind=kind,
+            record_id=str(record_id) if record_id is not None else None,
+            field=failing_field(error),
+            fingerprint=fingerprint(data),
+        )
+        with self._lock:
+            self._records.append(record)
+            self._counts[kind] += 1
+        logger.warning(
+            "record_quarantined",
+            kind=kind,
+            record_id=record.record_id,
+            field=record.field,
+            fingerprint=record.fingerprint,
+        )
+        return record
+
+    def records(self) -> List[QuarantinedRecord]:
+        """Get the retained records, oldest first."""
+        with self._lock:
+            return list(self._records)
+
+    def stats(self) -> Dict[str, Any]:
+        """Get quarantine counts."""
+        with self._lock:
+            total = sum(self._counts.values())
+            return {
+                "quarantined": total,
+                "retained": len(self._records),
+                "dropped": total - len(self._records),
+                "by_kind": dict(self._counts),
+            }
+
+    def clear(self) -> None:
+        """Forget all quarantined records and counts."""
+        with self._lock:
+            self._records.clear()
+            self._counts.clear()
@@ -0,0 +1,193 @@
+"""
+RRULE recurrence expansion for calendar events.
+
+A recurring event is stored once, as a series with an RFC 5545 rule
+(``FREQ=WEEKLY;BYDAY=MO``, optionally with ``EXDATE``/``RDATE`` lines).
+Occurrences are only generated for the window being queried, and the start
+times found for each (rule, series start, window) are kept in a bounded LRU
+cache so repeated digest runs over the same window do no rule arithmetic.
+"""
+
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone, tzinfo
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from dateutil.rrule import rrule, rruleset, rrulestr
+
+from src.utils.exceptions import ValidationError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Aware datetimes compare by instant, so keys also carry the series timezone
+OccurrenceKey = Tuple[str, datetime, Any, datetime, datetime]
+
+# Slack when mapping window bounds to wall-clock time around DST changes
+_DST_SLACK = timedelta(hours=3)
+
+# Date-time format of EXDATE/RDATE values
+_ICAL_DATETIME = "%Y%m%dT%H%M%S"
+
+
+def parse_rule(rule: str, dtstart: datetime) -> Union[rrule, rruleset]:
+    """
+    Parse a recurrence rule anchored at a series start.
+
+    Rules are expanded in the series' local wall-clock time, so a 9am meeting
+    stays at 9am across DST changes. Floating ``EXDATE``/``RDATE`` values are
+    read as wall-clock times in that timezone too; UTC (``...Z``) and ``TZID``
+    values are converted into it first.
+
+    Args:
+        rule: RRULE text, with or without the ``RRULE:`` prefix
+        dtstart: Start of the first occurrence
+
+    Returns:
+        The parsed rule, producing naive wall-clock datetimes
+
+    Raises:
+        ValidationError: If the rule cannot be parsed
+    """
+    return _parse_rule(rule, dtstart.replace(tzinfo=None), dtstart.tzinfo)
+
+
+@lru_cache(maxsize=512)
+def _parse_rule(
+    rule: str, wall_start: datetime, tz: Optional[tzinfo]
+) -> Union[rrule, rruleset]:
+    try:
+        rule = "\n".join(_localize_dates(line, tz) for line in rule.splitlines())
+        return rrulestr(rule, dtstart=wall_start, forceset=True, ignoretz=True)
+    except (KeyError, ValueError, TypeError) as e:
+        raise ValidationError(
+            message=f"Invalid recurrence rule: {rule!r}",
+            field="recurrence",
+            cause=e,
+        )
+
+
+def _localize_dates(line: str, tz: Optional[tzinfo]) -> str:
+    """
+    Rewrite timezone-aware EXDATE/RDATE values as wall-clock times in ``tz``.
+
+    Other lines, all-day dates and floating values are returned unchanged.
+    """
+    name, sep, values = line.partition(":")
+    params = name.split(";")
+    if not sep or params[0].strip().upper() not in ("EXDATE", "RDATE") or tz is None:
+        return line
+    source = None
+    for param in params[1:]:
+        key, _, value = param.partition("=")
+        if key.upper() == "TZID":
+            source = ZoneInfo(value.strip('"'))
+            params.remove(param)
+            break
+    localized = []
+    for value in values.split(","):
+        value_tz = timezone.utc if value.upper().endswith("Z") else source
+        if value_tz is not None and "T" in value.upper():
+            naive = datetime.strptime(value.rstrip("Zz"), _ICAL_DATETIME)
+            value = naive.replace(tzinfo=value_tz).astimezone(tz).strftime(_ICAL_DATETIME)
+        localized.append(value)
+    return f"{';'.join(params)}:{','.join(localized)}"
+
+
+def iter_starts(
+    rule: str,
+    dtstart: datetime,
+    start: datetime,
+    end: datetime,
+    duration: timedelta = timedelta(0),
+) -> Iterator[datetime]:
+    """
+    Lazily generate the start times of occurrences overlapping [start, end).
+
+    Args:
+        rule: RRULE text
+        dtstart: Start of the first occurrence
+        start: Window start
+        end: Window end (exclusive)
+        duration: Length of each occurrence
+
+    Yields:
+        datetime: Occurrence start times in ``dtstart``'s timezone, in order
+    """
+    tz = dtstart.tzinfo
+    after = start - duration
+    wall_after = (after.astimezone(tz) if tz else after).replace(tzinfo=None) - _DST_SLACK
+    for wall in parse_rule(rule, dtstart).xafter(wall_after, inc=False):
+        occurrence = wall.replace(tzinfo=tz)
+        if occurrence >= end:
+            return
+        # Zero-length occurrences at the window start count as inside it
+        if occurrence > after or occurrence >= start:
+            yield occurrence
+
+
+class OccurrenceCache:
+    """Thread-safe LRU cache of occurrence start times per (rule, series start, window)."""
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached windows
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[OccurrenceKey, Tuple[datetime, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def starts(
+        self,
+        rule: str,
+        dtstart: datetime,
+        start: datetime,
+        end: datetime,
+        duration: timedelta = timedelta(0),
+    ) -> Tuple[datetime, ...]:
+        """
+        Get the start times of occurrences overlapping [start, end), expanding
+        the rule only on a cache miss.
+        """
+        key = (rule, dtstart, dtstart.tzinfo, start - duration, end)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached
+            self._misses += 1
+        starts = tuple(iter_starts(rule, dtstart, start, end, duration))
+        with self._lock:
+            self._entries[key] = starts
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return starts
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+    def clear(self) -> None:
+        """Drop all cached expansions."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Shared cache used by CalendarEvent.occurrences
+occurrence_cache = OccurrenceCache()
@@ -2,9 +2,12 @@
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+from src.core.models.quarantine import Quarantine
 from src.utils.exceptions import ValidationError
 
 
@@ -67,57 +70,202 @@ class Task(BaseModel):
             ValidationError: If the data is invalid
         """
         try:
-            # Validate required fields
-            if "name" not in data:
-                raise ValidationError(
-                    message="Task name is required",
-                    details={"raw_data": data},
-                )
-
-            # Transform API data to match our model
-            status_value = data.get("status")
-            if isinstance(status_value, dict):
-                status_value = status_value.get("name", "todo")
-            if isinstance(status_value, str):
-                status_value = status_value.lower()
-
-            def parse_datetime_aware(dt_str):
-                if isinstance(dt_str, str):
-                    if dt_str.endswith('Z'):
-                        return datetime.fromisoformat(dt_str.replace('Z', '+00:00'))
-                    return datetime.fromisoformat(dt_str)
-                return None
-
-            task_data = {
-                "id": data["id"],
-                "name": data["name"],
-                "status": TaskStatus(status_value),
-                "description": data.get("description"),
-                "priority": TaskPriority(data["priority"].lower()) if "priority" in data else None,
-                "due_date": parse_datetime_aware(data["due_date"]) if "due_date" in data else None,
-                "scheduled_start": parse_datetime_aware(data["scheduledStart"]) if "scheduledStart" in data else None,
-                "scheduled_end": parse_datetime_aware(data["scheduledEnd"]) if "scheduledEnd" in data else None,
-                "project_id": data.get("project_id"),
-                "assignee_id": data.get("assignee_id"),
-                "created_at": parse_datetime_aware(data["created_at"]) if "created_at" in data else None,
-                "updated_at": parse_datetime_aware(data["updated_at"]) if "updated_at" in data else None,
-                "completed_at": parse_datetime_aware(data["completed_at"]) if "completed_at" in data else None,
-                "tags": data.get("tags", []),
-                "metadata": {k: v for k, v in data.items() if k not in {
-                    "id", "name", "status", "description", "priority",
-                    "due_date", "scheduledStart", "scheduledEnd", "project_id", "assignee_id",
-                    "created_at", "updated_at", "completed_at", "tags",
-                }},
-            }
-            
-            return cls(**task_data)
-            
-        except (KeyError, ValueError) as e:
+            return cls(**_api_data_to_fields(data))
+        except (KeyError, TypeError, ValueError) as e:
             raise ValidationError(
                 message=f"Invalid task data: {str(e)}",
                 details={"raw_data": data},
                 cause=e,
             )
+    
+    @classmethod
+    def construct_trusted(cls, **fields: Any) -> "Task":
+        """
+        Build a Task from field values that are already validated and typed.
+        
+        Skips validation and, unlike ``model_construct``, default and alias
+        resolution, so every field must be given. All fields count as set.
+        """
+        task = cls.__new__(cls)
+        object.__setattr__(task, "__dict__", fields)
+        # Each instance needs its own set: pydantic adds to it on assignment
+        object.__setattr__(task, "__pydantic_fields_set__", set(_TASK_FIELD_NAMES))
+        object.__setattr__(task, "__pydantic_extra__", None)
+        object.__setattr__(task, "__pydantic_private__", None)
+        return task
+    
+    @classmethod
+    def bulk_from_api_data(
+        cls,
+        items: Iterable[Dict[str, Any]],
+        trusted: bool = False,
+        quarantine: Optional[Quarantine] = None,
+    ) -> List["Task"]:
+        """
+        Create Task instances from a whole Motion API task list in one pass.
+        
+        Produces the same tasks as calling ``from_api_data`` on each item, but
+        validates the batch with a single precompiled validator.
+        
+        Args:
+            items: Raw task data from Motion API (e.g. ``response["tasks"]``)
+            trusted: Skip pydantic validation and build models with
+                ``construct_trusted``. Only for payloads known to be well-formed,
+                such as data this application wrote itself.
+            quarantine: Parse tolerantly: invalid items are recorded here and
+                skipped instead of failing the whole batch.
+            
+        Returns:
+            List[Task]: Valid tasks in input order
+            
+        Raises:
+            ValidationError: If any item is invalid and no quarantine is given
+                (details carry its index)
+        """
+        items = items if isinstance(items, list) else list(items)
+        fields: List[Dict[str, Any]] = []
+        positions: List[int] = []
+        for index, data in enumerate(items):
+            try:
+                fields.append(_api_data_to_fields(data))
+            except ValidationError as e:
+                if quarantine is None:
+                    e.details["index"] = index
+                    raise
+                quarantine.add("task", data, e)
+                continue
+            positions.append(index)
+        
+        if trusted:
+            return [cls.construct_trusted(**f) for f in fields]
+        
+        try:
+            return _task_list_adapter().validate_python(fields)
+        except PydanticValidationError as e:
+            if quarantine is None:
+                index = positions[e.errors()[0]["loc"][0]]
+                raise ValidationError(
+                    message=f"Invalid task data: {str(e)}",
+                    details={"index": index, "raw_data": items[index]},
+                    cause=e,
+                )
+        
+        # Tolerant mode with a bad item in the batch: validate item by item
+        tasks = []
+        for f, index in zip(fields, positions):
+            try:
+                tasks.append(cls(**f))
+            except PydanticValidationError as e:
+                quarantine.add("task", items[index], e)
+        return tasks
+
+
+# API keys mapped onto Task fields; everything else is kept as metadata
+_API_FIELD_KEYS = frozenset({
+    "id", "name", "status", "description", "priority",
+    "due_date", "scheduledStart", "scheduledEnd", "project_id", "assignee_id",
+    "created_at", "updated_at", "completed_at", "tags",
+})
+_STATUS_BY_VALUE = {status.value: status for status in TaskStatus}
+_PRIORITY_BY_VALUE = {priority.value: priority for priority in TaskPriority}
+_TASK_FIELD_NAMES = frozenset(Task.model_fields)
+# (Task field, API key) pairs holding ISO 8601 timestamps
+_DATETIME_KEYS = (
+    ("due_date", "due_date"),
+    ("scheduled_start", "scheduledStart"),
+    ("scheduled_end", "scheduledEnd"),
+    ("created_at", "created_at"),
+    ("updated_at", "updated_at"),
+    ("completed_at", "completed_at"),
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_api_datetime(value: str) -> datetime:
+    """Parse an ISO 8601 timestamp from the API (cached: payloads repeat timestamps a lot)."""
+    if value.endswith('Z'):
+        return datetime.fromisoformat(value[:-1] + '+00:00')
+    return datetime.fromisoformat(value)
+
+
+def _optional_datetime(data: Dict[str, Any], key: str) -> Optional[datetime]:
+    value = data.get(key)
+    return _parse_api_datetime(value) if isinstance(value, str) else None
+
+
+def _api_data_to_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Transform raw Motion API task data into Task field values.
+    
+    Raises:
+        ValidationError: If a field is missing or malformed (``field`` names it)
+    """
+    if not isinstance(data, dict):
+        raise ValidationError(
+            message=f"Invalid task data: expected an object, got {type(data).__name__}",
+            details={"raw_data": data},
+        )
+    
+    if "name" not in data:
+        raise ValidationError(
+            message="Task name is required",
+            field="name",
+            details={"raw_data": data},
+        )
+    
+    field = "id"
+    try:
+        task_id = data["id"]
+        
+        field = "status"
+        status_value = data.get("status")
+        if isinstance(status_value, dict):
+            status_value = status_value.get("name", "todo")
+        if isinstance(status_value, str):
+            status_value = status_value.lower()
+        status = _STATUS_BY_VALUE.get(status_value) if isinstance(status_value, str) else None
+        status = status or TaskStatus(status_value)
+        
+        field = "priority"
+        priority = None
+        if "priority" in data:
+            priority_value = data["priority"].lower()
+            priority = _PRIORITY_BY_VALUE.get(priority_value) or TaskPriority(priority_value)
+        
+        dates = {}
+        for field, key in _DATETIME_KEYS:
+            dates[field] = _optional_datetime(data, key)
+    except (AttributeError, KeyError, TypeError, ValueError) as e:
+        raise ValidationError(
+            message=f"Invalid task data: {str(e)}",
+            field=field,
+            details={"raw_data": data},
+            cause=e,
+        )
+    
+    return {
+        "id": task_id,
+        "name": data["name"],
+        "status": status,
+        "description": data.get("description"),
+        "priority": priority,
+        "due_date": dates["due_date"],
+        "scheduled_start": dates["scheduled_start"],
+        "scheduled_end": dates["scheduled_end"],
+        "project_id": data.get("project_id"),
+        "assignee_id": data.get("assignee_id"),
+        "created_at": dates["created_at"],
+        "updated_at": dates["updated_at"],
+        "completed_at": dates["completed_at"],
+        "tags": data.get("tags", []),
+        "metadata": {k: v for k, v in data.items() if k not in _API_FIELD_KEYS},
+    }
+
+
+@lru_cache(maxsize=None)
+def _task_list_adapter() -> TypeAdapter:
+    """Validator for a list of tasks, built once on first use."""
+    return TypeAdapter(List[Task])
 
 
 class TaskCollection(BaseModel):
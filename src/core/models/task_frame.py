@@ -0,0 +1,299 @@
+"""
+Columnar, array-backed storage for large task sets.
+
+``TaskFrame`` keeps tasks as a struct of arrays instead of a list of pydantic
+models: enums are one-byte codes, datetimes are int64 epoch microseconds plus a
+UTC offset, and project/assignee ids are interned into small string tables.
+Filters return lightweight views (an array of row indices over the shared
+columns) instead of copying tasks, so repeated filtering of 100k+ tasks stays
+cheap in both time and memory.
+"""
+
+import sys
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from itertools import compress
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from src.core.models.task import Task, TaskCollection, TaskPriority, TaskStatus
+
+# Sentinels for missing values
+_NO_CODE = 0
+_NO_STRING = -1
+_NO_TIME = -(2 ** 63)
+_NAIVE = -(2 ** 15)
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+# Enum members by code; code 0 is reserved for "no value"
+_STATUSES: Tuple[Optional[TaskStatus], ...] = (None, *TaskStatus)
+_PRIORITIES: Tuple[Optional[TaskPriority], ...] = (None, *TaskPriority)
+_STATUS_CODES = {status: code for code, status in enumerate(_STATUSES) if status is not None}
+_PRIORITY_CODES = {priority: code for code, priority in enumerate(_PRIORITIES) if priority is not None}
+
+# bytes.translate tables mapping one code to 1 and every other byte to 0
+_MATCH_TABLES = [
+    bytes(int(i == code) for i in range(256))
+    for code in range(max(len(_STATUSES), len(_PRIORITIES)))
+]
+
+_DATETIME_FIELDS = (
+    "due_date", "scheduled_start", "scheduled_end",
+    "created_at", "updated_at", "completed_at",
+)
+
+
+class _StringPool:
+    """Interns strings to small integer codes."""
+
+    __slots__ = ("codes", "values")
+
+    def __init__(self) -> None:
+        self.codes: Dict[str, int] = {}
+        self.values: List[str] = []
+
+    def encode(self, value: Optional[str]) -> int:
+        if value is None:
+            return _NO_STRING
+        code = self.codes.get(value)
+        if code is None:
+            code = len(self.values)
+            self.codes[value] = code
+            self.values.append(sys.intern(value))
+        return code
+
+    def decode(self, code: int) -> Optional[str]:
+        return None if code == _NO_STRING else self.values[code]
+
+
+class _DateTimeColumn:
+    """Datetimes as epoch microseconds plus UTC offset minutes."""
+
+    __slots__ = ("micros", "offsets")
+
+    def __init__(self) -> None:
+        self.micros = array("q")
+        self.offsets = array("h")
+
+    def append(self, value: Optional[datetime]) -> None:
+        if value is None:
+            self.micros.append(_NO_TIME)
+            self.offsets.append(0)
+        elif value.tzinfo is None:
+            self.micros.append((value.replace(tzinfo=timezone.utc) - _EPOCH) // _MICROSECOND)
+            self.offsets.append(_NAIVE)
+        else:
+            offset = value.utcoffset() or timedelta(0)
+            self.micros.append((value - _EPOCH) // _MICROSECOND)
+            self.offsets.append(offset // timedelta(minutes=1))
+
+    def get(self, row: int) -> Optional[datetime]:
+        micros = self.micros[row]
+        if micros == _NO_TIME:
+            return None
+        value = _EPOCH + timedelta(microseconds=micros)
+        offset = self.offsets[row]
+        if offset == _NAIVE:
+            return value.replace(tzinfo=None)
+        if offset == 0:
+            return value
+        return value.astimezone(timezone(timedelta(minutes=offset)))
+
+    def local_days(self) -> Iterator[int]:
+        """Day number (days since the epoch) of each value in its own offset."""
+        day = 86_400_000_000
+        for micros, offset in zip(self.micros, self.offsets):
+            if micros == _NO_TIME:
+                yield _NO_TIME
+            else:
+                yield (micros + (0 if offset == _NAIVE else offset * 60_000_000)) // day
+
+
+class _Columns:
+    """Column storage shared by a frame and all of its views."""
+
+    __slots__ = (
+        "ids", "names", "descriptions", "status", "priority",
+        "project", "assignee", "projects", "assignees",
+        "datetimes", "tags", "metadata", "_scheduled_days",
+    )
+
+    def __init__(self) -> None:
+        self.ids: List[str] = []
+        self.names: List[str] = []
+        self.descriptions: List[Optional[str]] = []
+        self.status = bytearray()
+        self.priority = bytearray()
+        self.projects = _StringPool()
+        self.assignees = _StringPool()
+        self.project = array("i")
+        self.assignee = array("i")
+        self.datetimes = {name: _DateTimeColumn() for name in _DATETIME_FIELDS}
+        # Tags and metadata are usually empty; store None rather than empty containers
+        self.tags: List[Optional[List[str]]] = []
+        self.metadata: List[Optional[Dict[str, Any]]] = []
+        self._scheduled_days: Optional[array] = None
+
+    def scheduled_days(self) -> array:
+        """Local scheduled-start day numbers, computed once per append batch."""
+        if self._scheduled_days is None:
+            self._scheduled_days = array("q", self.datetimes["scheduled_start"].local_days())
+        return self._scheduled_days
+
+    def append(self, task: Task) -> None:
+        self.ids.append(sys.intern(task.id))
+        self.names.append(task.name)
+        self.descriptions.append(task.description)
+        self.status.append(_STATUS_CODES[task.status])
+        self.priority.append(_PRIORITY_CODES[task.priority] if task.priority is not None else _NO_CODE)
+        self.project.append(self.projects.encode(task.project_id))
+        self.assignee.append(self.assignees.encode(task.assignee_id))
+        for name, column in self.datetimes.items():
+            column.append(getattr(task, name))
+        self.tags.append(list(task.tags) if task.tags else None)
+        self.metadata.append(dict(task.metadata) if task.metadata else None)
+        self._scheduled_days = None
+
+    def task(self, row: int) -> Task:
+        status = _STATUSES[self.status[row]]
+        fields = {
+            "id": self.ids[row],
+            "name": self.names[row],
+            "status": status,
+            "description": self.descriptions[row],
+            "priority": _PRIORITIES[self.priority[row]],
+            "due_date": self.datetimes["due_date"].get(row),
+            "scheduled_start": self.datetimes["scheduled_start"].get(row),
+            "scheduled_end": self.datetimes["scheduled_end"].get(row),
+            "project_id": self.projects.decode(self.project[row]),
+            "assignee_id": self.assignees.decode(self.assignee[row]),
+            "created_at": self.datetimes["created_at"].get(row),
+            "updated_at": self.datetimes["updated_at"].get(row),
+            "completed_at": self.datetimes["completed_at"].get(row),
+            "tags": list(self.tags[row] or ()),
+            "metadata": dict(self.metadata[row] or {}),
+        }
+        return Task.construct_trusted(**fields)
+
+
+class TaskFrame:
+    """
+    Columnar collection of tasks with index-view filters.
+
+    Build one with ``TaskFrame.from_tasks`` or ``TaskFrame.from_collection``.
+    Filters return new frames that share the column storage and only hold the
+    selected row indices; materialize tasks with iteration, indexing or
+    ``to_collection()``.
+
+    Datetimes keep their instant and UTC offset (named time zones come back as
+    fixed offsets). The frame is append-only through ``append``; views are
+    snapshots of the rows that existed when they were created.
+    """
+
+    __slots__ = ("_columns", "_rows")
+
+    def __init__(self, tasks: Iterable[Task] = ()):
+        """
+        Initialize the frame.
+
+        Args:
+            tasks: Tasks to store
+        """
+        self._columns = _Columns()
+        self._rows: Optional[array] = None
+        for task in tasks:
+            self._columns.append(task)
+
+    @classmethod
+    def from_tasks(cls, tasks: Iterable[Task]) -> "TaskFrame":
+        """Build a frame from tasks."""
+        return cls(tasks)
+
+    @classmethod
+    def from_collection(cls, collection: TaskCollection) -> "TaskFrame":
+        """Build a frame from a TaskCollection."""
+        return cls(collection.tasks)
+
+    def _view(self, rows: Iterable[int]) -> "TaskFrame":
+        view = TaskFrame.__new__(TaskFrame)
+        view._columns = self._columns
+        view._rows = array("l", rows)
+        return view
+
+    @property
+    def rows(self) -> Sequence[int]:
+        """Indices of this frame's rows in the underlying column storage."""
+        return range(len(self._columns.ids)) if self._rows is None else self._rows
+
+    def append(self, task: Task) -> None:
+        """
+        Add a task to a base frame.
+
+        Raises:
+            TypeError: If called on a filtered view
+        """
+        if self._rows is not None:
+            raise TypeError("Cannot append to a TaskFrame view")
+        self._columns.append(task)
+
+    def __len__(self) -> int:
+        """Get number of tasks."""
+        return len(self._columns.ids) if self._rows is None else len(self._rows)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks, materializing each one."""
+        task = self._columns.task
+        return (task(row) for row in self.rows)
+
+    def __getitem__(self, index: int) -> Task:
+        """Get task by position."""
+        return self._columns.task(self.rows[index])
+
+    @property
+    def ids(self) -> List[str]:
+        """Task ids in frame order."""
+        ids = self._columns.ids
+        return ids[:] if self._rows is None else [ids[row] for row in self._rows]
+
+    def _where(self, column: Sequence[int], code: int) -> "TaskFrame":
+        """Select rows whose column value equals ``code`` (C-level loops only)."""
+        if self._rows is None:
+            if isinstance(column, bytearray):
+                # One-byte codes: translate matches to 1 and everything else to 0
+                return self._view(compress(range(len(column)), column.translate(_MATCH_TABLES[code])))
+            return self._view(compress(range(len(column)), map(code.__eq__, column)))
+        rows = self._rows
+        return self._view(compress(rows, map(code.__eq__, map(column.__getitem__, rows))))
+
+    def filter_by_status(self, status: TaskStatus) -> "TaskFrame":
+        """Filter tasks by status."""
+        return self._where(self._columns.status, _STATUS_CODES[TaskStatus(status)])
+
+    def filter_by_priority(self, priority: TaskPriority) -> "TaskFrame":
+        """Filter tasks by priority."""
+        return self._where(self._columns.priority, _PRIORITY_CODES[TaskPriority(priority)])
+
+    def filter_by_project(self, project_id: str) -> "TaskFrame":
+        """Filter tasks by project ID."""
+        code = self._columns.projects.codes.get(project_id)
+        return self._view(()) if code is None else self._where(self._columns.project, code)
+
+    def filter_by_assignee(self, assignee_id: str) -> "TaskFrame":
+        """Filter tasks by assignee ID."""
+        code = self._columns.assignees.codes.get(assignee_id)
+        return self._view(()) if code is None else self._where(self._columns.assignee, code)
+
+    def filter_by_scheduled_date(self, day: Union[date, datetime]) -> "TaskFrame":
+        """
+        Filter tasks scheduled to start on a date.
+
+        Like ``TaskCollection.filter_by_scheduled_date``, the date is compared in
+        each task's own UTC offset.
+        """
+        target = (day.date() if isinstance(day, datetime) else day) - _EPOCH.date()
+        return self._where(self._columns.scheduled_days(), target.days)
+
+    def to_collection(self) -> TaskCollection:
+        """Materialize the frame as a TaskCollection."""
+        return TaskCollection(tasks=list(self))
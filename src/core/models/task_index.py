@@ -0,0 +1,290 @@
+"""
+Indexed task collection with a lazy, fused query builder.
+
+``IndexedTaskCollection`` is built once per task set (e.g. per workspace) and
+keeps hash indexes on status, priority, project and assignee plus sorted
+indexes on scheduled start and due date. Queries are built lazily with the same
+method names as ``TaskCollection`` and run as a single pass: the most selective
+index supplies the candidate rows and every other condition is checked inline,
+so no intermediate collections are allocated.
+
+    indexed = IndexedTaskCollection.from_collection(tasks)
+    todo = (
+        indexed.query()
+        .filter_by_status(TaskStatus.TODO)
+        .filter_by_project("proj_1")
+        .sort_by_due_date()
+        .to_collection()
+    )
+"""
+
+from bisect import bisect_left
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.core.models.task import Task, TaskCollection, TaskPriority, TaskStatus
+
+HASH_INDEXED_FIELDS = ("status", "priority", "project_id", "assignee_id")
+SORTED_INDEXED_FIELDS = ("scheduled_start", "due_date")
+
+# Widest UTC offset in use; bounds the instants that fall on a local date
+_MAX_UTC_OFFSET = timedelta(hours=14)
+
+
+def _as_aware(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC so mixed values can be compared."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+_PRIORITY_ORDER = {
+    TaskPriority.URGENT: 0,
+    TaskPriority.HIGH: 1,
+    TaskPriority.MEDIUM: 2,
+    TaskPriority.LOW: 3,
+}
+
+
+class _SortedIndex:
+    """Positions of tasks ordered by a datetime field (tasks without a value are left out)."""
+
+    __slots__ = ("keys", "positions")
+
+    def __init__(self, tasks: Sequence[Task], field: str):
+        entries = sorted(
+            (_as_aware(value), position)
+            for position, value in enumerate(getattr(task, field) for task in tasks)
+            if value is not None
+        )
+        self.keys = [value for value, _ in entries]
+        self.positions = [position for _, position in entries]
+
+    def range(self, start: Optional[datetime], end: Optional[datetime]) -> List[int]:
+        """Positions with start <= value < end, in value order."""
+        lo = 0 if start is None else bisect_left(self.keys, _as_aware(start))
+        hi = len(self.keys) if end is None else bisect_left(self.keys, _as_aware(end))
+        return self.positions[lo:hi]
+
+
+class IndexedTaskCollection:
+    """
+    Immutable task collection with secondary indexes.
+
+    The collection is a snapshot: build a new one when the underlying tasks
+    change.
+    """
+
+    def __init__(self, tasks: Iterable[Task]):
+        """
+        Build the collection and its indexes.
+
+        Args:
+            tasks: Tasks to index
+        """
+        self.tasks: Tuple[Task, ...] = tuple(tasks)
+        self._hash: Dict[str, Dict[Any, List[int]]] = {field: {} for field in HASH_INDEXED_FIELDS}
+        for position, task in enumerate(self.tasks):
+            for field, index in self._hash.items():
+                index.setdefault(getattr(task, field), []).append(position)
+        self._sorted = {field: _SortedIndex(self.tasks, field) for field in SORTED_INDEXED_FIELDS}
+
+    @classmethod
+    def from_collection(cls, collection: TaskCollection) -> "IndexedTaskCollection":
+        """Index a TaskCollection."""
+        return cls(collection.tasks)
+
+    def __len__(self) -> int:
+        """Get number of tasks."""
+        return len(self.tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        """Iterate over tasks."""
+        return iter(self.tasks)
+
+    def query(self) -> "TaskQuery":
+        """Start a query over all tasks."""
+        return TaskQuery(self)
+
+    def positions(self, field: str, value: Any) -> Sequence[int]:
+        """Positions of tasks whose hash-indexed ``field`` equals ``value``."""
+        return self._hash[field].get(value, ())
+
+    def range_positions(self, field: str, start: Optional[datetime], end: Optional[datetime]) -> List[int]:
+        """Positions of tasks whose sorted-indexed ``field`` is in [start, end)."""
+        return self._sorted[field].range(start, end)
+
+
+class TaskQuery:
+    """
+    Lazy query over an IndexedTaskCollection.
+
+    Every builder method returns a new query, so partially built queries can be
+    shared and reused. Nothing runs until the query is iterated, counted or
+    materialized.
+    """
+
+    __slots__ = ("_index", "_equals", "_ranges", "_dates", "_order", "_limit")
+
+    def __init__(self, index: IndexedTaskCollection):
+        self._index = index
+        self._equals: Tuple[Tuple[str, Any], ...] = ()
+        self._ranges: Tuple[Tuple[str, Optional[datetime], Optional[datetime]], ...] = ()
+        self._dates: Tuple[datetime, ...] = ()
+        self._order: Optional[Tuple[str, bool]] = None
+        self._limit: Optional[int] = None
+
+    def _copy(self, **changes: Any) -> "TaskQuery":
+        query = TaskQuery.__new__(TaskQuery)
+        for name in self.__slots__:
+            setattr(query, name, changes.get(name, getattr(self, name)))
+        return query
+
+    # Filters
+
+    def _where(self, field: str, value: Any) -> "TaskQuery":
+        return self._copy(_equals=self._equals + ((field, value),))
+
+    def filter_by_status(self, status: TaskStatus) -> "TaskQuery":
+        """Filter tasks by status."""
+        return self._where("status", TaskStatus(status))
+
+    def filter_by_priority(self, priority: TaskPriority) -> "TaskQuery":
+        """Filter tasks by priority."""
+        return self._where("priority", TaskPriority(priority))
+
+    def filter_by_project(self, project_id: str) -> "TaskQuery":
+        """Filter tasks by project ID."""
+        return self._where("project_id", project_id)
+
+    def filter_by_assignee(self, assignee_id: str) -> "TaskQuery":
+        """Filter tasks by assignee ID."""
+        return self._where("assignee_id", assignee_id)
+
+    def scheduled_between(self, start: Optional[datetime], end: Optional[datetime]) -> "TaskQuery":
+        """Filter tasks scheduled to start in [start, end)."""
+        return self._copy(_ranges=self._ranges + (("scheduled_start", start, end),))
+
+    def due_between(self, start: Optional[datetime], end: Optional[datetime]) -> "TaskQuery":
+        """Filter tasks due in [start, end)."""
+        return self._copy(_ranges=self._ranges + (("due_date", start, end),))
+
+    def filter_by_scheduled_date(self, date: datetime) -> "TaskQuery":
+        """
+        Filter tasks scheduled for a specific date.
+
+        Like ``TaskCollection.filter_by_scheduled_date``, the date is compared in
+        each task's own time zone.
+        """
+        return self._copy(_dates=self._dates + (date,))
+
+    # Ordering and limits
+
+    def sort_by_due_date(self, ascending: bool = True) -> "TaskQuery":
+        """Sort tasks by due date (tasks without one last when ascending)."""
+        return self._copy(_order=("due_date", ascending))
+
+    def sort_by_priority(self, ascending: bool = True) -> "TaskQuery":
+        """Sort tasks by priority (most urgent first when ascending)."""
+        return self._copy(_order=("priority", ascending))
+
+    def limit(self, count: int) -> "TaskQuery":
+        """Return at most ``count`` tasks."""
+        return self._copy(_limit=count)
+
+    # Execution
+
+    def _candidates(self) -> Tuple[Sequence[int], bool]:
+        """
+        Pick the smallest candidate row set any index can supply.
+
+        Returns:
+            (positions, ordered): ``ordered`` is False if the positions are not
+            in collection order.
+        """
+        index = self._index
+        best: Optional[Sequence[int]] = None
+        ordered = True
+        for field, value in self._equals:
+            positions = index.positions(field, value)
+            if best is None or len(positions) < len(best):
+                best, ordered = positions, True
+        for field, start, end in self._ranges:
+            positions = index.range_positions(field, start, end)
+            if best is None or len(positions) < len(best):
+                best, ordered = positions, False
+        for date in self._dates:
+            # Any task starting on this local date starts within +-14h of it in UTC
+            day = datetime(date.year, date.month, date.day, tzinfo=timezone.utc)
+            positions = index.range_positions(
+                "scheduled_start", day - _MAX_UTC_OFFSET, day + timedelta(days=1) + _MAX_UTC_OFFSET
+            )
+            if best is None or len(positions) < len(best):
+                best, ordered = positions, False
+        if best is None:
+            return range(len(index)), True
+        return best, ordered
+
+    def _predicate(self) -> Callable[[Task], bool]:
+        """Fuse all filter conditions into one check."""
+        equals = self._equals
+        ranges = tuple(
+            (field, None if start is None else _as_aware(start), None if end is None else _as_aware(end))
+            for field, start, end in self._ranges
+        )
+        dates = tuple(date.date() for date in self._dates)
+
+        def matches(task: Task) -> bool:
+            for field, value in equals:
+                if getattr(task, field) != value:
+                    return False
+            for field, start, end in ranges:
+                value = getattr(task, field)
+                if value is None:
+                    return False
+                value = _as_aware(value)
+                if (start is not None and value < start) or (end is not None and value >= end):
+                    return False
+            if dates:
+                start = task.scheduled_start
+                if start is None or any(start.date() != date for date in dates):
+                    return False
+            return True
+
+        return matches
+
+    def _sort_key(self) -> Callable[[Task], Any]:
+        field, _ = self._order
+        if field == "priority":
+            return lambda t: _PRIORITY_ORDER.get(t.priority, 4) if t.priority else 4
+        return lambda t: (t.due_date is None, _as_aware(t.due_date) if t.due_date else 0)
+
+    def _execute(self) -> List[Task]:
+        tasks = self._index.tasks
+        positions, ordered = self._candidates()
+        if not ordered:
+            positions = sorted(positions)
+        matches = self._predicate()
+        if self._equals or self._ranges or self._dates:
+            results = [tasks[p] for p in positions if matches(tasks[p])]
+        else:
+            results = [tasks[p] for p in positions]
+        if self._order is not None:
+            results.sort(key=self._sort_key(), reverse=not self._order[1])
+        if self._limit is not None:
+            del results[self._limit:]
+        return results
+
+    def __iter__(self) -> Iterator[Task]:
+        """Run the query and iterate over the matching tasks."""
+        return iter(self._execute())
+
+    def count(self) -> int:
+        """Run the query and count the matching tasks."""
+        return len(self._execute())
+
+    def to_list(self) -> List[Task]:
+        """Run the query and return the matching tasks."""
+        return self._execute()
+
+    def to_collection(self) -> TaskCollection:
+        """Run the query and return the matching tasks as a TaskCollection."""
+        return TaskCollection(tasks=self._execute())
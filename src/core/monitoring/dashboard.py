@@ -1,12 +1,14 @@
 from src.core.monitoring.monitor import MonitoringSystem
 from src.core.monitoring.alert import AlertSystem
 from src.core.monitoring.health import HealthCheckSystem
+from src.utils.circuit_breaker import global_circuit_breakers
 
 class MonitoringDashboard:
-    def __init__(self, monitor=None, alert=None, health=None):
+    def __init__(self, monitor=None, alert=None, health=None, circuit_breakers=None):
         self.monitor = monitor or MonitoringSystem()
         self.alert = alert or AlertSystem()
         self.health = health or HealthCheckSystem()
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else global_circuit_breakers
 
     def get_status(self):
         return {
@@ -14,4 +16,5 @@ class MonitoringDashboard:
             'kpis': self.monitor.get_kpis(),
             'alerts': [rule['metric'] for rule in self.alert.rules],
             'health': self.health.run_checks(),
+            'circuit_breakers': self.circuit_breakers.snapshot(),
         } 
\ No newline at end of file
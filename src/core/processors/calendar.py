@@ -5,22 +5,61 @@ This module provides specialized processing of calendar events for the daily dig
 including filtering, sorting, formatting, and grouping operations specific to the digest needs.
 """
 
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Hashable, List, MutableMapping, Optional, Tuple
 
 from src.core.models.calendar import (
     CalendarEvent,
     CalendarEventCollection,
     EventStatus,
     EventType,
-    SYDNEY_TIMEZONE,
 )
+from src.core.models.event_index import conflicting_pairs
+from src.core.processors.free_busy import FreeBusy, FreeBusyCalculator
 from src.utils.exceptions import ValidationError
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
 
+class FormatCache(OrderedDict):
+    """
+    Mapping of formatted events that keeps only the most recently used entries.
+    
+    ``get`` and item assignment are thread-safe, so processors running in
+    parallel can share one cache.
+    """
+    
+    def __init__(self, max_entries: int = 2048):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of formatted events kept
+        """
+        self._lock = threading.Lock()
+        super().__init__()
+        self.max_entries = max_entries
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                self.move_to_end(key)
+            except KeyError:
+                return default
+            return super().__getitem__(key)
+    
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            super().__setitem__(key, value)
+            self.move_to_end(key)
+            while len(self) > self.max_entries:
+                self.popitem(last=False)
+
+
 class CalendarEventProcessor:
     """
     Processes calendar events for digest email preparation.
@@ -30,14 +69,29 @@ class CalendarEventProcessor:
     filtering, sorting, formatting, and grouping operations.
     """
     
-    def __init__(self, events: CalendarEventCollection):
+    def __init__(
+        self,
+        events: CalendarEventCollection,
+        free_busy: Optional[FreeBusyCalculator] = None,
+        calendars: Optional[List[CalendarEventCollection]] = None,
+        format_cache: Optional[MutableMapping[Tuple[str, datetime], Dict[str, str]]] = None,
+    ):
         """
         Initialize the processor with a collection of events.
         
         Args:
             events: Collection of calendar events to process
+            free_busy: Free/busy calculator (defaults to 9-5 weekday working hours)
+            calendars: Extra calendars (e.g. shared ones) that also block free time
+            format_cache: Formatted events keyed by (event id, updated_at); pass
+                the same mapping to several processors to share it. Defaults to
+                a bounded ``FormatCache``; a mapping passed in is never pruned,
+                so its owner controls its size and lifetime.
         """
         self.events = events.to_sydney_time()  # Ensure all events are in Sydney time
+        self.free_busy = free_busy or FreeBusyCalculator()
+        self.calendars = [self.events, *(calendars or [])]
+        self.format_cache = FormatCache() if format_cache is None else format_cache
     
     def get_daily_digest_events(self, date: datetime) -> CalendarEventCollection:
         """
@@ -49,15 +103,28 @@ class CalendarEventProcessor:
         Returns:
             CalendarEventCollection: Processed events for the digest
         """
-        # Filter to only confirmed events for the specified date
-        filtered = (
+        # Expand recurring series over the day, then take the day's events from the index
+        day_start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=1)
+        on_day = (
             self.events
-            .filter_by_date(date)
-            .filter_by_status(EventStatus.CONFIRMED)
+            .expand_recurring(day_start, day_end)
+            .index()
+            .events_in_range(day_start, day_end, inclusive=True)
         )
         
-        # Sort chronologically
-        return filtered.sort_by_start_time()
+        # Keep confirmed events, sorted chronologically
+        return CalendarEventCollection(sorted(
+            (event for event in on_day if event.status == EventStatus.CONFIRMED),
+            key=lambda e: e.start_time,
+        ))
+    
+    def _period_boundaries(self, day: datetime) -> Tuple[datetime, datetime]:
+        """Get the afternoon and evening start times on a day."""
+        return (
+            day.replace(hour=12, minute=0, second=0, microsecond=0),
+            day.replace(hour=17, minute=0, second=0, microsecond=0),
+        )
     
     def group_events_by_time_of_day(
         self,
@@ -66,6 +133,8 @@ class CalendarEventProcessor:
         """
         Group events by time of day (morning, afternoon, evening).
         
+        Each event is placed using the boundaries of its own start date.
+        
         Args:
             events: Optional events to group (defaults to all events)
             
@@ -74,11 +143,6 @@ class CalendarEventProcessor:
         """
         events = events or self.events
         
-        # Define time boundaries (Sydney time)
-        morning_start = datetime.now(SYDNEY_TIMEZONE).replace(hour=5, minute=0, second=0, microsecond=0)
-        afternoon_start = datetime.now(SYDNEY_TIMEZONE).replace(hour=12, minute=0, second=0, microsecond=0)
-        evening_start = datetime.now(SYDNEY_TIMEZONE).replace(hour=17, minute=0, second=0, microsecond=0)
-        
         groups = {
             "morning": [],
             "afternoon": [],
@@ -86,12 +150,11 @@ class CalendarEventProcessor:
         }
         
         for event in events:
+            # Events before 5 AM are considered part of the morning
             start_time = event.start_time
+            afternoon_start, evening_start = self._period_boundaries(start_time)
             
-            if start_time < morning_start:
-                # Events before 5 AM are considered part of the morning
-                groups["morning"].append(event)
-            elif start_time < afternoon_start:
+            if start_time < afternoon_start:
                 groups["morning"].append(event)
             elif start_time < evening_start:
                 groups["afternoon"].append(event)
@@ -139,12 +202,24 @@ class CalendarEventProcessor:
             "type": event.type.value.title(),
         }
     
+    def _format_cached(self, event: CalendarEvent) -> Dict[str, str]:
+        """Format an event, memoized by id and ``updated_at`` when the event has one."""
+        if event.updated_at is None:
+            return self.format_event_for_digest(event)
+        key = (event.id, event.updated_at)
+        formatted = self.format_cache.get(key)
+        if formatted is None:
+            formatted = self.format_event_for_digest(event)
+            self.format_cache[key] = formatted
+        return dict(formatted)
+    
     def get_digest_summary(self, date: datetime) -> Dict[str, Any]:
         """
         Generate a complete digest summary for the specified date.
         
         Args:
-            date: The date to generate the summary for
+            date: The date to generate the summary for, read as a date in the
+                working-hours timezone
             
         Returns:
             Dict[str, Any]: Complete digest summary including:
@@ -152,34 +227,138 @@ class CalendarEventProcessor:
                 - Events by time of day
                 - Formatted events
                 - Event types distribution
+                - Validation findings (missing titles, overlapping events)
+                - Free/busy time within working hours
         """
-        # Get processed events for the day
-        daily_events = self.get_daily_digest_events(date)
-        
-        # Group events by time of day
-        time_groups = self.group_events_by_time_of_day(daily_events)
-        
-        # Format all events
-        formatted_events = {
-            period: [self.format_event_for_digest(event) for event in events]
-            for period, events in time_groups.items()
-        }
+        tz = self.free_busy.working_hours.timezone
+        date = date.astimezone(tz) if date.tzinfo else date.replace(tzinfo=tz)
+        return self._build_summary(
+            date,
+            self.get_daily_digest_events(date).events,
+            self.free_busy.compute(self.calendars, date),
+        )
+    
+    def _build_summary(
+        self,
+        date: datetime,
+        daily_events: List[CalendarEvent],
+        free_busy: FreeBusy,
+    ) -> Dict[str, Any]:
+        """Build one day's summary from its confirmed events, sorted by start time."""
+        afternoon_start, evening_start = self._period_boundaries(date)
         
-        # Count events by type
-        type_counts = {
-            event_type: len(daily_events.filter_by_type(event_type))
-            for event_type in EventType
+        # Group, count, format and check titles in a single pass
+        formatted_events: Dict[str, List[Dict[str, str]]] = {
+            "morning": [],
+            "afternoon": [],
+            "evening": [],
         }
+        type_counts = dict.fromkeys(EventType, 0)
+        messages: List[str] = []
+        for event in daily_events:
+            start_time = event.start_time
+            if start_time < afternoon_start:
+                period = "morning"
+            elif start_time < evening_start:
+                period = "afternoon"
+            else:
+                period = "evening"
+            formatted_events[period].append(self._format_cached(event))
+            type_counts[event.type] += 1
+            
+            if not event.title:
+                messages.append(f"Event {event.id} has no title")
+        for earlier, later in conflicting_pairs(daily_events):
+            messages.append(f"Events overlap: '{earlier.title}' and '{later.title}'")
         
         return {
             "date": date.strftime("%A, %B %d, %Y"),
             "total_events": len(daily_events),
             "events_by_period": {
                 period: len(events)
-                for period, events in time_groups.items()
+                for period, events in formatted_events.items()
             },
             "events_by_type": type_counts,
             "formatted_events": formatted_events,
+            "validation": {"is_valid": not messages, "messages": messages},
+            "free_busy": self.free_busy.summarize(free_busy),
+        }
+    
+    def get_digest_range(self, start: datetime, days: int = 7) -> Dict[str, Any]:
+        """
+        Generate digest summaries for a run of days plus an overview.
+        
+        Events are fetched from the index once for the whole range and bucketed
+        by local date; an event appears on every day it touches. Free/busy time
+        is also computed once and split per day.
+        
+        Args:
+            start: First day, read as a date in the working-hours timezone
+                (naive datetimes are taken to be in it)
+            days: Number of days, e.g. 7 for a week-ahead digest
+            
+        Returns:
+            Dict[str, Any]: ``days`` (one summary per day, as from
+                ``get_digest_summary``) and ``overview`` (totals for the range)
+        """
+        # Day boundaries must match the working-hours days free/busy is split into
+        tz = self.free_busy.working_hours.timezone
+        start = start.astimezone(tz) if start.tzinfo else start.replace(tzinfo=tz)
+        range_start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_starts = [range_start + timedelta(days=offset) for offset in range(days)]
+        range_end = range_start + timedelta(days=days)
+        
+        # One index query and one sort for the whole range
+        in_range = (
+            self.events
+            .expand_recurring(range_start, range_end)
+            .index()
+            .events_in_range(range_start, range_end, inclusive=True)
+        )
+        events = sorted(
+            (event for event in in_range if event.status == EventStatus.CONFIRMED),
+            key=lambda e: e.start_time,
+        )
+        
+        buckets: List[List[CalendarEvent]] = [[] for _ in day_starts]
+        for event in events:
+            day = max(bisect_right(day_starts, event.start_time) - 1, 0)
+            # Same rule as filter_by_date: events ending at midnight touch the next day
+            while day < days and event.end_time >= day_starts[day]:
+                buckets[day].append(event)
+                day += 1
+        
+        free_busy = self.free_busy.compute(self.calendars, range_start, days)
+        free_busy_by_day = [FreeBusy() for _ in day_starts]
+        for name in ("busy", "free"):
+            for block in getattr(free_busy, name):
+                day = bisect_right(day_starts, block.start) - 1
+                getattr(free_busy_by_day[day], name).append(block)
+        
+        summaries = [
+            self._build_summary(day_start, bucket, day_free_busy)
+            for day_start, bucket, day_free_busy in zip(day_starts, buckets, free_busy_by_day)
+        ]
+        
+        type_counts = dict.fromkeys(EventType, 0)
+        for event in events:
+            type_counts[event.type] += 1
+        busiest = max(summaries, key=lambda summary: summary["total_events"], default=None)
+        
+        return {
+            "days": summaries,
+            "overview": {
+                "start": range_start.strftime("%A, %B %d, %Y"),
+                "end": day_starts[-1].strftime("%A, %B %d, %Y") if day_starts else None,
+                "total_events": len(events),
+                "events_by_type": type_counts,
+                "busiest_day": busiest["date"] if busiest and busiest["total_events"] else None,
+                "busy_minutes": sum(s["free_busy"]["busy_minutes"] for s in summaries),
+                "free_minutes": sum(s["free_busy"]["free_minutes"] for s in summaries),
+                "days_with_conflicts": [
+                    s["date"] for s in summaries if not s["validation"]["is_valid"]
+                ],
+            },
         }
     
     def validate_digest_events(self, events: CalendarEventCollection) -> Tuple[bool, List[str]]:
@@ -203,14 +382,10 @@ class CalendarEventProcessor:
             if event.status != EventStatus.CONFIRMED:
                 messages.append(f"Event {event.id} is not confirmed")
         
-        # Check for overlapping events
-        sorted_events = events.sort_by_start_time()
-        for i in range(len(sorted_events) - 1):
-            current = sorted_events[i]
-            next_event = sorted_events[i + 1]
-            if current.end_time > next_event.start_time:
-                messages.append(
-                    f"Events overlap: '{current.title}' and '{next_event.title}'"
-                )
+        # Check for overlapping events, including ones that are not adjacent
+        for earlier, later in events.all_conflicts():
+            messages.append(
+                f"Events overlap: '{earlier.title}' and '{later.title}'"
+            )
         
         return len(messages) == 0, messages 
\ No newline at end of file
@@ -0,0 +1,242 @@
+"""
+Free/busy calculation for the daily digest.
+
+This module merges calendar events from one or more calendars into busy blocks
+with a sort-and-sweep, then intersects them with working hours to find the free
+gaps. Everything after the initial sort is a linear walk, so the whole
+calculation is O(n log n) in the number of events.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+from zoneinfo import ZoneInfo
+
+from src.core.models.calendar import (
+    CalendarEvent,
+    CalendarEventCollection,
+    EventStatus,
+    SYDNEY_TIMEZONE,
+)
+from src.utils.exceptions import ValidationError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+WEEKDAYS = frozenset(range(5))
+
+
+@dataclass(frozen=True)
+class WorkingHours:
+    """Daily working hours in a timezone."""
+    start: time = time(9, 0)
+    end: time = time(17, 0)
+    days: FrozenSet[int] = WEEKDAYS  # date.weekday() values; Monday is 0
+    timezone: ZoneInfo = SYDNEY_TIMEZONE
+    
+    def __post_init__(self):
+        if self.start >= self.end:
+            raise ValidationError("Working hours must end after they start", field="end")
+    
+    def windows(self, start: date, days: int = 1) -> List[Tuple[datetime, datetime]]:
+        """
+        Get the working-hour windows for a run of days.
+        
+        Args:
+            start: First day
+            days: Number of days
+        
+        Returns:
+            List[Tuple[datetime, datetime]]: (start, end) of each working day, in order
+        """
+        windows = []
+        for offset in range(days):
+            day = start + timedelta(days=offset)
+            if day.weekday() in self.days:
+                windows.append((
+                    datetime.combine(day, self.start, tzinfo=self.timezone),
+                    datetime.combine(day, self.end, tzinfo=self.timezone),
+                ))
+        return windows
+
+
+@dataclass(frozen=True)
+class TimeBlock:
+    """A busy or free stretch of time."""
+    start: datetime
+    end: datetime
+    event_ids: Tuple[str, ...] = ()
+    
+    @property
+    def duration(self) -> timedelta:
+        """Length of the block."""
+        return self.end - self.start
+
+
+@dataclass
+class FreeBusy:
+    """Busy blocks and free gaps within working hours."""
+    busy: List[TimeBlock] = field(default_factory=list)
+    free: List[TimeBlock] = field(default_factory=list)
+    
+    @property
+    def busy_time(self) -> timedelta:
+        """Total busy time."""
+        return sum((block.duration for block in self.busy), timedelta())
+    
+    @property
+    def free_time(self) -> timedelta:
+        """Total free time."""
+        return sum((block.duration for block in self.free), timedelta())
+
+
+def merge_intervals(events: Iterable[CalendarEvent]) -> List[TimeBlock]:
+    """
+    Merge events into non-overlapping busy blocks.
+    
+    Events that touch (one ends as the next starts) are merged too.
+    
+    Args:
+        events: Events to merge, in any order
+    
+    Returns:
+        List[TimeBlock]: Busy blocks sorted by start time
+    """
+    blocks: List[TimeBlock] = []
+    start = end = None
+    ids: List[str] = []
+    for event in sorted(events, key=lambda e: e.start_time):
+        if end is not None and event.start_time <= end:
+            if event.end_time > end:
+                end = event.end_time
+            ids.append(event.id)
+            continue
+        if end is not None:
+            blocks.append(TimeBlock(start, end, tuple(ids)))
+        start, end, ids = event.start_time, event.end_time, [event.id]
+    if end is not None:
+        blocks.append(TimeBlock(start, end, tuple(ids)))
+    return blocks
+
+
+class FreeBusyCalculator:
+    """
+    Computes busy blocks and free gaps across calendars.
+    
+    Cancelled events never block time; all-day events are skipped unless
+    ``include_all_day`` is set, since they are mostly reminders and holidays.
+    """
+    
+    def __init__(
+        self,
+        working_hours: Optional[WorkingHours] = None,
+        min_free: timedelta = timedelta(minutes=15),
+        include_all_day: bool = False,
+    ):
+        """
+        Initialize the calculator.
+        
+        Args:
+            working_hours: Hours to report on (defaults to 9-5 weekdays, Sydney)
+            min_free: Shortest gap reported as free time
+            include_all_day: Whether all-day events count as busy
+        """
+        self.working_hours = working_hours or WorkingHours()
+        self.min_free = min_free
+        self.include_all_day = include_all_day
+    
+    def _blocking(self, event: CalendarEvent) -> bool:
+        if event.status == EventStatus.CANCELLED:
+            return False
+        return self.include_all_day or not event.is_all_day()
+    
+    def compute(
+        self,
+        calendars: Union[CalendarEventCollection, Iterable[CalendarEventCollection]],
+        start: Union[date, datetime],
+        days: int = 1,
+    ) -> FreeBusy:
+        """
+        Compute free/busy time for a run of days.
+        
+        Args:
+            calendars: One calendar or several (e.g. a shared team view)
+            start: First day; datetimes are read as a date in the working-hours timezone
+            days: Number of days
+        
+        Returns:
+            FreeBusy: Busy blocks and free gaps, clipped to working hours
+        """
+        if isinstance(calendars, CalendarEventCollection):
+            calendars = [calendars]
+        if isinstance(start, datetime):
+            start = start.astimezone(self.working_hours.timezone).date() if start.tzinfo else start.date()
+        windows = self.working_hours.windows(start, days)
+        if not windows:
+            return FreeBusy()
+        
+        window_start, window_end = windows[0][0], windows[-1][1]
+        events = [
+            event
+            for calendar in calendars
+            for event in calendar.expand_recurring(window_start, window_end).events_in_range(window_start, window_end)
+            if self._blocking(event)
+        ]
+        merged = merge_intervals(events)
+        
+        # Walk the working windows and busy blocks together
+        result = FreeBusy()
+        i = 0
+        for day_start, day_end in windows:
+            while i < len(merged) and merged[i].end <= day_start:
+                i += 1
+            cursor = day_start
+            j = i
+            while j < len(merged) and merged[j].start < day_end:
+                block = merged[j]
+                busy_start, busy_end = max(block.start, day_start), min(block.end, day_end)
+                self._add_free(result, cursor, busy_start)
+                result.busy.append(TimeBlock(busy_start, busy_end, block.event_ids))
+                cursor = busy_end
+                j += 1
+            self._add_free(result, cursor, day_end)
+            # A block running past the end of the day may continue into the next one
+            i = j - 1 if j > i and merged[j - 1].end > day_end else j
+        
+        logger.debug(
+            "free_busy_computed",
+            events=len(events),
+            busy_blocks=len(result.busy),
+            free_blocks=len(result.free),
+        )
+        return result
+    
+    def _add_free(self, result: FreeBusy, start: datetime, end: datetime) -> None:
+        if end > start and end - start >= self.min_free:
+            result.free.append(TimeBlock(start, end))
+    
+    def summarize(self, free_busy: FreeBusy) -> Dict[str, Any]:
+        """
+        Format free/busy time for the digest.
+        
+        Args:
+            free_busy: Result of ``compute``
+        
+        Returns:
+            Dict[str, Any]: Working hours, busy/free minutes and formatted blocks
+        """
+        return {
+            "working_hours": f"{_format_time(self.working_hours.start)} - {_format_time(self.working_hours.end)}",
+            "busy_minutes": int(free_busy.busy_time.total_seconds() // 60),
+            "free_minutes": int(free_busy.free_time.total_seconds() // 60),
+            "busy": [_format_block(block) for block in free_busy.busy],
+            "free": [_format_block(block) for block in free_busy.free],
+        }
+
+
+def _format_time(value: Union[time, datetime]) -> str:
+    return value.strftime("%I:%M %p").lstrip("0")
+
+
+def _format_block(block: TimeBlock) -> Dict[str, str]:
+    return {"start": _format_time(block.start), "end": _format_time(block.end)}
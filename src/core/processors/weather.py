@@ -5,7 +5,7 @@ This module provides specialized processing of weather data for the daily digest
 including filtering, formatting, summary generation, and trend analysis.
 """
 
-from datetime import datetime, timedelta
+from datetime import date as Date, datetime, time, timedelta
 from typing import Any, Dict, List, Optional, Tuple, Union
 from zoneinfo import ZoneInfo
 
@@ -23,6 +23,7 @@ from src.core.models.weather import (
     AlertSeverity,
     SYDNEY_TIMEZONE,
 )
+from src.core.models.event_index import EventIntervalIndex
 from src.utils.exceptions import ValidationError
 from src.utils.logging import get_logger
 
@@ -42,11 +43,26 @@ class WeatherProcessor:
         """
         Initialize the processor with a weather forecast.
         
+        The processor indexes forecast days by date and alerts by the dates
+        they cover, so it treats the forecast as a snapshot.
+        
         Args:
             forecast: Weather forecast data to process
         """
         self.forecast = forecast
         self._validate_forecast()
+        
+        self._forecast_by_date: Dict[Date, ForecastDay] = {}
+        for day in self.forecast.daily_forecasts:
+            self._forecast_by_date.setdefault(day.date.date(), day)
+        alerts = self.forecast.alerts.alerts if hasattr(self.forecast, 'alerts') else []
+        # Alerts are active on every date from their start date to their end date
+        self._alert_index = EventIntervalIndex(
+            alerts,
+            bounds=lambda alert: (alert.start_time.date(), alert.end_time.date()),
+        )
+        self._trends: Dict[Date, Dict[str, Any]] = {}
+        self._impacts: Dict[Date, Dict[str, Any]] = {}
     
     def _validate_forecast(self) -> None:
         """Validate the forecast data."""
@@ -75,30 +91,58 @@ class WeatherProcessor:
             Dict[str, Any]: Processed weather data for the digest
         """
         # Get the forecast day that matches the date
-        target_date = date.date()
-        daily_forecast = next(
-            (day for day in self.forecast.daily_forecasts 
-             if day.date.date() == target_date),
-            None
-        )
+        daily_forecast = self._forecast_by_date.get(date.date())
         
         if not daily_forecast:
             raise ValidationError(f"No forecast available for {date.date()}")
         
+        return self._build_day_weather(date, daily_forecast, self._get_active_alerts(date))
+    
+    def get_digest_weather_many(self, dates: List[datetime]) -> List[Dict[str, Any]]:
+        """
+        Get digest weather for several dates, e.g. for many users' digests.
+        
+        Trends and impact assessments are computed once per forecast date and
+        reused across calls.
+        
+        Args:
+            dates: Dates to get weather for
+            
+        Returns:
+            List[Dict[str, Any]]: Digest weather for each date, in order
+            
+        Raises:
+            ValidationError: If a date has no forecast
+        """
+        return [self.get_daily_digest_weather(date) for date in dates]
+    
+    def _build_day_weather(
+        self,
+        date: datetime,
+        daily_forecast: ForecastDay,
+        alerts: List[WeatherAlert],
+    ) -> Dict[str, Any]:
+        """Build one day's digest weather from its forecast and active alerts."""
         # Get current conditions if date is today
         current = self.forecast.current if date.date() == datetime.now(SYDNEY_TIMEZONE).date() else None
         
-        # Get any active alerts
-        alerts = self._get_active_alerts(date)
-        
         # Generate weather summary
         summary = self._generate_weather_summary(daily_forecast, current)
         
-        # Analyze trends
-        trends = self._analyze_weather_trends(daily_forecast)
-        
-        # Assess weather impact
-        impact = self._assess_weather_impact(daily_forecast, alerts)
+        # Analyze trends and assess weather impact, once per forecast date
+        key = daily_forecast.date.date()
+        trends = self._trends.get(key)
+        if trends is None:
+            trends = self._trends[key] = self._analyze_weather_trends(daily_forecast)
+        impact = self._impacts.get(key)
+        if impact is None:
+            impact = self._impacts[key] = self._assess_weather_impact(daily_forecast, alerts)
+        trends = dict(trends)
+        impact = {
+            **impact,
+            "concerns": list(impact["concerns"]),
+            "recommendations": list(impact["recommendations"]),
+        }
         
         return {
             "date": date.strftime("%A, %B %d, %Y"),
@@ -110,6 +154,57 @@ class WeatherProcessor:
             "impact": impact,
         }
     
+    def get_digest_range(self, start: datetime, days: int = 7) -> Dict[str, Any]:
+        """
+        Get digest weather for a run of days plus an overview.
+        
+        Forecast days and alerts are looked up in the processor's date indexes
+        rather than searched for each day.
+        
+        Args:
+            start: First day
+            days: Number of days, e.g. 7 for a week-ahead digest
+            
+        Returns:
+            Dict[str, Any]: ``days`` (digest weather for each day that has a
+                forecast, as from ``get_daily_digest_weather``), ``missing_days``
+                (dates without a forecast) and ``overview``
+        """
+        dates = [start.date() + timedelta(days=offset) for offset in range(days)]
+        
+        results = []
+        forecast_days = []
+        missing = []
+        for d in dates:
+            daily_forecast = self._forecast_by_date.get(d)
+            if daily_forecast is None:
+                missing.append(d.isoformat())
+                continue
+            day_start = datetime.combine(d, time(), tzinfo=start.tzinfo)
+            results.append(self._build_day_weather(day_start, daily_forecast, self._get_active_alerts(day_start)))
+            forecast_days.append(daily_forecast)
+        
+        wettest = max(forecast_days, key=lambda day: day.total_precipitation_mm, default=None)
+        return {
+            "days": results,
+            "missing_days": missing,
+            "overview": {
+                "start": dates[0].strftime("%A, %B %d, %Y") if dates else None,
+                "end": dates[-1].strftime("%A, %B %d, %Y") if dates else None,
+                "max_temperature": max((day.max_temp_c for day in forecast_days), default=None),
+                "min_temperature": min((day.min_temp_c for day in forecast_days), default=None),
+                "total_precipitation_mm": round(sum(day.total_precipitation_mm for day in forecast_days), 1),
+                "wettest_day": (
+                    wettest.date.strftime("%A, %B %d")
+                    if wettest and wettest.total_precipitation_mm > 0 else None
+                ),
+                "days_with_alerts": [result["date"] for result in results if result["alerts"]],
+                "high_impact_days": [
+                    result["date"] for result in results if result["impact"]["severity"] == "high"
+                ],
+            },
+        }
+    
     def _get_active_alerts(self, date: datetime) -> List[WeatherAlert]:
         """
         Get active weather alerts for the specified date.
@@ -120,14 +215,8 @@ class WeatherProcessor:
         Returns:
             List[WeatherAlert]: Active weather alerts
         """
-        if not hasattr(self.forecast, 'alerts'):
-            return []
-            
         target_date = date.date()
-        return [
-            alert for alert in self.forecast.alerts.alerts
-            if alert.start_time.date() <= target_date <= alert.end_time.date()
-        ]
+        return self._alert_index.events_in_range(target_date, target_date + timedelta(days=1), inclusive=True)
     
     def _generate_weather_summary(
         self,
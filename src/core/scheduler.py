@@ -7,16 +7,22 @@ from apscheduler.events import EVENT_JOB_EXECUTED, EVENT_JOB_ERROR, EVENT_JOB_MI
 from zoneinfo import ZoneInfo
 from src.utils.timezone import SYDNEY_TIMEZONE, convert_to_timezone
 from src.utils.logging import get_logger
+from src.utils.retry import deadline
+
+# Overall time budget for one digest run; bounds every API/SMTP retry underneath it
+DEFAULT_JOB_DEADLINE = 15 * 60
 
 class DigestScheduler:
     def __init__(self, 
                  job_func: Callable,
                  schedule_time: time = time(6, 30),
                  timezone: ZoneInfo = SYDNEY_TIMEZONE,
-                 logger=None):
+                 logger=None,
+                 job_deadline: Optional[float] = DEFAULT_JOB_DEADLINE):
         self.logger = logger or get_logger(__name__)
         self.scheduler = BackgroundScheduler(timezone=timezone)
         self.job_func = job_func
+        self.job_deadline = job_deadline
         self.schedule_time = schedule_time
         self.timezone = timezone
         self.job = None
@@ -43,6 +49,11 @@ class DigestScheduler:
         self.logger.info("schedule_recovery_attempt", job_id=job_id)
         # TODO: Implement more robust recovery logic (e.g., re-queue, alert)
 
+    def _run_job(self):
+        # Every retry and timeout inside the job shares this deadline
+        with deadline(self.job_deadline):
+            return self.job_func()
+
     def start(self):
         if not self.job:
             self.schedule_digest()
@@ -59,7 +70,7 @@ class DigestScheduler:
         if self.job:
             self.scheduler.remove_job(self.job.id)
         self.job = self.scheduler.add_job(
-            self.job_func,
+            self._run_job,
             trigger=CronTrigger(hour=schedule_time.hour, minute=schedule_time.minute, timezone=timezone),
             id="digest_delivery",
             replace_existing=True,
@@ -70,7 +81,7 @@ class DigestScheduler:
     def run_digest_now(self):
         self.logger.info("manual_digest_triggered")
         try:
-            self.job_func()
+            self._run_job()
             self.logger.info("manual_digest_completed")
         except Exception as e:
             self.logger.error("manual_digest_failed", error=str(e))
@@ -0,0 +1,356 @@
+"""
+Incremental task synchronization for the Daily Digest Assistant.
+
+Instead of downloading every task on each digest run, tasks are kept in a local
+store that is updated with only the tasks changed since the last successful
+sync (the ``updated_at`` watermark). Deletions are tracked as tombstones so a
+late-arriving stale update cannot resurrect a deleted task.
+"""
+
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from threading import RLock
+from typing import Dict, Iterable, List, Optional, Union
+
+from src.api.motion import MotionClient
+from src.core.models.task import Task, TaskCollection
+from src.utils.exceptions import MotionAPIError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Metadata flags the API may use to mark a task as deleted in a change feed
+DELETED_FLAGS = ("deleted", "isDeleted")
+
+
+def _as_utc(dt: datetime) -> datetime:
+    """Normalize a datetime to an aware UTC datetime."""
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+@dataclass
+class MergeResult:
+    """Outcome of merging a batch of changes into the store."""
+    upserted: int = 0
+    deleted: int = 0
+    skipped: int = 0
+
+
+@dataclass
+class SyncResult:
+    """Outcome of a sync run."""
+    full: bool
+    fetched: int
+    merge: MergeResult
+    watermark: Optional[datetime]
+    started_at: datetime
+    finished_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class TaskStore:
+    """
+    Local task store keyed by task ID, with deletion tombstones and a sync watermark.
+
+    The store is optionally persisted to a JSON file, written atomically on save.
+    """
+
+    def __init__(self, path: Optional[Path] = None, tombstone_ttl: timedelta = timedelta(days=30)):
+        """
+        Initialize the store.
+
+        Args:
+            path: Optional JSON file used to persist the store between runs.
+            tombstone_ttl: How long deletion tombstones are kept.
+        """
+        self.path = Path(path) if path else None
+        self.tombstone_ttl = tombstone_ttl
+        self.tasks: Dict[str, Task] = {}
+        self.tombstones: Dict[str, datetime] = {}
+        self.watermark: Optional[datetime] = None
+        self._lock = RLock()
+        if self.path is not None and self.path.exists():
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.tasks)
+
+    def __contains__(self, task_id: str) -> bool:
+        return task_id in self.tasks
+
+    def get(self, task_id: str) -> Optional[Task]:
+        """Get a task by ID."""
+        return self.tasks.get(task_id)
+
+    def upsert(self, task: Task) -> bool:
+        """
+        Insert or update a task unless a newer version or tombstone exists.
+
+        Returns:
+            bool: True if the store changed
+        """
+        with self._lock:
+            updated_at = _as_utc(task.updated_at) if task.updated_at else None
+            tombstone = self.tombstones.get(task.id)
+            if tombstone is not None:
+                if updated_at is None or updated_at <= tombstone:
+                    return False
+                del self.tombstones[task.id]
+            existing = self.tasks.get(task.id)
+            if (
+                existing is not None
+                and existing.updated_at is not None
+                and updated_at is not None
+                and updated_at < _as_utc(existing.updated_at)
+            ):
+                return False
+            self.tasks[task.id] = task
+            return True
+
+    def delete(self, task_id: str, deleted_at: Optional[datetime] = None) -> bool:
+        """
+        Remove a task and record a tombstone, unless the stored task is newer.
+
+        A stored task updated after ``deleted_at`` was recreated or edited after
+        the deletion, so it is kept and no tombstone is recorded.
+
+        Returns:
+            bool: True if the task was removed
+        """
+        with self._lock:
+            deleted_at = _as_utc(deleted_at) if deleted_at else datetime.now(timezone.utc)
+            existing = self.tasks.get(task_id)
+            if (
+                existing is not None
+                and existing.updated_at is not None
+                and _as_utc(existing.updated_at) > deleted_at
+            ):
+                return False
+            previous = self.tombstones.get(task_id)
+            self.tombstones[task_id] = max(previous, deleted_at) if previous else deleted_at
+            return self.tasks.pop(task_id, None) is not None
+
+    def merge(
+        self,
+        changed: Iterable[Task],
+        deleted: Iterable[Union[Task, str]] = (),
+        watermark: Optional[datetime] = None,
+    ) -> MergeResult:
+        """
+        Merge a batch of changed and deleted tasks and advance the watermark.
+
+        Args:
+            changed: Tasks created or updated since the last sync
+            deleted: Tasks deleted since the last sync, tombstoned at their own
+                ``updated_at``; bare IDs (and tasks without a timestamp) are
+                tombstoned at the watermark
+            watermark: New watermark; never moves backwards
+
+        Returns:
+            MergeResult: Counts of applied and skipped changes
+        """
+        result = MergeResult()
+        with self._lock:
+            for task in changed:
+                if self.upsert(task):
+                    result.upserted += 1
+                else:
+                    result.skipped += 1
+            for record in deleted:
+                if isinstance(record, Task):
+                    removed = self.delete(record.id, record.updated_at or watermark)
+                else:
+                    removed = self.delete(record, watermark)
+                if removed:
+                    result.deleted += 1
+            if watermark is not None:
+                watermark = _as_utc(watermark)
+                if self.watermark is None or watermark > self.watermark:
+                    self.watermark = watermark
+            self.purge_tombstones()
+        return result
+
+    def purge_tombstones(self, now: Optional[datetime] = None) -> int:
+        """
+        Drop tombstones older than the tombstone TTL.
+
+        Age is measured against the watermark by default, since tombstones carry
+        server-side timestamps and only need to outlive changes still to be synced.
+        """
+        reference = now or self.watermark or datetime.now(timezone.utc)
+        cutoff = reference - self.tombstone_ttl
+        with self._lock:
+            expired = [task_id for task_id, at in self.tombstones.items() if at < cutoff]
+            for task_id in expired:
+                del self.tombstones[task_id]
+        return len(expired)
+
+    def to_collection(self) -> TaskCollection:
+        """Get all live tasks as a TaskCollection."""
+        with self._lock:
+            return TaskCollection(tasks=list(self.tasks.values()))
+
+    def clear(self) -> None:
+        """Remove all tasks, tombstones and the watermark."""
+        with self._lock:
+            self.tasks.clear()
+            self.tombstones.clear()
+            self.watermark = None
+
+    def load(self) -> None:
+        """Load the store from its JSON file."""
+        if self.path is None:
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        with self._lock:
+            self.tasks = {
+                task_data["id"]: Task.model_validate(task_data)
+                for task_data in data.get("tasks", [])
+            }
+            self.tombstones = {
+                task_id: datetime.fromisoformat(at)
+                for task_id, at in data.get("tombstones", {}).items()
+            }
+            watermark = data.get("watermark")
+            self.watermark = datetime.fromisoformat(watermark) if watermark else None
+
+    def save(self) -> None:
+        """Atomically write the store to its JSON file."""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+                "tasks": [task.model_dump(mode="json") for task in self.tasks.values()],
+                "tombstones": {task_id: at.isoformat() for task_id, at in self.tombstones.items()},
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, self.path)
+
+
+class IncrementalTaskSync:
+    """
+    Keeps a TaskStore up to date with Motion using an updated_at watermark.
+
+    The first sync (or ``full=True``) downloads every task and tombstones any
+    stored task that no longer exists. Later syncs request only tasks updated
+    since the watermark minus a small overlap, which guards against clock skew
+    and tasks committed while the previous sync was running.
+    """
+
+    def __init__(
+        self,
+        client: MotionClient,
+        store: TaskStore,
+        overlap: timedelta = timedelta(minutes=5),
+    ):
+        """
+        Initialize the sync.
+
+        Args:
+            client: Motion API client used to fetch tasks
+            store: Local task store to merge changes into
+            overlap: How far before the watermark incremental fetches start
+        """
+        self.client = client
+        self.store = store
+        self.overlap = overlap
+
+    def sync(self, full: bool = False) -> SyncResult:
+        """
+        Fetch changed tasks and merge them into the store.
+
+        The store is only modified once every page has been fetched, so a failed
+        sync leaves the previous state and watermark intact.
+
+        Args:
+            full: Force a full resync instead of an incremental one
+
+        Returns:
+            SyncResult: Summary of the sync
+
+        Raises:
+            MotionAPIError: If the API request fails
+        """
+        started_at = datetime.now(timezone.utc)
+        full = full or self.store.watermark is None
+        since = None if full else self.store.watermark - self.overlap
+
+        changed: List[Task] = []
+        deleted: List[Union[Task, str]] = []
+        newest: Optional[datetime] = None
+        try:
+            for task in self.client.iter_tasks(updated_since=since):
+                if any(task.metadata.get(flag) for flag in DELETED_FLAGS):
+                    deleted.append(task)
+                else:
+                    changed.append(task)
+                if task.updated_at is not None:
+                    updated_at = _as_utc(task.updated_at)
+                    newest = updated_at if newest is None or updated_at > newest else newest
+        except MotionAPIError as e:
+            logger.error("task_sync_failed", full=full, since=since.isoformat() if since else None, error=str(e))
+            raise
+
+        if full:
+            # A full listing is authoritative: tasks it no longer returns are
+            # deleted as of this sync, even if their stored copy is newer than
+            # the newest task returned.
+            seen = {task.id for task in changed}
+            deleted.extend(
+                task.model_copy(update={"updated_at": started_at})
+                for task_id, task in list(self.store.tasks.items())
+                if task_id not in seen
+            )
+
+        watermark = newest
+        if watermark is None and full:
+            watermark = started_at
+
+        merge = self.store.merge(changed, deleted, watermark)
+        self.store.save()
+
+        logger.info(
+            "task_sync_completed",
+            full=full,
+            fetched=len(changed) + len(deleted),
+            upserted=merge.upserted,
+            deleted=merge.deleted,
+            skipped=merge.skipped,
+            watermark=self.store.watermark.isoformat() if self.store.watermark else None,
+        )
+        return SyncResult(
+            full=full,
+            fetched=len(changed) + len(deleted),
+            merge=merge,
+            watermark=self.store.watermark,
+            started_at=started_at,
+        )
+
+    def get_tasks(self, sync: bool = True) -> TaskCollection:
+        """
+        Get all tasks, served from the local store.
+
+        Args:
+            sync: Whether to run an incremental sync first
+        """
+        if sync:
+            self.sync()
+        return self.store.to_collection()
+
+    def get_tasks_scheduled_for_today(self, sync: bool = True) -> TaskCollection:
+        """
+        Get tasks scheduled for today, served from the local store.
+
+        Args:
+            sync: Whether to run an incremental sync first
+        """
+        return self.get_tasks(sync=sync).filter_by_scheduled_date(datetime.now(timezone.utc))
@@ -1,20 +1,47 @@
 import smtplib
+from dataclasses import replace
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from typing import Optional, List
 from src.utils.config import load_config
+from src.utils.circuit_breaker import CircuitBreakerRegistry, global_circuit_breakers
 from src.utils.logging import get_logger
+from src.utils.retry import RetryPolicy, attempt_timeout
 from src.digest_email.template_engine import EmailTemplateEngine
 
+# Default retry policy for SMTP delivery
+DEFAULT_EMAIL_RETRY_POLICY = RetryPolicy(max_attempts=3, base_delay=1.0, max_delay=10.0)
+
+# Seconds allowed for a single SMTP session (capped by the current deadline)
+SMTP_TIMEOUT = 30.0
+
+
+def _is_transient_smtp_error(error: BaseException) -> bool:
+    """Permanent SMTP rejections (5xx, refused recipients) are not worth retrying."""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    return True
+
+
 # Deprecated: Old SMTP-based sender
 # class EmailSender:
 #     ...
 
 class EmailSender:
-    def __init__(self, config=None, logger=None):
+    def __init__(
+        self,
+        config=None,
+        logger=None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+    ):
         self.config = config or load_config()
         self.logger = logger or get_logger(__name__)
         self.template_engine = EmailTemplateEngine()
+        self.retry_policy = retry_policy or DEFAULT_EMAIL_RETRY_POLICY
+        self.circuit_breakers = circuit_breakers if circuit_breakers is not None else global_circuit_breakers
 
     def send_email(self, subject: str, body: str, recipient: Optional[str] = None, html: Optional[str] = None, retries: int = 3):
         recipient = recipient or self.config.email.recipient_email
@@ -27,10 +54,17 @@ class EmailSender:
         if html:
             part2 = MIMEText(html, 'html')
             msg.attach(part2)
-        attempt = 0
-        while attempt < retries:
+        attempts = 0
+
+        def deliver():
+            nonlocal attempts
+            attempts += 1
             try:
-                with smtplib.SMTP(self.config.email.smtp_host, self.config.email.smtp_port) as server:
+                with smtplib.SMTP(
+                    self.config.email.smtp_host,
+                    self.config.email.smtp_port,
+                    timeout=attempt_timeout(SMTP_TIMEOUT),
+                ) as server:
                     if (
                         self.config.email.smtp_username not in [None, '', 'none']
                         and self.config.email.smtp_password not in [None, '', 'none']
@@ -38,13 +72,22 @@ class EmailSender:
                         server.starttls()
                         server.login(self.config.email.smtp_username, self.config.email.smtp_password)
                     server.sendmail(self.config.email.sender_email, recipient, msg.as_string())
-                self.logger.info("email_sent", to=recipient, subject=subject)
-                return True
             except Exception as e:
-                attempt += 1
-                self.logger.error("email_delivery_failed", to=recipient, subject=subject, attempt=attempt, error=str(e))
-                if attempt >= retries:
-                    raise
+                self.logger.error("email_delivery_failed", to=recipient, subject=subject, attempt=attempts, error=str(e))
+                raise
+
+        # An open breaker raises CircuitOpenError at once instead of waiting on a dead server
+        breaker = self.circuit_breakers.get(f"smtp:{self.config.email.smtp_host}")
+        policy = replace(self.retry_policy, max_attempts=retries)
+        policy.call(
+            breaker.call,
+            deliver,
+            is_failure=_is_transient_smtp_error,
+            operation="smtp_send",
+            retry_on=_is_transient_smtp_error,
+        )
+        self.logger.info("email_sent", to=recipient, subject=subject)
+        return True
 
     def send_templated_email(self, template_name: str, context: dict, recipient: Optional[str] = None, subject: Optional[str] = None, retries: int = 3):
         body = self.template_engine.render(template_name, context, plain=True)
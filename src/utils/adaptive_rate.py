@@ -0,0 +1,295 @@
+"""
+Adaptive, per-endpoint rate control driven by API responses.
+
+Each endpoint gets its own token-bucket limiter whose rate is tuned with AIMD
+(additive increase, multiplicative decrease): a 429 cuts the rate, a run of
+successful responses raises it a little. Services with an account-wide quota
+can instead hand the controller one shared limiter that all of their endpoints
+tune together. Server hints (``Retry-After`` and
+``X-RateLimit-Remaining``/``X-RateLimit-Reset``) pause the endpoint until the
+time the server asked for.
+"""
+
+import asyncio
+import fnmatch
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from src.utils.http_cache import header_value
+from src.utils.logging import get_logger
+from src.utils.rate_limiter import RateLimiter, global_rate_limiter
+
+logger = get_logger(__name__)
+
+# Reset header values above this are epoch timestamps rather than delays
+_EPOCH_THRESHOLD = 1_000_000_000
+
+
+@dataclass(frozen=True)
+class RatePolicy:
+    """AIMD tuning parameters for a group of endpoints (rates in requests/minute)."""
+    initial_rate: float = 12.0
+    min_rate: float = 1.0
+    max_rate: float = 60.0
+    increase: float = 1.0
+    decrease: float = 0.5
+    success_threshold: int = 10
+
+
+class _EndpointState:
+    """Mutable rate state of a single endpoint."""
+
+    __slots__ = (
+        "policy", "limiter", "base_rate", "base_burst", "blocked_until", "successes", "throttled",
+    )
+
+    def __init__(self, policy: RatePolicy, limiter: Optional[RateLimiter] = None):
+        self.policy = policy
+        self.limiter = limiter or RateLimiter(requests_per_minute=policy.initial_rate)
+        self.base_rate = self.limiter.requests_per_minute
+        self.base_burst = self.limiter.burst
+        self.blocked_until = 0.0
+        self.successes = 0
+        self.throttled = 0
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse a Retry-After header into seconds from now.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date
+        now: Current wall-clock time (defaults to time.time())
+
+    Returns:
+        Optional[float]: Non-negative delay in seconds, or None if unparseable
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    now = time.time() if now is None else now
+    return max(0.0, when.timestamp() - now)
+
+
+def parse_rate_limit_reset(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """
+    Parse an X-RateLimit-Reset header into seconds from now.
+
+    Accepts either an epoch timestamp or a number of seconds until the reset.
+    """
+    if not value:
+        return None
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+    if reset >= _EPOCH_THRESHOLD:
+        now = time.time() if now is None else now
+        return max(0.0, reset - now)
+    return max(0.0, reset)
+
+
+class AdaptiveRateController:
+    """
+    Tunes per-endpoint request rates from observed responses.
+
+    Callers ``acquire(endpoint)`` before each request and report the outcome with
+    ``record_response(endpoint, status_code, headers)``. Endpoints are grouped into
+    policies by glob pattern (first match wins); unmatched endpoints use the
+    default policy. Endpoints matching a pattern in ``shared_limiters`` share that
+    limiter, and one rate state, instead of getting their own.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Mapping[str, RatePolicy]] = None,
+        default_policy: Optional[RatePolicy] = None,
+        clock: Callable[[], float] = time.monotonic,
+        shared_limiters: Optional[Mapping[str, RateLimiter]] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            policies: AIMD policies keyed by endpoint glob pattern
+            default_policy: Policy for endpoints matching no pattern
+            clock: Monotonic clock used for server-requested pauses
+            shared_limiters: Existing limiters to tune, keyed by endpoint glob
+                pattern (e.g. an account-wide quota)
+        """
+        self.policies = dict(policies or {})
+        self.default_policy = default_policy or RatePolicy()
+        self.shared_limiters = dict(shared_limiters or {})
+        self._shared_rates = {
+            pattern: (limiter.requests_per_minute, limiter.burst)
+            for pattern, limiter in self.shared_limiters.items()
+        }
+        self._clock = clock
+        self._states: Dict[str, _EndpointState] = {}
+        self._shared_states: Dict[str, _EndpointState] = {}
+        self._lock = threading.Lock()
+
+    def policy_for(self, endpoint: str) -> RatePolicy:
+        """Get the policy that applies to an endpoint."""
+        for pattern, policy in self.policies.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return policy
+        return self.default_policy
+
+    def _shared_pattern(self, endpoint: str) -> Optional[str]:
+        for pattern in self.shared_limiters:
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return pattern
+        return None
+
+    def _state(self, endpoint: str) -> _EndpointState:
+        state = self._states.get(endpoint)
+        if state is None:
+            with self._lock:
+                state = self._states.get(endpoint)
+                if state is None:
+                    pattern = self._shared_pattern(endpoint)
+                    if pattern is None:
+                        state = _EndpointState(self.policy_for(endpoint))
+                    else:
+                        state = self._shared_states.get(pattern)
+                        if state is None:
+                            state = _EndpointState(self.policy_for(endpoint), self.shared_limiters[pattern])
+                            self._shared_states[pattern] = state
+                    self._states[endpoint] = state
+        return state
+
+    def retry_after(self, endpoint: str) -> float:
+        """Seconds until the endpoint may be called again (0 if not paused)."""
+        state = self._state(endpoint)
+        paused = max(0.0, state.blocked_until - self._clock())
+        return max(paused, state.limiter.get_current_usage()[1])
+
+    def acquire(self, endpoint: str, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for permission to call an endpoint.
+
+        Args:
+            endpoint: Endpoint key
+            wait: Whether to wait for a server-requested pause or a token
+            timeout: Maximum number of seconds to wait in total
+
+        Returns:
+            bool: True if the request may proceed
+        """
+        state = self._state(endpoint)
+        pause = max(0.0, state.blocked_until - self._clock())
+        if pause > 0:
+            if not wait or (timeout is not None and pause > timeout):
+                return False
+            logger.warning("rate_limit_paused", endpoint=endpoint, wait_time=pause)
+            time.sleep(pause)
+            timeout = None if timeout is None else timeout - pause
+        return state.limiter.acquire(wait=wait, timeout=timeout)
+
+    async def acquire_async(self, endpoint: str, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """Asynchronous variant of ``acquire`` that does not block the event loop."""
+        state = self._state(endpoint)
+        pause = max(0.0, state.blocked_until - self._clock())
+        if pause > 0:
+            if not wait or (timeout is not None and pause > timeout):
+                return False
+            logger.warning("rate_limit_paused", endpoint=endpoint, wait_time=pause)
+            await asyncio.sleep(pause)
+            timeout = None if timeout is None else timeout - pause
+        return await state.limiter.acquire_async(wait=wait, timeout=timeout)
+
+    def record_response(
+        self,
+        endpoint: str,
+        status_code: Optional[int],
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Update an endpoint's rate from a response.
+
+        Args:
+            endpoint: Endpoint key
+            status_code: HTTP status code of the response (None for network errors)
+            headers: Response headers
+        """
+        if not isinstance(status_code, int):
+            return
+        state = self._state(endpoint)
+        policy = state.policy
+        now = time.time()
+        pause = parse_retry_after(header_value(headers, "Retry-After"), now)
+        remaining = header_value(headers, "X-RateLimit-Remaining")
+        if pause is None and (status_code == 429 or remaining == "0"):
+            pause = parse_rate_limit_reset(header_value(headers, "X-RateLimit-Reset"), now)
+
+        with self._lock:
+            rate = state.limiter.requests_per_minute
+            if status_code == 429:
+                state.throttled += 1
+                state.successes = 0
+                rate = max(policy.min_rate, rate * policy.decrease)
+            elif status_code < 400:
+                state.successes += 1
+                if state.successes >= policy.success_threshold:
+                    state.successes = 0
+                    rate = min(policy.max_rate, rate + policy.increase)
+            if pause:
+                state.blocked_until = max(state.blocked_until, self._clock() + pause)
+
+        if rate != state.limiter.requests_per_minute:
+            # Scale the burst with the rate so the bucket's tolerance (in seconds)
+            # does not grow when the rate is cut
+            burst = max(1, round(state.base_burst * rate / state.base_rate))
+            state.limiter.set_rate(rate, burst=burst)
+            logger.info(
+                "rate_limit_adjusted",
+                endpoint=endpoint,
+                requests_per_minute=rate,
+                status_code=status_code,
+            )
+        if pause:
+            logger.warning("rate_limit_server_pause", endpoint=endpoint, wait_time=pause)
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current rate state of every endpoint seen so far."""
+        now = self._clock()
+        with self._lock:
+            states = dict(self._states)
+        return {
+            endpoint: {
+                "requests_per_minute": state.limiter.requests_per_minute,
+                "paused_for": max(0.0, state.blocked_until - now),
+                "throttled": state.throttled,
+            }
+            for endpoint, state in states.items()
+        }
+
+    def reset(self) -> None:
+        """Forget all learned rates and pauses, restoring shared limiters' rates."""
+        with self._lock:
+            self._states.clear()
+            self._shared_states.clear()
+        for pattern, limiter in self.shared_limiters.items():
+            limiter.set_rate(*self._shared_rates[pattern])
+
+
+# Shared controller for outbound API clients; endpoints are keyed "<service>:<path>".
+# Motion's quota is account-wide, so all its endpoints tune the global limiter.
+global_rate_controller = AdaptiveRateController(
+    policies={
+        "motion:*": RatePolicy(initial_rate=12.0, min_rate=1.0, max_rate=60.0),
+        "weather:*": RatePolicy(initial_rate=60.0, min_rate=1.0, max_rate=300.0),
+    },
+    shared_limiters={"motion:*": global_rate_limiter},
+)
@@ -0,0 +1,292 @@
+"""
+Circuit breakers for outbound dependencies (Motion, Weather, SMTP).
+
+A breaker watches the outcomes of recent calls in a rolling time window. When
+the error rate crosses a threshold it opens and rejects calls immediately
+instead of letting every caller wait through timeouts and retries. After a
+cool-down it lets a few trial calls through (half-open); a success closes it
+again, a failure reopens it.
+"""
+
+import threading
+import time
+from collections import deque
+from enum import Enum
+from typing import Any, Callable, Deque, Dict, Tuple, TypeVar
+
+from src.utils.exceptions import CircuitOpenError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class CircuitState(str, Enum):
+    """States of a circuit breaker."""
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker with a rolling error-rate window.
+
+    The breaker opens when, within the last ``window`` seconds, at least
+    ``minimum_calls`` calls were recorded and the fraction of failures reached
+    ``failure_threshold``.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 60.0,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the breaker.
+
+        Args:
+            name: Breaker name, e.g. "motion:/tasks"
+            failure_threshold: Failure rate (0-1) at which the breaker opens
+            minimum_calls: Calls required in the window before the rate counts
+            window: Length of the rolling window in seconds
+            open_timeout: Seconds to stay open before allowing trial calls
+            half_open_max_calls: Concurrent trial calls allowed when half-open
+            clock: Monotonic clock (overridable for tests)
+        """
+        if not 0 < failure_threshold <= 1:
+            raise ValueError("failure_threshold must be in (0, 1]")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.minimum_calls = minimum_calls
+        self.window = window
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._failures = 0
+        self._state = CircuitState.CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._rejected = 0
+
+    def _trim(self, now: float) -> None:
+        """Drop outcomes older than the window. Caller holds the lock."""
+        cutoff = now - self.window
+        while self._outcomes and self._outcomes[0][0] < cutoff:
+            _, ok = self._outcomes.popleft()
+            if not ok:
+                self._failures -= 1
+
+    def _transition(self, state: CircuitState, now: float) -> None:
+        """Change state and log it. Caller holds the lock."""
+        if state is self._state:
+            return
+        previous = self._state
+        self._state = state
+        self._trials = 0
+        if state is CircuitState.OPEN:
+            self._opened_at = now
+        elif state is CircuitState.CLOSED:
+            self._outcomes.clear()
+            self._failures = 0
+        log = logger.warning if state is CircuitState.OPEN else logger.info
+        log("circuit_state_changed", breaker=self.name, previous=previous.value, state=state.value)
+
+    def _current_state(self, now: float) -> CircuitState:
+        """Resolve the state, moving open to half-open after the timeout. Caller holds the lock."""
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.open_timeout:
+            self._transition(CircuitState.HALF_OPEN, now)
+            self._opened_at = now
+        return self._state
+
+    @property
+    def state(self) -> CircuitState:
+        """Current breaker state."""
+        with self._lock:
+            return self._current_state(self._clock())
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker will admit a trial call (0 if not open)."""
+        with self._lock:
+            now = self._clock()
+            if self._current_state(now) is not CircuitState.OPEN:
+                return 0.0
+            return max(0.0, self._opened_at + self.open_timeout - now)
+
+    def allow_request(self) -> bool:
+        """
+        Check whether a call may proceed, reserving a trial slot when half-open.
+
+        Every admitted call must be followed by ``record_success``,
+        ``record_failure`` or ``release``.
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state is CircuitState.CLOSED:
+                return True
+            if state is CircuitState.HALF_OPEN:
+                # Re-admit trials whose outcome never arrived within the timeout
+                if self._trials >= self.half_open_max_calls and now - self._opened_at >= self.open_timeout:
+                    self._trials = 0
+                    self._opened_at = now
+                if self._trials < self.half_open_max_calls:
+                    self._trials += 1
+                    return True
+            self._rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        with self._lock:
+            now = self._clock()
+            if self._current_state(now) is CircuitState.HALF_OPEN:
+                self._transition(CircuitState.CLOSED, now)
+                return
+            self._outcomes.append((now, True))
+            self._trim(now)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the breaker if the error rate is too high."""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state is CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN, now)
+                return
+            self._outcomes.append((now, False))
+            self._failures += 1
+            self._trim(now)
+            calls = len(self._outcomes)
+            if (
+                state is CircuitState.CLOSED
+                and calls >= self.minimum_calls
+                and self._failures / calls >= self.failure_threshold
+            ):
+                self._transition(CircuitState.OPEN, now)
+
+    def release(self) -> None:
+        """Give back an admitted call that never reached the dependency."""
+        with self._lock:
+            if self._state is CircuitState.HALF_OPEN and self._trials > 0:
+                self._trials -= 1
+
+    def open_error(self) -> CircuitOpenError:
+        """Build the error raised for a rejected call."""
+        return CircuitOpenError(
+            message=f"Circuit breaker '{self.name}' is open",
+            breaker=self.name,
+            retry_after=self.retry_after(),
+        )
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        is_failure: Callable[[BaseException], bool] = lambda e: True,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Call ``func`` through the breaker.
+
+        Args:
+            func: Function to call
+            is_failure: Predicate deciding whether an exception counts against
+                the dependency (e.g. a 404 should not)
+
+        Raises:
+            CircuitOpenError: If the breaker rejects the call
+        """
+        if not self.allow_request():
+            raise self.open_error()
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            if is_failure(e):
+                self.record_failure()
+            else:
+                self.record_success()
+            raise
+        except BaseException:
+            # Interrupted (KeyboardInterrupt, SystemExit, cancellation): no outcome
+            self.release()
+            raise
+        self.record_success()
+        return result
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get the breaker's state and rolling-window statistics."""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            self._trim(now)
+            calls = len(self._outcomes)
+            return {
+                "state": state.value,
+                "calls": calls,
+                "failures": self._failures,
+                "failure_rate": self._failures / calls if calls else 0.0,
+                "rejected": self._rejected,
+                "retry_after": (
+                    max(0.0, self._opened_at + self.open_timeout - now)
+                    if state is CircuitState.OPEN else 0.0
+                ),
+            }
+
+    def reset(self) -> None:
+        """Close the breaker and forget all recorded outcomes."""
+        with self._lock:
+            self._state = CircuitState.CLOSED
+            self._outcomes.clear()
+            self._failures = 0
+            self._trials = 0
+            self._rejected = 0
+
+
+class CircuitBreakerRegistry:
+    """Creates and holds one breaker per name, sharing default settings."""
+
+    def __init__(self, **defaults: Any):
+        """
+        Initialize the registry.
+
+        Args:
+            **defaults: Keyword arguments passed to every new CircuitBreaker
+        """
+        self.defaults = defaults
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str) -> CircuitBreaker:
+        """Get the breaker for a name, creating it on first use."""
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.get(name)
+                if breaker is None:
+                    breaker = CircuitBreaker(name, **self.defaults)
+                    self._breakers[name] = breaker
+        return breaker
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the state of every breaker, keyed by name."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.snapshot() for name, breaker in sorted(breakers.items())}
+
+    def reset(self) -> None:
+        """Close and forget all breakers."""
+        with self._lock:
+            self._breakers.clear()
+
+
+# Shared breakers for outbound dependencies; names are "<service>:<endpoint>"
+global_circuit_breakers = CircuitBreakerRegistry()
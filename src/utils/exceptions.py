@@ -5,8 +5,9 @@ This module provides domain-specific exceptions and utilities for consistent
 error handling across the application.
 """
 
-from typing import Any, Dict, Optional, Type
-import time
+import functools
+import inspect
+from typing import Any, Callable, Dict, Optional, Type
 
 # from src.utils.logging import get_logger
 # logger = get_logger(__name__)
@@ -168,6 +169,48 @@ class ValidationError(DailyDigestError):
         )
 
 
+class DeadlineExceededError(DailyDigestError):
+    """Raised when an operation's overall time budget has run out."""
+    
+    def __init__(
+        self,
+        message: str,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None,
+    ):
+        super().__init__(
+            message=message,
+            error_code="DEADLINE_EXCEEDED",
+            details=details,
+            cause=cause,
+        )
+
+
+class CircuitOpenError(DailyDigestError):
+    """Raised when a call is rejected because its circuit breaker is open."""
+    
+    def __init__(
+        self,
+        message: str,
+        breaker: str,
+        retry_after: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None,
+        cause: Optional[Exception] = None,
+    ):
+        self.breaker = breaker
+        self.retry_after = retry_after
+        super().__init__(
+            message=message,
+            error_code="CIRCUIT_OPEN",
+            details={
+                "breaker": breaker,
+                "retry_after": retry_after,
+                **(details or {}),
+            },
+            cause=cause,
+        )
+
+
 def handle_error(
     error: Exception,
     default_error: Type[DailyDigestError] = DailyDigestError,
@@ -217,54 +260,98 @@ def handle_error(
         )
 
 
+def retry_on_status(*statuses: int) -> Callable[[Exception], bool]:
+    """
+    Build a ``retry_if`` predicate that retries errors carrying one of the given statuses.
+    
+    Errors without a status code (network failures, timeouts) are retried too.
+    
+    Args:
+        statuses: HTTP status codes worth retrying.
+    """
+    wanted = frozenset(statuses)
+    
+    def predicate(error: Exception) -> bool:
+        status = getattr(error, "status_code", None)
+        return status is None or status in wanted
+    
+    return predicate
+
+
 def retry_on_error(
     max_attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple[Type[Exception], ...] = (Exception,),
+    jitter: Optional[str] = None,
+    max_delay: Optional[float] = None,
+    deadline: Optional[float] = None,
+    retry_if: Optional[Callable[[Exception], bool]] = None,
+    on_attempt: Optional[Callable[[Dict[str, Any]], None]] = None,
 ):
     """
     Decorator for retrying functions on specific exceptions.
     
+    Works on both regular functions and coroutine functions; coroutines wait
+    with ``asyncio.sleep`` so the event loop is never blocked. Retries run
+    under a ``src.utils.retry.RetryPolicy`` and the caller's current deadline.
+    
     Args:
         max_attempts: Maximum number of retry attempts.
         delay: Initial delay between retries in seconds.
         backoff: Multiplier for delay after each retry.
         exceptions: Tuple of exceptions to catch and retry on.
+        jitter: None for fixed exponential delays, "full" for a uniform delay in
+            [0, backoff delay], or "decorrelated" for delays drawn between
+            ``delay`` and three times the previous delay.
+        max_delay: Upper bound on any single delay.
+        deadline: Total seconds the call may take, counted from the first
+            attempt; it can only tighten an enclosing ``deadline()`` scope.
+            No retry is started that would sleep past it.
+        retry_if: Predicate on the caught exception deciding whether it is
+            worth retrying, e.g. ``retry_on_status(429, 503)``.
+        on_attempt: Callback receiving a metrics dict (operation, attempt,
+            outcome, elapsed, delay, status_code, error) after every attempt.
     """
+    # Imported lazily: the retry module depends on the exceptions defined here
+    from src.utils.retry import RetryPolicy, deadline as time_budget
+    
+    policy = RetryPolicy(
+        max_attempts=max_attempts,
+        base_delay=delay,
+        max_delay=float("inf") if max_delay is None else max_delay,
+        multiplier=backoff,
+        jitter=jitter or False,
+    )
+    retry_on = retry_if or (lambda error: True)
+    
     def decorator(func):
-        def wrapper(*args, **kwargs):
-            current_delay = delay
-            last_exception = None
+        options = {
+            "operation": func.__name__,
+            "retry_on": retry_on,
+            "exceptions": exceptions,
+            "on_attempt": on_attempt,
+        }
+        
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with time_budget(deadline):
+                    try:
+                        return await policy.call_async(functools.partial(func, *args, **kwargs), **options)
+                    except exceptions as e:
+                        raise handle_error(e)
             
-            for attempt in range(max_attempts):
+            return async_wrapper
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with time_budget(deadline):
                 try:
-                    return func(*args, **kwargs)
+                    return policy.call(functools.partial(func, *args, **kwargs), **options)
                 except exceptions as e:
-                    last_exception = e
-                    if attempt < max_attempts - 1:
-                        logger.warning(
-                            "retry_attempt",
-                            function=func.__name__,
-                            attempt=attempt + 1,
-                            max_attempts=max_attempts,
-                            delay=current_delay,
-                            error=str(e),
-                        )
-                        time.sleep(current_delay)
-                        current_delay *= backoff
-                    else:
-                        logger.error(
-                            "max_retries_exceeded",
-                            function=func.__name__,
-                            max_attempts=max_attempts,
-                            error=str(e),
-                        )
-                        raise handle_error(e)
-            
-            # This should never be reached due to the raise in the loop
-            raise last_exception  # type: ignore
+                    raise handle_error(e)
         
         return wrapper
     
-    return decorator 
\ No newline at end of file
+    return decorator
@@ -0,0 +1,422 @@
+"""
+HTTP response cache for API GET requests.
+
+This module provides a pluggable, tiered cache for parsed API responses. Entries
+are keyed on method, URL and normalized query parameters, expire after a
+per-endpoint TTL, and carry ETag/Last-Modified validators so that stale entries
+can be revalidated with a conditional request instead of a full refetch.
+"""
+
+import fnmatch
+import hashlib
+import json
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, replace
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheEntry:
+    """A cached API response."""
+    key: str
+    endpoint: str
+    value: Any
+    stored_at: float
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """Check whether the entry can be served without revalidation."""
+        return (now if now is not None else time.time()) < self.expires_at
+
+    def can_revalidate(self) -> bool:
+        """Check whether the entry has validators for a conditional request."""
+        return bool(self.etag or self.last_modified)
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for revalidation."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheBackend:
+    """Interface for cache storage tiers."""
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        raise NotImplementedError
+
+    def set(self, entry: CacheEntry) -> int:
+        """Store an entry and return the number of entries evicted to make room."""
+        raise NotImplementedError
+
+    def delete_endpoint(self, endpoint: str) -> int:
+        """Delete all entries for an endpoint and return how many were removed."""
+        raise NotImplementedError
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Thread-safe in-memory LRU cache tier.
+
+    Values are stored pickled, so callers mutating a parsed response cannot
+    change what later lookups see, and each hit unpickles a private copy
+    instead of deep-copying the payload.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[CacheEntry, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is None:
+                return None
+            self._entries.move_to_end(key)
+        entry, value = stored
+        return replace(entry, value=pickle.loads(value))
+
+    def set(self, entry: CacheEntry) -> int:
+        evicted = 0
+        try:
+            value = pickle.dumps(entry.value, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning("memory_cache_write_failed", key=entry.key, error=str(e))
+            return 0
+        with self._lock:
+            self._entries[entry.key] = (replace(entry, value=None), value)
+            self._entries.move_to_end(entry.key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+        return evicted
+
+    def delete_endpoint(self, endpoint: str) -> int:
+        with self._lock:
+            keys = [k for k, (e, _) in self._entries.items() if e.endpoint == endpoint]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DiskCacheBackend(CacheBackend):
+    """
+    On-disk cache tier storing one JSON file per entry.
+
+    Entries are named by the hash of their key, so a lookup opens one known
+    path. Each entry also gets an empty marker file named by the endpoint hash,
+    so all entries for an endpoint can be invalidated without reading every file.
+
+    The entry count is tracked in memory (seeded by one directory scan), so
+    writes only scan the directory when the limit is exceeded; eviction then
+    trims to 90% of ``max_entries`` so the scan is amortized over later writes.
+    """
+
+    def __init__(self, directory: Path, max_entries: int = 1024):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.directory = Path(directory)
+        self.max_entries = max_entries
+        self._count: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _digest(value: str) -> str:
+        return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{self._digest(key)}.json"
+
+    def _marker(self, endpoint: str, key: str) -> Path:
+        return self.directory / f"{self._digest(endpoint)[:16]}_{self._digest(key)}.endpoint"
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return CacheEntry(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as e:
+            logger.warning("disk_cache_read_failed", path=str(path), error=str(e))
+            return None
+
+    def set(self, entry: CacheEntry) -> int:
+        with self._lock:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(entry.key)
+            tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+            if self._count is None:
+                self._count = sum(1 for _ in self.directory.glob("*.json"))
+            existed = path.exists()
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(asdict(entry), f)
+                os.replace(tmp_path, path)
+                self._marker(entry.endpoint, entry.key).touch()
+            except (OSError, TypeError, ValueError) as e:
+                logger.warning("disk_cache_write_failed", path=str(path), error=str(e))
+                return 0
+            if not existed:
+                self._count += 1
+            if self._count <= self.max_entries:
+                return 0
+            return self._evict()
+
+    def _evict(self) -> int:
+        files = list(self.directory.glob("*.json"))
+        excess = len(files) - max(1, int(self.max_entries * 0.9))
+        if excess <= 0:
+            self._count = len(files)
+            return 0
+        files.sort(key=lambda p: p.stat().st_mtime)
+        evicted = {path.stem for path in files[:excess]}
+        for path in files[:excess]:
+            path.unlink(missing_ok=True)
+        for marker in self.directory.glob("*.endpoint"):
+            if marker.stem.split("_", 1)[1] in evicted:
+                marker.unlink(missing_ok=True)
+        self._count = len(files) - excess
+        return excess
+
+    def delete_endpoint(self, endpoint: str) -> int:
+        if not self.directory.exists():
+            return 0
+        removed = 0
+        with self._lock:
+            for marker in self.directory.glob(f"{self._digest(endpoint)[:16]}_*.endpoint"):
+                path = self.directory / f"{marker.stem.split('_', 1)[1]}.json"
+                if path.exists():
+                    path.unlink(missing_ok=True)
+                    removed += 1
+                marker.unlink(missing_ok=True)
+            if self._count is not None:
+                self._count = max(0, self._count - removed)
+        return removed
+
+    def clear(self) -> None:
+        if not self.directory.exists():
+            return
+        with self._lock:
+            for pattern in ("*.json", "*.endpoint"):
+                for path in self.directory.glob(pattern):
+                    path.unlink(missing_ok=True)
+            self._count = 0
+
+
+class ResponseCache:
+    """
+    Tiered cache for parsed API GET responses.
+
+    Lookups check each tier in order (memory first) and promote hits from slower
+    tiers. TTLs are chosen per endpoint using glob patterns such as ``/tasks/*``;
+    the first matching pattern wins, falling back to ``default_ttl``.
+    """
+
+    def __init__(
+        self,
+        tiers: Optional[List[CacheBackend]] = None,
+        default_ttl: float = 60.0,
+        endpoint_ttls: Optional[Mapping[str, float]] = None,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            tiers: Cache tiers, fastest first. Defaults to a single in-memory LRU.
+            default_ttl: TTL in seconds for endpoints without a specific TTL.
+            endpoint_ttls: Mapping of endpoint glob patterns to TTLs in seconds.
+        """
+        self.tiers = tiers if tiers is not None else [MemoryCacheBackend()]
+        self.default_ttl = default_ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self._stats = {
+            "hits": 0,
+            "misses": 0,
+            "stale": 0,
+            "revalidated": 0,
+            "stores": 0,
+            "evictions": 0,
+            "invalidations": 0,
+        }
+        self._stats_lock = threading.Lock()
+
+    @classmethod
+    def from_env(
+        cls,
+        prefix: str = "MOTION_CACHE_",
+        endpoint_ttls: Optional[Mapping[str, float]] = None,
+    ) -> Optional["ResponseCache"]:
+        """
+        Create a cache from environment variables, or None if caching is disabled.
+
+        Recognized variables (with the given prefix): ENABLED, TTL, MAX_ENTRIES and
+        DIR (enables the on-disk tier).
+        """
+        if os.getenv(f"{prefix}ENABLED", "false").lower() != "true":
+            return None
+        max_entries = int(os.getenv(f"{prefix}MAX_ENTRIES", "256"))
+        tiers: List[CacheBackend] = [MemoryCacheBackend(max_entries=max_entries)]
+        cache_dir = os.getenv(f"{prefix}DIR")
+        if cache_dir:
+            tiers.append(DiskCacheBackend(Path(cache_dir), max_entries=max_entries * 4))
+        return cls(
+            tiers=tiers,
+            default_ttl=float(os.getenv(f"{prefix}TTL", "60")),
+            endpoint_ttls=endpoint_ttls,
+        )
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        vary: Optional[str] = None,
+    ) -> str:
+        """
+        Build a cache key from the request.
+
+        Parameters are normalized by dropping None values, stringifying values and
+        sorting, so equivalent requests share a key regardless of argument order.
+        """
+        normalized = sorted(
+            (str(k), str(v)) for k, v in (params or {}).items() if v is not None
+        )
+        return json.dumps([method.upper(), url, normalized, vary or ""], separators=(",", ":"))
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the TTL for an endpoint."""
+        for pattern, ttl in self.endpoint_ttls.items():
+            if fnmatch.fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    def _count(self, stat: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self._stats[stat] += amount
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """
+        Look up an entry, fresh or stale.
+
+        Fresh entries count as hits; stale entries are returned so the caller can
+        revalidate them, and count as stale.
+        """
+        for index, tier in enumerate(self.tiers):
+            entry = tier.get(key)
+            if entry is None:
+                continue
+            for faster in self.tiers[:index]:
+                self._count("evictions", faster.set(entry))
+            if entry.is_fresh():
+                self._count("hits")
+            else:
+                self._count("stale")
+            return entry
+        self._count("misses")
+        return None
+
+    def store(
+        self,
+        key: str,
+        endpoint: str,
+        value: Any,
+        headers: Optional[Mapping[str, Any]] = None,
+    ) -> CacheEntry:
+        """Store a response with validators taken from its headers."""
+        now = time.time()
+        entry = CacheEntry(
+            key=key,
+            endpoint=endpoint,
+            value=value,
+            stored_at=now,
+            expires_at=now + self.ttl_for(endpoint),
+            etag=header_value(headers, "ETag"),
+            last_modified=header_value(headers, "Last-Modified"),
+        )
+        self._write(entry)
+        self._count("stores")
+        return entry
+
+    def refresh(self, entry: CacheEntry, headers: Optional[Mapping[str, Any]] = None) -> CacheEntry:
+        """Extend a stale entry after the server confirmed it is unchanged (304)."""
+        now = time.time()
+        entry.stored_at = now
+        entry.expires_at = now + self.ttl_for(entry.endpoint)
+        entry.etag = header_value(headers, "ETag") or entry.etag
+        entry.last_modified = header_value(headers, "Last-Modified") or entry.last_modified
+        self._write(entry)
+        self._count("revalidated")
+        return entry
+
+    def _write(self, entry: CacheEntry) -> None:
+        for tier in self.tiers:
+            self._count("evictions", tier.set(entry))
+
+    def invalidate(self, endpoints: Iterable[str]) -> int:
+        """
+        Remove all cached entries for the given endpoints.
+
+        Args:
+            endpoints: Endpoint paths (e.g. ``/tasks``, ``/tasks/abc``)
+
+        Returns:
+            int: Number of entries removed across all tiers
+        """
+        removed = 0
+        for endpoint in endpoints:
+            for tier in self.tiers:
+                removed += tier.delete_endpoint(endpoint)
+        self._count("invalidations", removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove all entries from every tier."""
+        for tier in self.tiers:
+            tier.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics including the hit ratio."""
+        with self._stats_lock:
+            stats: Dict[str, Any] = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"] + stats["stale"]
+        stats["hit_ratio"] = (stats["hits"] + stats["revalidated"]) / lookups if lookups else 0.0
+        return stats
+
+
+def header_value(headers: Optional[Mapping[str, Any]], name: str) -> Optional[str]:
+    """Read a string header value, ignoring missing or non-string values."""
+    if not headers:
+        return None
+    try:
+        value = headers.get(name)
+    except AttributeError:
+        return None
+    return value if isinstance(value, str) and value else None
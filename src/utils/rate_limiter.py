@@ -1,10 +1,14 @@
-"""Rate limiter implementation using a sliding window approach."""
+"""Rate limiter implementation using the generic cell rate algorithm (GCRA)."""
 
+import asyncio
+import math
+import os
 import time
-from collections import deque
+from pathlib import Path
 from threading import Lock
-from typing import Optional, Deque
+from typing import Callable, Optional, Tuple
 
+from src.utils.exceptions import ConfigurationError
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -12,92 +16,220 @@ logger = get_logger(__name__)
 
 class RateLimiter:
     """
-    A thread-safe rate limiter using a sliding window approach.
-    
-    This implementation uses a deque to store timestamps of requests within the window.
-    It automatically removes timestamps that are outside the window when checking limits.
+    A thread-safe token-bucket rate limiter (GCRA formulation).
+
+    The bucket holds up to ``burst`` tokens and refills at ``requests_per_minute``.
+    Instead of tracking a window of timestamps, the limiter keeps a single
+    theoretical arrival time (TAT). Acquiring a token reserves the next free slot
+    under the lock in O(1) and returns; any waiting happens after the lock is
+    released. Because slots are handed out in the order callers reserve them,
+    waiters are served first-in, first-out.
     """
 
-    def __init__(self, requests_per_minute: int = 12):
+    def __init__(
+        self,
+        requests_per_minute: int = 12,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
         """
         Initialize the rate limiter.
-        
+
         Args:
-            requests_per_minute: Maximum number of requests allowed per minute.
+            requests_per_minute: Maximum sustained number of requests per minute.
+            burst: Maximum number of requests allowed back to back (defaults to
+                requests_per_minute, i.e. a full minute's budget).
+            clock: Monotonic clock used for timing (overridable for tests).
         """
-        self.requests_per_minute = requests_per_minute
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
         self.window_size = 60  # 1 minute in seconds
-        self.timestamps: Deque[float] = deque()
         self.lock = Lock()
+        self._clock = clock
+        self._tat = 0.0
+        self._configure(requests_per_minute, burst)
+
+    def _configure(self, requests_per_minute: float, burst: Optional[int]) -> None:
+        """Set the rate and burst. Caller must hold the lock (or be in __init__)."""
+        self.requests_per_minute = requests_per_minute
+        self.burst = max(1, burst if burst is not None else int(requests_per_minute))
+        self._interval = self.window_size / requests_per_minute
+        self._tolerance = self._interval * (self.burst - 1)
+
+    def set_rate(self, requests_per_minute: float, burst: Optional[int] = None) -> None:
+        """
+        Change the permitted rate without discarding outstanding reservations.
+
+        Args:
+            requests_per_minute: New sustained rate.
+            burst: New burst size (defaults to keeping the current burst).
+        """
+        if requests_per_minute <= 0:
+            raise ValueError("requests_per_minute must be positive")
+        with self.lock:
+            self._configure(requests_per_minute, burst if burst is not None else self.burst)
 
     def reset(self) -> None:
-        """Reset the rate limiter by clearing all timestamps."""
+        """Reset the rate limiter to a full bucket."""
         with self.lock:
-            self.timestamps.clear()
+            self._tat = 0.0
 
-    def _clean_old_timestamps(self, current_time: float) -> None:
-        """Remove timestamps that are outside the current window."""
-        cutoff_time = current_time - self.window_size
-        while self.timestamps and self.timestamps[0] < cutoff_time:
-            self.timestamps.popleft()
+    def _reserve(self, max_wait: Optional[float]) -> Optional[Tuple[float, float]]:
+        """
+        Reserve the next slot if it is available within ``max_wait`` seconds.
 
-    def acquire(self, wait: bool = True) -> bool:
+        Returns:
+            Optional[Tuple[float, float]]: Seconds to wait before proceeding and the
+                TAT written by this reservation, or None if the slot is further
+                away than ``max_wait`` (nothing is reserved).
+        """
+        with self.lock:
+            now = self._clock()
+            tat = max(self._tat, now)
+            delay = max(0.0, tat - self._tolerance - now)
+            if max_wait is not None and delay > max_wait:
+                return None
+            self._tat = tat + self._interval
+            return delay, self._tat
+
+    def _release(self, reserved_tat: float) -> None:
+        """
+        Give back a reservation if nothing was reserved after it.
+
+        Once a later caller has reserved, their slot was computed from this
+        one, so the reservation is kept rather than rolling back theirs.
+        """
+        with self.lock:
+            if self._tat == reserved_tat:
+                self._tat = max(self._clock(), reserved_tat - self._interval)
+
+    def _would_wait(self) -> bool:
+        """Lock-free check whether the bucket is currently empty."""
+        return self._tat - self._tolerance > self._clock()
+
+    def acquire(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
         """
         Try to acquire a rate limit token.
-        
+
         Args:
             wait: If True, wait until a token is available. If False, return immediately
                  if no token is available.
-        
+            timeout: Maximum number of seconds to wait (None waits as long as needed).
+
         Returns:
-            bool: True if a token was acquired, False if not (and wait=False).
+            bool: True if a token was acquired, False if not (wait=False or timeout).
         """
-        with self.lock:
-            current_time = time.time()
-            self._clean_old_timestamps(current_time)
-            
-            if len(self.timestamps) < self.requests_per_minute:
-                self.timestamps.append(current_time)
-                return True
-            
-            if not wait:
-                return False
-            
-            # Calculate wait time until next available token
-            oldest_timestamp = self.timestamps[0]
-            wait_time = oldest_timestamp + self.window_size - current_time
-            
-            if wait_time > 0:
+        # Fast path: reject non-blocking callers without touching the lock
+        if not wait and self._would_wait():
+            return False
+
+        reservation = self._reserve(0.0 if not wait else timeout)
+        if reservation is None:
+            if wait:
                 logger.warning(
-                    "rate_limit_wait",
-                    wait_time=wait_time,
-                    current_requests=len(self.timestamps),
+                    "rate_limit_timeout",
+                    timeout=timeout,
                     max_requests=self.requests_per_minute,
                 )
-                time.sleep(wait_time)
-                return self.acquire(wait=True)
-            
             return False
 
+        delay = reservation[0]
+        if delay > 0:
+            logger.warning(
+                "rate_limit_wait",
+                wait_time=delay,
+                max_requests=self.requests_per_minute,
+            )
+            time.sleep(delay)
+        return True
+
+    async def acquire_async(self, wait: bool = True, timeout: Optional[float] = None) -> bool:
+        """
+        Try to acquire a rate limit token without blocking the event loop.
+
+        Same semantics as ``acquire``. If the waiting coroutine is cancelled, its
+        reservation is returned to the bucket unless a later caller has reserved
+        after it.
+        """
+        if not wait and self._would_wait():
+            return False
+
+        reservation = self._reserve(0.0 if not wait else timeout)
+        if reservation is None:
+            return False
+
+        delay, reserved_tat = reservation
+        if delay > 0:
+            logger.warning(
+                "rate_limit_wait",
+                wait_time=delay,
+                max_requests=self.requests_per_minute,
+            )
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._release(reserved_tat)
+                raise
+        return True
+
     def get_current_usage(self) -> tuple[int, float]:
         """
         Get the current rate limit usage.
-        
+
         Returns:
-            tuple[int, float]: (current number of requests, time until next available token)
+            tuple[int, float]: (tokens currently in use, time until next available token)
         """
         with self.lock:
-            current_time = time.time()
-            self._clean_old_timestamps(current_time)
-            
-            if not self.timestamps:
-                return 0, 0.0
-            
-            oldest_timestamp = self.timestamps[0]
-            time_until_next = max(0.0, oldest_timestamp + self.window_size - current_time)
-            
-            return len(self.timestamps), time_until_next
+            return self._usage(self._tat, self._clock())
+
+    def _usage(self, tat: float, now: float) -> tuple[int, float]:
+        """Compute (tokens in use, time until next token) for a given TAT."""
+        backlog = max(0.0, tat - now)
+        in_use = min(self.burst, math.ceil(backlog / self._interval - 1e-9)) if backlog else 0
+        return in_use, max(0.0, tat - self._tolerance - now)
+
+
+def create_rate_limiter(
+    requests_per_minute: int = 12,
+    name: str = "default",
+    prefix: str = "RATE_LIMITER_",
+) -> RateLimiter:
+    """
+    Create a rate limiter using the backend selected by environment variables.
+
+    Recognized variables (with the given prefix): BACKEND (``memory``, the
+    default, or ``sqlite`` to share the budget across processes on this host),
+    PATH (SQLite database file) and BURST.
+
+    Args:
+        requests_per_minute: Maximum sustained number of requests per minute.
+        name: Limiter name within a shared database.
+        prefix: Environment variable prefix.
+
+    Raises:
+        ConfigurationError: If the backend is unknown
+    """
+    backend = os.getenv(f"{prefix}BACKEND", "memory").lower()
+    burst_env = os.getenv(f"{prefix}BURST")
+    burst = int(burst_env) if burst_env else None
+    if backend == "memory":
+        return RateLimiter(requests_per_minute=requests_per_minute, burst=burst)
+    if backend == "sqlite":
+        # Imported lazily; the shared limiter builds on RateLimiter
+        from src.utils.shared_rate_limiter import SQLiteRateLimiter
+
+        path = os.getenv(f"{prefix}PATH")
+        return SQLiteRateLimiter(
+            path=Path(path) if path else None,
+            requests_per_minute=requests_per_minute,
+            burst=burst,
+            name=name,
+        )
+    raise ConfigurationError(
+        f"Unknown rate limiter backend: {backend}",
+        details={"backend": backend, "supported": ["memory", "sqlite"]},
+    )
 
 
 # Global rate limiter instance
-global_rate_limiter = RateLimiter(requests_per_minute=12) 
\ No newline at end of file
+global_rate_limiter = create_rate_limiter(requests_per_minute=12, name="motion")
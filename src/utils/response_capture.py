@@ -0,0 +1,243 @@
+"""
+Opt-in capture of raw API responses for debugging.
+
+Captured responses are held in a size-bounded in-memory ring buffer and written
+to disk by a single background writer thread, so request paths never block on
+file I/O and concurrent captures cannot interleave writes.
+"""
+
+import json
+import os
+import random
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CapturedResponse:
+    """A single captured API response."""
+    captured_at: float
+    endpoint: str
+    params: Dict[str, Any]
+    body: str
+    size: int
+    truncated: bool
+
+
+class ResponseCapture:
+    """
+    Bounded, sampled ring buffer of raw API responses.
+
+    Disabled by default. When enabled, a sampled subset of responses is serialized
+    once, truncated to ``max_entry_bytes`` (UTF-8) and kept in memory until either
+    ``max_entries`` or ``max_bytes`` would be exceeded, at which point the oldest
+    entries are evicted. If ``output_path`` is set, the buffer is flushed to that
+    file as JSON Lines by a background writer.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        max_entries: int = 20,
+        max_bytes: int = 5 * 1024 * 1024,
+        max_entry_bytes: int = 1024 * 1024,
+        sample_rate: float = 1.0,
+        output_path: Optional[Path] = None,
+    ):
+        """
+        Initialize the response capture.
+
+        Args:
+            enabled: Whether responses are captured at all.
+            max_entries: Maximum number of responses kept in the buffer.
+            max_bytes: Maximum total serialized size of the buffer.
+            max_entry_bytes: Maximum serialized size of a single response.
+            sample_rate: Fraction of responses to capture (0.0 - 1.0).
+            output_path: Optional JSON Lines file the buffer is flushed to.
+        """
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0.0 and 1.0")
+        if max_entries < 1 or max_bytes < 1 or max_entry_bytes < 1:
+            raise ValueError("capture limits must be positive")
+        self.enabled = enabled
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = min(max_entry_bytes, max_bytes)
+        self.sample_rate = sample_rate
+        self.output_path = Path(output_path) if output_path else None
+
+        self._entries: Deque[CapturedResponse] = deque()
+        self._entry_bytes: Deque[int] = deque()  # UTF-8 size of each entry's body
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stopped = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._written_version = 0
+        self._version = 0
+        self._flushed = threading.Condition(self._lock)
+
+    @classmethod
+    def from_env(cls, prefix: str = "MOTION_CAPTURE_") -> "ResponseCapture":
+        """
+        Create a capture configured from environment variables.
+
+        Recognized variables (with the given prefix): ENABLED, SAMPLE_RATE,
+        MAX_ENTRIES, MAX_BYTES, MAX_ENTRY_BYTES and PATH.
+        """
+        path = os.getenv(f"{prefix}PATH")
+        return cls(
+            enabled=os.getenv(f"{prefix}ENABLED", "false").lower() == "true",
+            sample_rate=float(os.getenv(f"{prefix}SAMPLE_RATE", "1.0")),
+            max_entries=int(os.getenv(f"{prefix}MAX_ENTRIES", "20")),
+            max_bytes=int(os.getenv(f"{prefix}MAX_BYTES", str(5 * 1024 * 1024))),
+            max_entry_bytes=int(os.getenv(f"{prefix}MAX_ENTRY_BYTES", str(1024 * 1024))),
+            output_path=Path(path) if path else None,
+        )
+
+    def record(self, endpoint: str, params: Optional[Dict[str, Any]], response: Any) -> bool:
+        """
+        Capture a response if capture is enabled and the response is sampled.
+
+        Args:
+            endpoint: API endpoint the response came from
+            params: Query parameters of the request
+            response: Parsed response body
+
+        Returns:
+            bool: True if the response was captured
+        """
+        if not self.enabled:
+            return False
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return False
+
+        try:
+            body = json.dumps(response, separators=(",", ":"), ensure_ascii=False, default=str)
+        except (TypeError, ValueError) as e:
+            logger.warning("response_capture_serialize_failed", endpoint=endpoint, error=str(e))
+            return False
+
+        encoded = body.encode("utf-8")
+        size = len(encoded)
+        truncated = size > self.max_entry_bytes
+        if truncated:
+            # Cut on a byte boundary, dropping a multi-byte character split by it
+            encoded = encoded[:self.max_entry_bytes]
+            body = encoded.decode("utf-8", errors="ignore")
+        entry = CapturedResponse(
+            captured_at=time.time(),
+            endpoint=endpoint,
+            params=dict(params or {}),
+            body=body,
+            size=size,
+            truncated=truncated,
+        )
+
+        with self._lock:
+            self._entries.append(entry)
+            self._entry_bytes.append(len(encoded))
+            self._total_bytes += len(encoded)
+            while len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes:
+                self._entries.popleft()
+                self._total_bytes -= self._entry_bytes.popleft()
+            self._version += 1
+
+        if self.output_path is not None:
+            self._ensure_writer()
+            self._dirty.set()
+        return True
+
+    def entries(self) -> List[CapturedResponse]:
+        """Return a snapshot of the captured responses, oldest first."""
+        with self._lock:
+            return list(self._entries)
+
+    def clear(self) -> None:
+        """Drop all captured responses."""
+        with self._lock:
+            self._entries.clear()
+            self._entry_bytes.clear()
+            self._total_bytes = 0
+            self._version += 1
+
+        if self.output_path is not None:
+            self._ensure_writer()
+            self._dirty.set()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the background writer has written the current buffer.
+
+        Args:
+            timeout: Maximum time to wait in seconds (None waits indefinitely)
+
+        Returns:
+            bool: True if the buffer on disk is up to date
+        """
+        if self.output_path is None or self._writer is None:
+            return True
+        with self._flushed:
+            target = self._version
+            return self._flushed.wait_for(lambda: self._written_version >= target, timeout)
+
+    def close(self) -> None:
+        """Flush pending captures and stop the background writer."""
+        if self._writer is None:
+            return
+        self.flush(timeout=5.0)
+        self._stopped.set()
+        self._dirty.set()
+        self._writer.join(timeout=5.0)
+        self._writer = None
+        self._stopped.clear()
+
+    def _ensure_writer(self) -> None:
+        """Start the background writer thread on first use."""
+        if self._writer is not None:
+            return
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._write_loop,
+                    name="response-capture-writer",
+                    daemon=True,
+                )
+                self._writer.start()
+
+    def _write_loop(self) -> None:
+        """Write the buffer to disk whenever it changes."""
+        while True:
+            self._dirty.wait()
+            self._dirty.clear()
+            if self._stopped.is_set():
+                return
+            with self._lock:
+                snapshot = list(self._entries)
+                version = self._version
+            try:
+                self._write_snapshot(snapshot)
+            except OSError as e:
+                logger.warning("response_capture_write_failed", path=str(self.output_path), error=str(e))
+            with self._flushed:
+                self._written_version = version
+                self._flushed.notify_all()
+
+    def _write_snapshot(self, snapshot: List[CapturedResponse]) -> None:
+        """Atomically replace the output file with the given entries."""
+        assert self.output_path is not None
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.output_path.with_name(self.output_path.name + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in snapshot:
+                f.write(json.dumps(asdict(entry)))
+                f.write("\n")
+        os.replace(tmp_path, self.output_path)
@@ -0,0 +1,320 @@
+"""
+Retry policy and deadline propagation for outbound calls.
+
+A ``RetryPolicy`` owns everything about retrying one logical call: the number
+of attempts, exponential backoff with full jitter, honouring server
+``Retry-After`` hints and stopping when the caller's deadline would be missed.
+
+Deadlines are carried in a context variable, so a job can set an overall budget
+once (``with deadline(120): ...``) and every HTTP or SMTP attempt underneath it
+can size its own timeout with ``attempt_timeout()``.
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Iterator, Optional, TypeVar, Union
+
+from src.utils.exceptions import APIError, CircuitOpenError, DeadlineExceededError
+from src.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Absolute time.monotonic() by which the current operation must finish
+_deadline: ContextVar[Optional[float]] = ContextVar("retry_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: Optional[float]) -> Iterator[Optional[float]]:
+    """
+    Run a block under an overall time budget.
+
+    Nested deadlines can only tighten the budget, never extend it.
+
+    Args:
+        seconds: Budget for the block, or None to inherit the enclosing one
+
+    Yields:
+        Optional[float]: Remaining seconds at entry (None if unbounded)
+    """
+    current = _deadline.get()
+    if seconds is not None:
+        proposed = time.monotonic() + seconds
+        current = proposed if current is None else min(current, proposed)
+    token = _deadline.set(current)
+    try:
+        yield remaining_time()
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Seconds left before the current deadline (None if there is none)."""
+    current = _deadline.get()
+    if current is None:
+        return None
+    return max(0.0, current - time.monotonic())
+
+
+def check_deadline(operation: str = "operation") -> None:
+    """
+    Raise if the current deadline has passed.
+
+    Raises:
+        DeadlineExceededError: If no time is left
+    """
+    if remaining_time() == 0.0:
+        raise DeadlineExceededError(
+            message=f"Deadline exceeded before {operation} could complete",
+            details={"operation": operation},
+        )
+
+
+def attempt_timeout(default: float) -> float:
+    """
+    Timeout for a single attempt: the default, capped by the remaining deadline.
+
+    Raises:
+        DeadlineExceededError: If no time is left
+    """
+    remaining = remaining_time()
+    if remaining is None:
+        return default
+    check_deadline()
+    return min(default, remaining)
+
+
+def status_code_of(error: BaseException) -> Optional[int]:
+    """Get the HTTP status code carried by an API error, if any."""
+    return error.status_code if isinstance(error, APIError) else None
+
+
+def retry_after_of(error: BaseException) -> Optional[float]:
+    """Get a server-requested retry delay from an API error's details, if any."""
+    details = getattr(error, "details", None)
+    if not isinstance(details, dict):
+        return None
+    value = details.get("retry_after")
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def is_circuit_open(error: BaseException) -> bool:
+    """Check whether an error (or its cause) is a circuit breaker rejection."""
+    return isinstance(error, CircuitOpenError) or isinstance(getattr(error, "cause", None), CircuitOpenError)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How a logical call is retried.
+
+    Attributes:
+        max_attempts: Total attempts, including the first
+        base_delay: Backoff before the first retry, in seconds
+        max_delay: Upper bound on any single backoff
+        multiplier: Exponential growth factor of the backoff
+        jitter: True (or "full") for full jitter, uniform in [0, backoff];
+            "decorrelated" for delays drawn between ``base_delay`` and three
+            times the previous delay; False for the plain exponential backoff
+        retry_statuses: HTTP statuses worth retrying; errors without a status
+            (network failures and timeouts) are always retried
+        max_retry_after: Longest server-requested delay that is honoured
+    """
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    multiplier: float = 2.0
+    jitter: Union[bool, str] = True
+    retry_statuses: FrozenSet[int] = frozenset({408, 429, 500, 502, 503, 504})
+    max_retry_after: float = 60.0
+
+    def __post_init__(self):
+        if self.jitter not in (True, False, "full", "decorrelated"):
+            raise ValueError(f"Unknown jitter mode: {self.jitter}")
+
+    def backoff(self, retry: int, previous: Optional[float] = None) -> float:
+        """
+        Delay before the given retry (1 for the first retry).
+
+        Args:
+            retry: Retry number, starting at 1
+            previous: Delay before the previous retry (used by decorrelated jitter)
+        """
+        if self.jitter == "decorrelated":
+            upper = max(self.base_delay, (previous or self.base_delay) * 3)
+            return min(self.max_delay, random.uniform(self.base_delay, upper))
+        delay = min(self.max_delay, self.base_delay * self.multiplier ** (retry - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+    def is_retryable(self, error: BaseException) -> bool:
+        """Default retry decision: transient statuses and errors without a status."""
+        status = status_code_of(error)
+        return status is None or status in self.retry_statuses
+
+    def call(
+        self,
+        func: Callable[..., T],
+        *args: Any,
+        operation: Optional[str] = None,
+        retry_on: Optional[Callable[[BaseException], bool]] = None,
+        exceptions: tuple = (Exception,),
+        on_attempt: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Call ``func`` under this policy and the current deadline.
+
+        Args:
+            func: Function performing a single attempt
+            operation: Name used in logs and deadline errors
+            retry_on: Predicate deciding whether an error is retryable
+                (defaults to ``is_retryable``)
+            exceptions: Exception types that are considered at all; others
+                propagate immediately
+            on_attempt: Callback receiving a metrics dict (operation, attempt,
+                outcome, elapsed, delay, status_code, error) after every attempt
+
+        Returns:
+            The result of the first successful attempt
+
+        Raises:
+            DeadlineExceededError: If the deadline passes before an attempt starts
+            Exception: The last attempt's error once retries are exhausted, the
+                error is not retryable (circuit breaker rejections never are), or
+                the next retry would miss the deadline
+        """
+        run = _RetryRun(self, operation or getattr(func, "__name__", "call"), retry_on, on_attempt)
+        while True:
+            run.start()
+            try:
+                result = func(*args, **kwargs)
+            except exceptions as e:
+                delay = run.failed(e)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+            else:
+                run.succeeded()
+                return result
+
+    async def call_async(
+        self,
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
+        operation: Optional[str] = None,
+        retry_on: Optional[Callable[[BaseException], bool]] = None,
+        exceptions: tuple = (Exception,),
+        on_attempt: Optional[Callable[[Dict[str, Any]], None]] = None,
+        **kwargs: Any,
+    ) -> T:
+        """Asynchronous variant of ``call`` that waits with ``asyncio.sleep``."""
+        run = _RetryRun(self, operation or getattr(func, "__name__", "call"), retry_on, on_attempt)
+        while True:
+            run.start()
+            try:
+                result = await func(*args, **kwargs)
+            except exceptions as e:
+                delay = run.failed(e)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+            else:
+                run.succeeded()
+                return result
+
+
+class _RetryRun:
+    """Attempt bookkeeping for one ``RetryPolicy.call``, shared by the sync and async loops."""
+
+    def __init__(
+        self,
+        policy: RetryPolicy,
+        operation: str,
+        retry_on: Optional[Callable[[BaseException], bool]],
+        on_attempt: Optional[Callable[[Dict[str, Any]], None]],
+    ):
+        self.policy = policy
+        self.operation = operation
+        self.retry_on = retry_on or policy.is_retryable
+        self.on_attempt = on_attempt
+        self.started = time.monotonic()
+        self.attempt = 0
+        self.delay: Optional[float] = None
+
+    def _emit(self, outcome: str, delay: float = 0.0, error: Optional[BaseException] = None) -> None:
+        if self.on_attempt is None:
+            return
+        self.on_attempt({
+            "operation": self.operation,
+            "attempt": self.attempt,
+            "outcome": outcome,
+            "elapsed": time.monotonic() - self.started,
+            "delay": delay,
+            "status_code": status_code_of(error) if error is not None else None,
+            "error": str(error) if error is not None else None,
+        })
+
+    def start(self) -> None:
+        check_deadline(self.operation)
+        self.attempt += 1
+
+    def succeeded(self) -> None:
+        self._emit("success")
+
+    def failed(self, error: BaseException) -> Optional[float]:
+        """
+        Decide what to do after a failed attempt.
+
+        Returns:
+            Optional[float]: Seconds to wait before the next attempt, or None if
+                the error should be raised
+        """
+        policy = self.policy
+        if self.attempt >= policy.max_attempts:
+            logger.error(
+                "max_retries_exceeded",
+                operation=self.operation,
+                max_attempts=policy.max_attempts,
+                error=str(error),
+            )
+            self._emit("failure", error=error)
+            return None
+        if is_circuit_open(error) or not self.retry_on(error):
+            self._emit("failure", error=error)
+            return None
+        server_delay = retry_after_of(error)
+        if server_delay is not None:
+            if server_delay > policy.max_retry_after:
+                self._emit("failure", error=error)
+                return None
+            delay = server_delay
+        else:
+            delay = self.delay = policy.backoff(self.attempt, self.delay)
+        remaining = remaining_time()
+        if remaining is not None and delay >= remaining:
+            logger.warning(
+                "retry_abandoned_deadline",
+                operation=self.operation,
+                attempt=self.attempt,
+                delay=delay,
+                remaining=remaining,
+                error=str(error),
+            )
+            self._emit("failure", error=error)
+            return None
+        logger.warning(
+            "retry_attempt",
+            operation=self.operation,
+            attempt=self.attempt,
+            max_attempts=policy.max_attempts,
+            delay=delay,
+            status_code=status_code_of(error),
+            error=str(error),
+        )
+        self._emit("retry", delay=delay, error=error)
+        return delay
@@ -0,0 +1,171 @@
+"""
+Cross-process rate limiter backed by SQLite.
+
+Every process on the host that opens the same database file draws from a single
+shared budget. The limiter state is one theoretical arrival time (TAT) per
+limiter name, updated inside a ``BEGIN IMMEDIATE`` transaction so reservations
+from different processes are serialized by SQLite's write lock.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+from src.utils.logging import get_logger
+from src.utils.rate_limiter import RateLimiter
+
+logger = get_logger(__name__)
+
+DEFAULT_DB_PATH = Path(tempfile.gettempdir()) / "daily_digest_rate_limit.sqlite3"
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    GCRA token-bucket limiter whose state lives in a SQLite database.
+
+    Drop-in replacement for ``RateLimiter``: ``acquire``, ``acquire_async``,
+    ``get_current_usage``, ``reset`` and ``set_rate`` behave the same, but the
+    budget is shared by every process using the same ``path`` and ``name``.
+    Waiting still happens outside any lock or transaction.
+
+    The database connection is opened lazily and reopened in each process, so
+    a limiter created at import time can be used safely by forked workers.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        requests_per_minute: int = 12,
+        burst: Optional[int] = None,
+        name: str = "default",
+        clock: Callable[[], float] = time.time,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Initialize the shared rate limiter.
+
+        Args:
+            path: SQLite database file shared by cooperating processes.
+            requests_per_minute: Maximum sustained number of requests per minute.
+            burst: Maximum number of requests allowed back to back.
+            name: Limiter name, so several budgets can share one database.
+            clock: Wall clock used for timing; must agree across processes.
+            busy_timeout: Seconds to wait for another process's write lock.
+        """
+        super().__init__(requests_per_minute=requests_per_minute, burst=burst, clock=clock)
+        self.path = Path(path) if path else DEFAULT_DB_PATH
+        self.name = name
+        self.busy_timeout = busy_timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        self._conn_pid: Optional[int] = None
+        logger.debug("shared_rate_limiter_initialized", path=str(self.path), name=name)
+
+    def _connection(self) -> sqlite3.Connection:
+        """
+        Get this process's database connection, opening it on first use.
+
+        SQLite connections must not be shared across ``fork()``, so a child
+        process ignores the connection inherited from its parent and opens its
+        own. Must be called with ``self.lock`` held.
+        """
+        pid = os.getpid()
+        if self._conn is None or self._conn_pid != pid:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                str(self.path),
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limits (name TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+            self._conn = conn
+            self._conn_pid = pid
+        return self._conn
+
+    def _read_tat(self) -> float:
+        """Read the stored TAT (0 if this limiter has no row yet)."""
+        row = self._connection().execute(
+            "SELECT tat FROM rate_limits WHERE name = ?", (self.name,)
+        ).fetchone()
+        return row[0] if row else 0.0
+
+    def _update_tat(self, update: Callable[[float, float], Optional[float]]) -> Optional[float]:
+        """
+        Atomically read, transform and write the TAT.
+
+        ``update(tat, now)`` returns the new TAT, or None to leave it unchanged.
+        Returns the value written (or None).
+        """
+        with self.lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                new_tat = update(self._read_tat(), self._clock())
+                if new_tat is not None:
+                    conn.execute(
+                        "INSERT INTO rate_limits (name, tat) VALUES (?, ?) "
+                        "ON CONFLICT(name) DO UPDATE SET tat = excluded.tat",
+                        (self.name, new_tat),
+                    )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return new_tat
+
+    def _reserve(self, max_wait: Optional[float]) -> Optional[Tuple[float, float]]:
+        """Reserve the next shared slot if it is available within ``max_wait`` seconds."""
+        delay: Optional[float] = None
+
+        def update(stored: float, now: float) -> Optional[float]:
+            nonlocal delay
+            tat = max(stored, now)
+            wait = max(0.0, tat - self._tolerance - now)
+            if max_wait is not None and wait > max_wait:
+                return None
+            delay = wait
+            return tat + self._interval
+
+        reserved_tat = self._update_tat(update)
+        return None if delay is None else (delay, reserved_tat)
+
+    def _release(self, reserved_tat: float) -> None:
+        """Give back a reservation if no process has reserved after it."""
+        self._update_tat(
+            lambda tat, now: max(now, tat - self._interval) if tat == reserved_tat else None
+        )
+
+    def _would_wait(self) -> bool:
+        """Check whether the shared bucket is empty without taking the write lock."""
+        with self.lock:
+            tat = self._read_tat()
+        return tat - self._tolerance > self._clock()
+
+    def reset(self) -> None:
+        """Reset the shared bucket to full for every process."""
+        self._update_tat(lambda tat, now: 0.0)
+
+    def get_current_usage(self) -> tuple[int, float]:
+        """
+        Get the current shared rate limit usage.
+
+        Returns:
+            tuple[int, float]: (tokens currently in use, time until next available token)
+        """
+        with self.lock:
+            tat = self._read_tat()
+        return self._usage(tat, self._clock())
+
+    def close(self) -> None:
+        """Close this process's database connection, if it is open."""
+        with self.lock:
+            if self._conn is not None and self._conn_pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+            self._conn_pid = None
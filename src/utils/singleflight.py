@@ -0,0 +1,137 @@
+"""
+Single-flight request coalescing.
+
+When several callers ask for the same thing at the same time, only the first
+(the leader) does the work; the others wait for and share its result or error.
+Asyncio callers coalesce too: AsyncMotionClient runs MotionClient calls on
+worker threads, which go through ``do``.
+"""
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+from src.utils.exceptions import DeadlineExceededError
+from src.utils.retry import remaining_time
+
+T = TypeVar("T")
+
+
+class _Call:
+    """State of an in-flight (or recently completed) call."""
+
+    __slots__ = ("event", "result", "error", "done_at")
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.done_at: Optional[float] = None
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into a single execution.
+
+    By default only calls that overlap in time are coalesced. With a ``window``,
+    callers arriving up to ``window`` seconds after the leader finished also reuse
+    its result.
+    """
+
+    def __init__(self, window: float = 0.0):
+        """
+        Initialize the single-flight group.
+
+        Args:
+            window: Seconds a completed result stays shareable (0 = in-flight only).
+        """
+        if window < 0:
+            raise ValueError("window must not be negative")
+        self.window = window
+        self._calls: Dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "executions": 0, "coalesced": 0}
+
+    def _shared(self, call: _Call, now: float) -> bool:
+        """Check whether a recorded call can still be joined."""
+        return call.done_at is None or now - call.done_at < self.window
+
+    def do(self, key: Hashable, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run ``func`` once for all concurrent callers using the same key.
+
+        Args:
+            key: Identity of the call (e.g. method, URL and params)
+            func: Function to execute if no call for the key is in flight
+
+        Returns:
+            The leader's result, shared with every coalesced caller
+
+        Raises:
+            DeadlineExceededError: If a coalesced caller's deadline passes while
+                it waits for the leader
+            Exception: The leader's exception, re-raised in every coalesced caller
+        """
+        with self._lock:
+            self._stats["calls"] += 1
+            call = self._calls.get(key)
+            if call is not None and self._shared(call, time.monotonic()):
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["executions"] += 1
+                leader = True
+
+        if not leader:
+            # Followers wait no longer than their own deadline allows
+            if not call.event.wait(remaining_time()):
+                raise DeadlineExceededError(
+                    message="Deadline exceeded while waiting for a coalesced call",
+                    details={"key": repr(key)},
+                )
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = func(*args, **kwargs)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                call.done_at = time.monotonic()
+                # Failed calls are never reused after completion
+                if self.window == 0 or call.error is not None:
+                    if self._calls.get(key) is call:
+                        del self._calls[key]
+                else:
+                    self._prune(call.done_at)
+            call.event.set()
+        return call.result
+
+    def _prune(self, now: float) -> None:
+        """Drop completed calls whose window has passed. Caller holds the lock."""
+        expired = [
+            key for key, call in self._calls.items()
+            if call.done_at is not None and now - call.done_at >= self.window
+        ]
+        for key in expired:
+            del self._calls[key]
+
+    def stats(self) -> Dict[str, int]:
+        """Get coalescing counters: calls, executions and coalesced."""
+        with self._lock:
+            return dict(self._stats)
+
+    def reset_stats(self) -> None:
+        """Reset coalescing counters."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] = 0
+
+
+# Global single-flight group for outbound API GETs
+global_singleflight = SingleFlight()
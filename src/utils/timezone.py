@@ -5,8 +5,10 @@ This module provides comprehensive timezone handling utilities, including
 conversion, validation, and DST transition handling.
 """
 
-from datetime import datetime, timedelta
-from typing import Optional, Tuple
+import threading
+from bisect import bisect_left, bisect_right
+from datetime import datetime, timedelta, timezone as fixed_timezone, tzinfo
+from typing import Dict, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 from src.utils.exceptions import ValidationError
@@ -136,4 +138,151 @@ def format_timezone_info(dt: datetime) -> str:
     offset = dt.strftime('%z')
     dst = "DST" if dt.dst() else "STD"
     
-    return f"{tz_name} ({offset}, {dst})" 
\ No newline at end of file
+    return f"{tz_name} ({offset}, {dst})"
+
+class TransitionIndex:
+    """
+    Precomputed UTC-offset transitions per zone and year.
+    
+    Transition instants are found once per (zone, year) by scanning the year
+    and bisecting to the second, then cached. Checking whether an instant lies
+    within ``window`` of a transition is a bisect over a handful of values.
+    """
+    
+    # Scan step when searching for transitions; zones change offset at most
+    # once within any such span
+    SCAN_STEP = timedelta(hours=6)
+    
+    def __init__(self, window: timedelta = timedelta(hours=1)):
+        """
+        Initialize the index.
+        
+        Args:
+            window: Distance from a transition that counts as "near"
+        """
+        self.window = window.total_seconds()
+        self._transitions: Dict[Tuple[tzinfo, int], Tuple[float, ...]] = {}
+        self._lock = threading.Lock()
+    
+    def transitions(self, tz: Optional[tzinfo], year: int) -> Tuple[float, ...]:
+        """
+        Get the transition instants of a zone in a (UTC) year.
+        
+        Args:
+            tz: Time zone (fixed-offset zones have no transitions)
+            year: Calendar year in UTC
+            
+        Returns:
+            Tuple[float, ...]: Sorted POSIX timestamps at which the offset changes
+        """
+        if tz is None or isinstance(tz, fixed_timezone):
+            return ()
+        key = (tz, year)
+        found = self._transitions.get(key)
+        if found is None:
+            found = self._scan(tz, year)
+            with self._lock:
+                self._transitions[key] = found
+        return found
+    
+    def _scan(self, tz: tzinfo, year: int) -> Tuple[float, ...]:
+        """Find the transitions of a zone in a year."""
+        start = int(datetime(year, 1, 1, tzinfo=fixed_timezone.utc).timestamp())
+        end = int(datetime(year + 1, 1, 1, tzinfo=fixed_timezone.utc).timestamp())
+        step = int(self.SCAN_STEP.total_seconds())
+        
+        def offset_at(timestamp: int) -> Optional[timedelta]:
+            return datetime.fromtimestamp(timestamp, tz).utcoffset()
+        
+        current = start
+        offset = offset_at(current)
+        found: List[float] = []
+        while current < end:
+            step_end = min(current + step, end)
+            step_offset = offset_at(step_end)
+            if step_offset != offset:
+                # Bisect to the first second with the new offset
+                lo, hi = current, step_end
+                while hi - lo > 1:
+                    mid = (lo + hi) // 2
+                    if offset_at(mid) == offset:
+                        lo = mid
+                    else:
+                        hi = mid
+                found.append(float(hi))
+                offset = step_offset
+            current = step_end
+        return tuple(found)
+    
+    def _near(self, timestamp: float, tz: tzinfo) -> bool:
+        first = _utc_year(timestamp - self.window)
+        last = _utc_year(timestamp + self.window)
+        for year in (first,) if first == last else (first, last):
+            transitions = self.transitions(tz, year)
+            i = bisect_left(transitions, timestamp - self.window)
+            if i < len(transitions) and transitions[i] <= timestamp + self.window:
+                return True
+        return False
+    
+    def is_near_transition(self, dt: datetime) -> bool:
+        """
+        Check whether an aware datetime is within the window of an offset change
+        in its own time zone.
+        
+        Args:
+            dt: Datetime to check (naive datetimes are never near a transition)
+        """
+        if dt.tzinfo is None:
+            return False
+        return self._near(dt.timestamp(), dt.tzinfo)
+    
+    def near_transitions(self, timestamps: Sequence[float], tz: tzinfo) -> List[bool]:
+        """
+        Check many instants in one zone at once.
+        
+        Sorts the instants and sweeps them against the zone's transitions, so
+        the cost is one sort plus a linear merge.
+        
+        Args:
+            timestamps: POSIX timestamps
+            tz: Time zone to check against
+            
+        Returns:
+            List[bool]: For each timestamp, whether it is near a transition
+        """
+        result = [False] * len(timestamps)
+        if not timestamps:
+            return result
+        first = _utc_year(min(timestamps) - self.window)
+        last = _utc_year(max(timestamps) + self.window)
+        transitions = [t for year in range(first, last + 1) for t in self.transitions(tz, year)]
+        if not transitions:
+            return result
+        i = 0
+        for position in sorted(range(len(timestamps)), key=timestamps.__getitem__):
+            timestamp = timestamps[position]
+            while i < len(transitions) and transitions[i] < timestamp - self.window:
+                i += 1
+            if i == len(transitions):
+                break
+            result[position] = transitions[i] <= timestamp + self.window
+        return result
+
+
+# POSIX timestamps of 1 January (UTC) for a fast timestamp -> year lookup
+_FIRST_YEAR = 1900
+_YEAR_STARTS = [
+    datetime(year, 1, 1, tzinfo=fixed_timezone.utc).timestamp() for year in range(_FIRST_YEAR, 2201)
+]
+
+
+def _utc_year(timestamp: float) -> int:
+    """UTC calendar year of a POSIX timestamp."""
+    i = bisect_right(_YEAR_STARTS, timestamp) - 1
+    if 0 <= i < len(_YEAR_STARTS) - 1:
+        return _FIRST_YEAR + i
+    return datetime.fromtimestamp(timestamp, fixed_timezone.utc).year
+
+
+# Shared index of DST transitions (within one hour) used by event validation
+dst_transition_index = TransitionIndex()
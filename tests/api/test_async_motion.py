@@ -0,0 +1,118 @@
+"""Tests for the asyncio Motion API client."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.api.async_motion import AsyncMotionClient
+from src.api.motion import MotionClient
+from src.core.models.calendar import CalendarEventCollection
+from src.core.models.task import TaskCollection, TaskStatus
+from src.utils.config import MotionAPIConfig
+from src.utils.exceptions import MotionAPIError
+from src.utils.adaptive_rate import global_rate_controller
+from src.utils.rate_limiter import global_rate_limiter
+
+
+@pytest.fixture
+def api_config():
+    """Create a test API configuration."""
+    return MotionAPIConfig(
+        motion_api_key="test_api_key",
+        motion_api_url="https://api.motion.dev/v1",
+    )
+
+
+@pytest.fixture
+def async_client(api_config):
+    """Create an async Motion client wrapping a client with a mocked session."""
+    with patch("requests.Session") as mock_session:
+        mock_session.return_value.headers = {}
+        client = MotionClient(api_config)
+        client.session = mock_session.return_value
+        global_rate_limiter.reset()
+        global_rate_controller.reset()
+        yield AsyncMotionClient(api_config, max_connections=4, client=client)
+        global_rate_limiter.reset()
+        global_rate_controller.reset()
+
+
+def _response(payload):
+    response = Mock()
+    response.status_code = 200
+    response.json.return_value = payload
+    return response
+
+
+def _slow_router(delay):
+    """Return a session.request side effect that answers tasks and events slowly."""
+    now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+
+    def request(method, url, **kwargs):
+        time.sleep(delay)
+        if url.endswith("/events"):
+            return _response({
+                "events": [{
+                    "id": "event_1",
+                    "title": "Standup",
+                    "start": "2024-03-20T09:00:00+11:00",
+                    "end": "2024-03-20T09:15:00+11:00",
+                }]
+            })
+        return _response({
+            "tasks": [{
+                "id": "task_1",
+                "name": "Test Task",
+                "status": "todo",
+                "scheduledStart": now,
+            }]
+        })
+
+    return request
+
+
+def test_get_tasks_returns_task_collection(async_client):
+    """Test that async get_tasks returns the same models as the sync client."""
+    async_client.client.session.request.side_effect = _slow_router(0)
+
+    tasks = asyncio.run(async_client.get_tasks(status="todo"))
+
+    assert isinstance(tasks, TaskCollection)
+    assert tasks[0].status == TaskStatus.TODO
+
+
+def test_get_tasks_and_events_runs_concurrently(async_client):
+    """Test that tasks and events are fetched in parallel, not serially."""
+    async_client.client.session.request.side_effect = _slow_router(0.2)
+
+    start = time.perf_counter()
+    tasks, events = asyncio.run(
+        async_client.get_tasks_and_events(datetime(2024, 3, 20, tzinfo=timezone.utc), params={})
+    )
+    elapsed = time.perf_counter() - start
+
+    assert len(tasks) == 1
+    assert isinstance(events, CalendarEventCollection)
+    assert len(events) == 1
+    assert elapsed < 0.35
+
+
+def test_errors_propagate_as_motion_api_error(async_client):
+    """Test that failures surface as MotionAPIError, as in the sync client."""
+    with patch.object(
+        async_client.client,
+        "get_task",
+        side_effect=MotionAPIError(message="boom", status_code=404),
+    ):
+        with pytest.raises(MotionAPIError) as exc_info:
+            asyncio.run(async_client.get_task("missing"))
+    assert exc_info.value.status_code == 404
+
+
+def test_invalid_max_connections(api_config):
+    """Test that the connection pool must allow at least one connection."""
+    with pytest.raises(ValueError):
+        AsyncMotionClient(api_config, max_connections=0)
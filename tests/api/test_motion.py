@@ -1,5 +1,7 @@
 """Tests for the Motion API client."""
 
+import threading
+import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock, patch
 
@@ -8,9 +10,16 @@ import requests
 from requests.exceptions import RequestException
 
 from src.api.motion import MotionClient
+from src.core.models.quarantine import Quarantine
 from src.core.models.task import Task, TaskCollection, TaskStatus, TaskPriority
+from src.utils.adaptive_rate import AdaptiveRateController, global_rate_controller
 from src.utils.config import MotionAPIConfig
-from src.utils.exceptions import MotionAPIError, ValidationError
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.exceptions import CircuitOpenError, MotionAPIError, ValidationError
+from src.utils.http_cache import ResponseCache
+from src.utils.rate_limiter import global_rate_limiter
+from src.utils.retry import RetryPolicy, deadline
+from src.utils.singleflight import SingleFlight
 
 
 @pytest.fixture
@@ -29,7 +38,11 @@ def client(api_config):
         mock_session.return_value.headers = {}
         client = MotionClient(api_config)
         client.session = mock_session.return_value
+        global_rate_controller.reset()
+        global_rate_limiter.reset()
         yield client
+        global_rate_controller.reset()
+        global_rate_limiter.reset()
 
 
 def test_init_sets_headers(api_config):
@@ -325,4 +338,368 @@ def test_invalid_task_data_handling(client):
     
     error = exc_info.value
     assert "Task name is required" in str(error)
-    assert "raw_data" in error.details 
\ No newline at end of file
+    assert "raw_data" in error.details 
+
+def _task_page(ids, next_cursor=None):
+    """Build a /tasks page response."""
+    response = Mock()
+    response.json.return_value = {
+        "meta": {"nextCursor": next_cursor, "pageSize": len(ids)},
+        "tasks": [{"id": task_id, "name": f"Task {task_id}", "status": "todo"} for task_id in ids],
+    }
+    return response
+
+
+def test_iter_tasks_follows_cursor(client):
+    """Test that iter_tasks walks every page using the pagination cursor."""
+    global_rate_limiter.reset()
+    client.session.request.side_effect = [
+        _task_page(["t1", "t2"], next_cursor="c1"),
+        _task_page(["t3", "t4"], next_cursor="c2"),
+        _task_page(["t5"]),
+    ]
+    
+    tasks = list(client.iter_tasks(project_id="proj_1"))
+    
+    assert [t.id for t in tasks] == ["t1", "t2", "t3", "t4", "t5"]
+    cursors = [c.kwargs["params"].get("cursor") for c in client.session.request.call_args_list]
+    assert cursors == [None, "c1", "c2"]
+    assert all(c.kwargs["params"]["project_id"] == "proj_1" for c in client.session.request.call_args_list)
+
+
+def test_iter_tasks_respects_max_pages_and_max_items(client):
+    """Test that iter_tasks stops at the page and item bounds."""
+    global_rate_limiter.reset()
+    client.session.request.side_effect = [
+        _task_page(["t1", "t2"], next_cursor="c1"),
+        _task_page(["t3", "t4"], next_cursor="c2"),
+    ]
+    assert [t.id for t in client.iter_tasks(max_pages=1)] == ["t1", "t2"]
+    assert client.session.request.call_count == 1
+    
+    client.session.request.reset_mock()
+    client.session.request.side_effect = [
+        _task_page(["t1", "t2"], next_cursor="c1"),
+        _task_page(["t3", "t4"], next_cursor="c2"),
+    ]
+    assert [t.id for t in client.iter_tasks(max_items=3)] == ["t1", "t2", "t3"]
+    assert client.session.request.call_count == 2
+
+
+def test_iter_tasks_prefetches_next_page(client):
+    """Test that the next page is requested before the current page is consumed."""
+    global_rate_limiter.reset()
+    client.session.request.side_effect = [
+        _task_page(["t1"], next_cursor="c1"),
+        _task_page(["t2"]),
+    ]
+    
+    iterator = client.iter_tasks()
+    first = next(iterator)
+    # Wait for the background fetch of page two to be issued
+    for _ in range(100):
+        if client.session.request.call_count == 2:
+            break
+        time.sleep(0.01)
+    
+    assert first.id == "t1"
+    assert client.session.request.call_count == 2
+    assert [t.id for t in iterator] == ["t2"]
+
+
+def _cached_client(api_config):
+    """Create a client with a mocked session and an in-memory response cache."""
+    with patch("requests.Session") as mock_session:
+        mock_session.return_value.headers = {}
+        cached_client = MotionClient(api_config, cache=ResponseCache(default_ttl=60))
+        cached_client.session = mock_session.return_value
+    return cached_client
+
+
+def test_cached_get_skips_network(api_config):
+    """Test that a fresh cached GET is served without a second request."""
+    global_rate_limiter.reset()
+    cached_client = _cached_client(api_config)
+    cached_client.session.request.return_value = _task_page(["t1"])
+    
+    first = cached_client.get_tasks(status="todo")
+    second = cached_client.get_tasks(status="todo")
+    
+    assert [t.id for t in first] == [t.id for t in second] == ["t1"]
+    assert cached_client.session.request.call_count == 1
+    assert cached_client.cache.stats()["hits"] == 1
+
+
+def test_stale_cache_entry_revalidates_with_etag(api_config):
+    """Test that a stale entry is revalidated and reused on 304 Not Modified."""
+    global_rate_limiter.reset()
+    cached_client = _cached_client(api_config)
+    response = _task_page(["t1"])
+    response.status_code = 200
+    response.headers = {"ETag": '"v1"'}
+    not_modified = Mock(status_code=304, headers={})
+    cached_client.session.request.side_effect = [response, not_modified]
+    
+    cached_client.get_tasks()
+    with patch("src.utils.http_cache.time.time", return_value=time.time() + 3600):
+        tasks = cached_client.get_tasks()
+    
+    assert [t.id for t in tasks] == ["t1"]
+    revalidation = cached_client.session.request.call_args_list[1]
+    assert revalidation.kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert cached_client.cache.stats()["revalidated"] == 1
+
+
+def test_task_writes_invalidate_cache(api_config):
+    """Test that updating a task drops cached task list responses."""
+    global_rate_limiter.reset()
+    cached_client = _cached_client(api_config)
+    cached_client.session.request.return_value = _task_page(["t1"])
+    cached_client.get_tasks()
+    
+    updated = Mock()
+    updated.json.return_value = {"id": "t1", "name": "Renamed", "status": "todo"}
+    cached_client.session.request.return_value = updated
+    cached_client.update_task("t1", {"name": "Renamed"})
+    
+    cached_client.session.request.return_value = _task_page(["t1", "t2"])
+    assert len(cached_client.get_tasks()) == 2
+    assert cached_client.session.request.call_count == 3
+
+
+def test_bulk_update_returns_per_item_results(client):
+    """Test that one failing update does not stop the rest of the batch."""
+    global_rate_limiter.reset()
+    
+    def respond(method, url, **kwargs):
+        task_id = url.rsplit("/", 1)[-1]
+        if task_id == "bad":
+            response = Mock(status_code=404)
+            response.json.return_value = {"message": "Task not found"}
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError(
+                "404 Not Found", response=response
+            )
+            return response
+        response = Mock()
+        response.json.return_value = {"id": task_id, "name": kwargs["json"]["name"], "status": "todo"}
+        return response
+    
+    client.session.request.side_effect = respond
+    
+    results = client.bulk_update_tasks(
+        [("t1", {"name": "One"}), ("bad", {"name": "Bad"}), ("t3", {"name": "Three"})],
+        max_workers=2,
+    )
+    
+    assert [r.task_id for r in results] == ["t1", "bad", "t3"]
+    assert [r.ok for r in results] == [True, False, True]
+    assert results[0].task.name == "One"
+    assert isinstance(results[1].error, MotionAPIError)
+    assert results[1].error.status_code == 404
+
+
+def test_bulk_operations_bound_concurrency(client):
+    """Test that bulk requests never exceed the worker limit."""
+    global_rate_limiter.reset()
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+    
+    def respond(method, url, **kwargs):
+        with lock:
+            in_flight.append(url)
+            peak.append(len(in_flight))
+        time.sleep(0.05)
+        with lock:
+            in_flight.remove(url)
+        return Mock()
+    
+    client.session.request.side_effect = respond
+    
+    results = client.bulk_delete_tasks([f"t{i}" for i in range(6)], max_workers=2)
+    
+    assert all(r.ok for r in results)
+    assert max(peak) <= 2
+    assert client.session.request.call_count == 6
+
+
+def test_bulk_create_tasks(client):
+    """Test creating several tasks in one call."""
+    global_rate_limiter.reset()
+    
+    def respond(method, url, **kwargs):
+        response = Mock()
+        response.json.return_value = {"id": f"id_{kwargs['json']['name']}", "status": "todo", **kwargs["json"]}
+        return response
+    
+    client.session.request.side_effect = respond
+    
+    results = client.bulk_create_tasks([{"name": "a"}, {"name": "b"}])
+    
+    assert [r.task.id for r in results] == ["id_a", "id_b"]
+    assert all(r.task_id is None for r in results)
+
+
+def test_identical_concurrent_gets_are_coalesced(api_config):
+    """Test that concurrent identical GETs share a single network call."""
+    global_rate_limiter.reset()
+    group = SingleFlight()
+    with patch("requests.Session") as mock_session:
+        mock_session.return_value.headers = {}
+        coalescing_client = MotionClient(api_config, singleflight=group)
+        coalescing_client.session = mock_session.return_value
+    
+    def respond(method, url, **kwargs):
+        time.sleep(0.1)
+        return _task_page(["t1"])
+    
+    coalescing_client.session.request.side_effect = respond
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(coalescing_client.get_tasks(status="todo")))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(results) == 4
+    assert all(r[0].id == "t1" for r in results)
+    assert coalescing_client.session.request.call_count == 1
+    assert group.stats()["coalesced"] == 3
+
+
+def test_throttled_responses_feed_adaptive_rate(api_config):
+    """Test that a 429 with Retry-After slows and pauses the endpoint."""
+    global_rate_limiter.reset()
+    controller = AdaptiveRateController()
+    with patch("requests.Session") as mock_session:
+        mock_session.return_value.headers = {}
+        throttled_client = MotionClient(
+            api_config, rate_controller=controller, retry_policy=RetryPolicy(max_attempts=1)
+        )
+        throttled_client.session = mock_session.return_value
+    
+    response = Mock()
+    response.status_code = 429
+    response.headers = {"Retry-After": "30"}
+    response.json.return_value = {"message": "Too many requests"}
+    response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    throttled_client.session.request.return_value = response
+    
+    with pytest.raises(MotionAPIError):
+        throttled_client.get_task("task_1")
+    
+    state = controller.snapshot()["motion:/tasks"]
+    assert state["requests_per_minute"] == 6
+    assert state["paused_for"] > 25
+
+
+def test_default_controller_tunes_account_wide_limiter(client):
+    """Test that the default controller adjusts the global limiter rather than stacking on it."""
+    global_rate_limiter.reset()
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    client.session.request.return_value = _error_response(429)
+    
+    try:
+        with pytest.raises(MotionAPIError):
+            client.get_task("task_1")
+        assert global_rate_limiter.requests_per_minute == 6
+        assert global_rate_limiter.get_current_usage()[0] == 1
+    finally:
+        global_rate_controller.reset()
+    assert global_rate_limiter.requests_per_minute == 12
+
+
+def _error_response(status_code):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {}
+    response.json.return_value = {"message": "Server error"}
+    response.raise_for_status.side_effect = requests.HTTPError(response=response)
+    return response
+
+
+def test_get_is_retried_under_policy(client):
+    """Test that a transient GET failure is retried by the client's retry policy."""
+    global_rate_limiter.reset()
+    client.retry_policy = RetryPolicy(max_attempts=3, base_delay=0)
+    client.session.request.side_effect = [_error_response(503), _task_page(["t1"])]
+    
+    tasks = client.get_tasks()
+    
+    assert [t.id for t in tasks] == ["t1"]
+    assert client.session.request.call_count == 2
+
+
+def test_post_is_not_retried_on_server_error(client):
+    """Test that non-idempotent writes are not repeated after an ambiguous failure."""
+    global_rate_limiter.reset()
+    client.retry_policy = RetryPolicy(max_attempts=3, base_delay=0)
+    client.session.request.return_value = _error_response(502)
+    
+    with pytest.raises(MotionAPIError):
+        client.create_task({"name": "New Task"})
+    
+    assert client.session.request.call_count == 1
+
+
+def test_request_timeout_is_bounded_by_deadline(client):
+    """Test that the per-attempt timeout shrinks to the remaining deadline."""
+    global_rate_limiter.reset()
+    client.session.request.return_value = _task_page(["t1"])
+    
+    with deadline(2.0):
+        client.get_tasks()
+    
+    assert client.session.request.call_args.kwargs["timeout"] <= 2.0
+
+
+def test_open_circuit_serves_stale_cache(api_config):
+    """Test that an open circuit serves a stale cached GET instead of calling the API."""
+    global_rate_limiter.reset()
+    cached_client = _cached_client(api_config)
+    cached_client.circuit_breakers = CircuitBreakerRegistry(minimum_calls=1)
+    cached_client.session.request.return_value = _task_page(["t1"])
+    cached_client.get_tasks()
+    cached_client.circuit_breakers.get("motion:/tasks").record_failure()
+    
+    with patch("src.utils.http_cache.time.time", return_value=time.time() + 3600):
+        tasks = cached_client.get_tasks()
+    
+    assert [t.id for t in tasks] == ["t1"]
+    assert cached_client.session.request.call_count == 1
+
+
+def test_open_circuit_fails_fast(client):
+    """Test that repeated server errors open the circuit and later calls skip the network."""
+    global_rate_limiter.reset()
+    client.cache = None
+    client.retry_policy = RetryPolicy(max_attempts=1)
+    client.circuit_breakers = CircuitBreakerRegistry(minimum_calls=2)
+    client.session.request.return_value = _error_response(503)
+    
+    for _ in range(2):
+        with pytest.raises(MotionAPIError):
+            client.get_tasks()
+    with pytest.raises(MotionAPIError) as exc_info:
+        client.get_tasks()
+    
+    assert isinstance(exc_info.value.cause, CircuitOpenError)
+    assert client.session.request.call_count == 2
+
+
+def test_tolerant_ingestion_skips_bad_tasks(client):
+    """Test that with a quarantine one malformed task does not fail the whole fetch."""
+    global_rate_limiter.reset()
+    client.quarantine = Quarantine()
+    response = _task_page(["t1", "t2"])
+    response.json.return_value["tasks"].insert(1, {"id": "broken", "status": "todo"})
+    client.session.request.return_value = response
+    
+    tasks = client.get_tasks()
+    
+    assert [t.id for t in tasks] == ["t1", "t2"]
+    assert client.quarantine.stats()["quarantined"] == 1
+    assert client.quarantine.records()[0].record_id == "broken"
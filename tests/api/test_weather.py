@@ -8,6 +8,8 @@ import requests
 from requests.exceptions import RequestException
 
 from src.api.weather import WeatherAPI
+from src.utils.adaptive_rate import global_rate_controller
+from src.utils.circuit_breaker import CircuitBreakerRegistry
 from src.utils.config import WeatherAPIConfig
 from src.utils.exceptions import WeatherAPIError
 
@@ -26,9 +28,11 @@ def client(api_config):
     """Create a Weather API client with mocked session."""
     with patch("requests.Session") as mock_session:
         mock_session.return_value.headers = {}
-        client = WeatherAPI(api_config)
+        client = WeatherAPI(api_config, initial_retry_delay=0, circuit_breakers=CircuitBreakerRegistry())
         client.session = mock_session.return_value
+        global_rate_controller.reset()
         yield client
+        global_rate_controller.reset()
 
 
 def test_init_with_valid_config(api_config):
@@ -175,4 +179,25 @@ def test_request_exception_handling(client):
     with pytest.raises(WeatherAPIError) as exc_info:
         client.get_current_weather()
     assert "Connection error" in str(exc_info.value)
-    assert exc_info.value.status_code is None 
\ No newline at end of file
+    assert exc_info.value.status_code is None 
+
+
+def test_transient_errors_are_retried(client):
+    """Test that transient failures are retried up to the retry budget."""
+    client.session.get.side_effect = RequestException("Connection error")
+
+    with pytest.raises(WeatherAPIError):
+        client.get_current_weather()
+    assert client.session.get.call_count == client.retry_policy.max_attempts == 4
+
+
+def test_client_errors_are_not_retried(client):
+    """Test that non-transient HTTP errors fail on the first attempt."""
+    mock_response = Mock()
+    mock_response.status_code = 400
+    mock_response.json.return_value = {"error": {"code": 400, "message": "Bad request"}}
+    client.session.get.return_value = mock_response
+
+    with pytest.raises(WeatherAPIError):
+        client.get_current_weather()
+    client.session.get.assert_called_once()
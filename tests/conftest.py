@@ -6,6 +6,8 @@ from typing import Generator
 import pytest
 from moto import mock_secretsmanager, mock_ses
 
+from src.utils.circuit_breaker import global_circuit_breakers
+
 @pytest.fixture(autouse=True)
 def aws_credentials() -> None:
     """Mocked AWS Credentials for moto."""
@@ -15,6 +17,13 @@ def aws_credentials() -> None:
     os.environ["AWS_SESSION_TOKEN"] = "testing"
     os.environ["AWS_DEFAULT_REGION"] = "ap-southeast-2"
 
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers() -> Generator:
+    """Keep circuit breaker state from leaking between tests."""
+    global_circuit_breakers.reset()
+    yield
+    global_circuit_breakers.reset()
+
 @pytest.fixture
 def mock_secrets() -> Generator:
     """Mock AWS Secrets Manager."""
@@ -3,6 +3,7 @@ Tests for the weather processor module.
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 import pytest
 
@@ -301,4 +302,77 @@ def test_validate_weather_data_invalid_alert_time(weather_processor, weather_ale
     weather_processor.forecast.alerts.alerts[0].end_time = weather_alert.start_time  # Invalid time range
     is_valid, messages = weather_processor.validate_weather_data()
     assert not is_valid
-    assert any("Invalid alert time range" in msg for msg in messages) 
\ No newline at end of file
+    assert any("Invalid alert time range" in msg for msg in messages) 
+
+
+def test_get_digest_range(weather_forecast, daily_forecast, weather_alert):
+    """Test multi-day digest weather from one bucketing pass."""
+    second_day = daily_forecast.model_copy(update={
+        "date": daily_forecast.date + timedelta(days=1),
+        "max_temp_c": 31.0,
+        "total_precipitation_mm": 12.0,
+    })
+    forecast = weather_forecast.model_copy(update={"daily_forecasts": [daily_forecast, second_day]})
+    processor = WeatherProcessor(forecast)
+    start = datetime.now(ZoneInfo("Australia/Sydney"))
+    
+    result = processor.get_digest_range(start, days=3)
+    
+    assert [day["date"] for day in result["days"]] == [
+        (start + timedelta(days=i)).strftime("%A, %B %d, %Y") for i in range(2)
+    ]
+    assert result["days"][0] == processor.get_daily_digest_weather(start)
+    assert result["days"][1]["current"] is None
+    assert result["missing_days"] == [(start + timedelta(days=2)).date().isoformat()]
+    
+    overview = result["overview"]
+    assert overview["max_temperature"] == 31.0
+    assert overview["min_temperature"] == 18.0
+    assert overview["total_precipitation_mm"] == 17.0
+    assert overview["wettest_day"] == second_day.date.strftime("%A, %B %d")
+    # The 24h alert starts today and runs into tomorrow
+    expected_alert_days = sorted({weather_alert.start_time.date(), weather_alert.end_time.date()})
+    assert len(overview["days_with_alerts"]) == len(expected_alert_days)
+
+
+def test_get_digest_weather_many_reuses_trends_and_impact(weather_processor):
+    """Test that batch lookups compute trends and impact once per date."""
+    date = datetime.now(ZoneInfo("Australia/Sydney"))
+    with patch.object(
+        weather_processor, "_analyze_weather_trends", wraps=weather_processor._analyze_weather_trends
+    ) as trends, patch.object(
+        weather_processor, "_assess_weather_impact", wraps=weather_processor._assess_weather_impact
+    ) as impact:
+        results = weather_processor.get_digest_weather_many([date, date, date.replace(hour=0)])
+    
+    assert len(results) == 3
+    assert results[0] == results[1]
+    assert trends.call_count == 1
+    assert impact.call_count == 1
+    
+    # Cached results are copied, so callers cannot corrupt them
+    results[0]["impact"]["concerns"].append("Edited")
+    assert "Edited" not in weather_processor.get_daily_digest_weather(date)["impact"]["concerns"]
+    
+    with pytest.raises(ValidationError):
+        weather_processor.get_digest_weather_many([date + timedelta(days=5)])
+
+
+def test_active_alerts_use_alert_dates(weather_forecast, weather_alert):
+    """Test the alert index against the dates each alert covers."""
+    later = weather_alert.model_copy(update={
+        "alert_type": AlertType.WIND,
+        "title": "Wind Warning",
+        "start_time": weather_alert.start_time + timedelta(days=3),
+        "end_time": weather_alert.start_time + timedelta(days=5),
+    })
+    alerts = weather_forecast.alerts.model_copy(update={"alerts": [weather_alert, later]})
+    processor = WeatherProcessor(weather_forecast.model_copy(update={"alerts": alerts}))
+    
+    for offset in range(7):
+        date = weather_alert.start_time + timedelta(days=offset)
+        expected = [
+            alert.title for alert in (weather_alert, later)
+            if alert.start_time.date() <= date.date() <= alert.end_time.date()
+        ]
+        assert [alert.title for alert in processor._get_active_alerts(date)] == expected
@@ -5,6 +5,7 @@ from typing import Dict, Any
 
 import pytest
 
+from src.core.models.quarantine import Quarantine
 from src.core.models.task import Task, TaskCollection, TaskStatus, TaskPriority
 from src.utils.exceptions import ValidationError
 
@@ -298,4 +299,86 @@ class TestTaskCollection:
             "priority=TaskPriority.LOW, due_date=2024-03-22 10:00:00+00:00)\n"
             "])"
         )
-        assert str(collection) == expected_str 
\ No newline at end of file
+        assert str(collection) == expected_str 
+
+
+class TestBulkTaskParsing:
+    """Test the bulk Task parsing path."""
+
+    def test_bulk_matches_single_parsing(self, task_collection_data):
+        """Test that bulk parsing produces the same tasks as from_api_data."""
+        payload = [{**data, "custom": i} for i, data in enumerate(task_collection_data)]
+        tasks = Task.bulk_from_api_data(payload)
+        assert tasks == [Task.from_api_data(data) for data in payload]
+        assert tasks[1].metadata == {"custom": 1}
+
+    def test_trusted_mode_skips_validation(self, task_collection_data):
+        """Test that trusted mode builds equivalent tasks without validation."""
+        tasks = Task.bulk_from_api_data(task_collection_data, trusted=True)
+        assert [t.model_dump() for t in tasks] == [
+            Task.from_api_data(data).model_dump() for data in task_collection_data
+        ]
+        assert tasks[2].completed_at == datetime.fromisoformat("2024-03-19T11:00:00+00:00")
+
+    def test_trusted_tasks_accept_assignment(self, task_collection_data):
+        """Test that trusted tasks track assignments per instance."""
+        first, second = Task.bulk_from_api_data(task_collection_data[:2], trusted=True)
+        first.description = "Updated"
+        assert first.description == "Updated"
+        assert second.description != "Updated"
+        assert first.model_fields_set is not second.model_fields_set
+
+    def test_bulk_reports_invalid_item_index(self, task_collection_data):
+        """Test that a bad item fails the batch with its index in the details."""
+        payload = task_collection_data + [{"id": "task_4", "name": "", "status": "todo"}]
+        with pytest.raises(ValidationError) as exc_info:
+            Task.bulk_from_api_data(payload)
+        assert exc_info.value.details["index"] == 3
+
+        payload = [task_collection_data[0], {"id": "task_5", "name": "Bad", "status": "unknown"}]
+        with pytest.raises(ValidationError) as exc_info:
+            Task.bulk_from_api_data(payload)
+        assert exc_info.value.details["index"] == 1
+
+    def test_bulk_tolerant_mode_quarantines_bad_items(self, task_collection_data):
+        """Test that tolerant parsing keeps valid tasks and quarantines bad ones."""
+        quarantine = Quarantine()
+        payload = [
+            task_collection_data[0],
+            {"id": "task_4", "status": "todo"},
+            {"id": "task_5", "name": "Bad status", "status": "unknown"},
+            {"id": "task_6", "name": "", "status": "todo"},
+            {"id": "task_7", "name": "Bad date", "status": "todo", "due_date": "soon"},
+            task_collection_data[2],
+        ]
+        tasks = Task.bulk_from_api_data(payload, quarantine=quarantine)
+
+        assert [t.id for t in tasks] == ["task_1", "task_3"]
+        assert [(r.record_id, r.field) for r in quarantine.records()] == [
+            ("task_4", "name"),
+            ("task_5", "status"),
+            ("task_7", "due_date"),
+            ("task_6", "name"),
+        ]
+
+    def test_bulk_tolerates_null_fields_and_non_object_records(self, task_collection_data):
+        """Test that null fields parse and non-object records are quarantined, not raised."""
+        quarantine = Quarantine()
+        payload = [
+            {**task_collection_data[0], "due_date": None},
+            None,
+            {"id": "task_8", "name": "Null priority", "status": "todo", "priority": None},
+            task_collection_data[2],
+        ]
+        tasks = Task.bulk_from_api_data(payload, quarantine=quarantine)
+
+        assert [t.id for t in tasks] == ["task_1", "task_3"]
+        assert tasks[0].due_date is None
+        assert [(r.record_id, r.field) for r in quarantine.records()] == [
+            (None, None),
+            ("task_8", "priority"),
+        ]
+
+        with pytest.raises(ValidationError) as exc_info:
+            Task.bulk_from_api_data(payload)
+        assert exc_info.value.details["index"] == 1
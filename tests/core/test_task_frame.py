@@ -0,0 +1,101 @@
+"""Unit tests for the columnar TaskFrame."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.models.task import Task, TaskCollection, TaskPriority, TaskStatus
+from src.core.models.task_frame import TaskFrame
+
+
+@pytest.fixture
+def tasks() -> list[Task]:
+    """Create tasks covering optional fields, offsets and naive datetimes."""
+    aest = timezone(timedelta(hours=10))
+    return [
+        Task(
+            id="task_1",
+            name="Write report",
+            status=TaskStatus.TODO,
+            priority=TaskPriority.HIGH,
+            project_id="proj_1",
+            assignee_id="user_1",
+            due_date=datetime(2024, 3, 20, 10, tzinfo=timezone.utc),
+            scheduled_start=datetime(2024, 3, 20, 8, 30, tzinfo=aest),
+            tags=["docs"],
+            metadata={"workspaceId": "ws_1"},
+        ),
+        Task(
+            id="task_2",
+            name="Review PR",
+            status=TaskStatus.IN_PROGRESS,
+            priority=TaskPriority.LOW,
+            project_id="proj_2",
+            assignee_id="user_1",
+            scheduled_start=datetime(2024, 3, 19, 23, 0, tzinfo=timezone.utc),
+        ),
+        Task(
+            id="task_3",
+            name="Plan sprint",
+            status=TaskStatus.TODO,
+            project_id="proj_1",
+            created_at=datetime(2024, 3, 18, 9, 0),
+        ),
+    ]
+
+
+class TestTaskFrame:
+    """Test TaskFrame functionality."""
+
+    def test_round_trip_preserves_tasks(self, tasks):
+        """Test that tasks come back equal, including offsets and naive datetimes."""
+        frame = TaskFrame.from_collection(TaskCollection(tasks=tasks))
+        restored = frame.to_collection()
+
+        assert isinstance(restored, TaskCollection)
+        assert restored.tasks == tasks
+        assert restored[0].scheduled_start.utcoffset() == timedelta(hours=10)
+        assert restored[2].created_at.tzinfo is None
+
+    def test_materialized_tasks_accept_assignment(self, tasks):
+        """Test that tasks built from a frame can be modified independently."""
+        frame = TaskFrame.from_tasks(tasks)
+        task = frame[0]
+        task.description = "Updated"
+        assert task.description == "Updated"
+        assert frame[0].description == tasks[0].description
+
+    def test_filters_return_views(self, tasks):
+        """Test that filters select row indices over shared storage."""
+        frame = TaskFrame.from_tasks(tasks)
+        todo = frame.filter_by_status(TaskStatus.TODO)
+
+        assert list(todo.rows) == [0, 2]
+        assert todo._columns is frame._columns
+        assert todo.filter_by_project("proj_1").ids == ["task_1", "task_3"]
+        assert frame.filter_by_priority(TaskPriority.LOW).ids == ["task_2"]
+        assert frame.filter_by_assignee("user_1").filter_by_status("in_progress").ids == ["task_2"]
+        assert len(frame.filter_by_project("missing")) == 0
+
+    def test_filters_match_task_collection(self, tasks):
+        """Test that filters agree with the TaskCollection equivalents."""
+        collection = TaskCollection(tasks=tasks)
+        frame = TaskFrame.from_collection(collection)
+
+        for status in TaskStatus:
+            assert frame.filter_by_status(status).ids == [t.id for t in collection.filter_by_status(status)]
+        for day in (datetime(2024, 3, 19), datetime(2024, 3, 20)):
+            expected = [t.id for t in collection.filter_by_scheduled_date(day)]
+            assert frame.filter_by_scheduled_date(day).ids == expected
+
+    def test_append_only_on_base_frame(self, tasks):
+        """Test that views cannot be appended to and see a snapshot of rows."""
+        frame = TaskFrame.from_tasks(tasks[:2])
+        view = frame.filter_by_project("proj_1")
+        frame.append(tasks[2])
+
+        assert len(frame) == 3
+        assert view.ids == ["task_1"]
+        assert frame.filter_by_project("proj_1").ids == ["task_1", "task_3"]
+        with pytest.raises(TypeError):
+            view.append(tasks[2])
@@ -0,0 +1,97 @@
+"""Unit tests for IndexedTaskCollection and TaskQuery."""
+
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.core.models.task import Task, TaskCollection, TaskPriority, TaskStatus
+from src.core.models.task_index import IndexedTaskCollection
+
+
+@pytest.fixture
+def collection() -> TaskCollection:
+    """Create a varied task set with offsets, missing values and ties."""
+    rng = random.Random(7)
+    base = datetime(2024, 3, 18, tzinfo=timezone.utc)
+    offsets = [timezone.utc, timezone(timedelta(hours=11)), timezone(timedelta(hours=-5))]
+    tasks = []
+    for i in range(300):
+        start = base + timedelta(hours=rng.randrange(0, 24 * 7))
+        tasks.append(Task(
+            id=f"task_{i}",
+            name=f"Task {i}",
+            status=rng.choice(list(TaskStatus)),
+            priority=rng.choice([None, *TaskPriority]),
+            project_id=rng.choice([None, "proj_1", "proj_2", "proj_3"]),
+            assignee_id=rng.choice(["user_1", "user_2"]),
+            scheduled_start=start.astimezone(rng.choice(offsets)) if i % 5 else None,
+            due_date=(base + timedelta(days=rng.randrange(10))) if i % 4 else None,
+        ))
+    return TaskCollection(tasks=tasks)
+
+
+class TestTaskQuery:
+    """Test that indexed queries match TaskCollection chains."""
+
+    def test_fused_filters_match_chained_filters(self, collection):
+        """Test that equality filters give the same tasks in the same order."""
+        indexed = IndexedTaskCollection.from_collection(collection)
+        query = indexed.query().filter_by_status(TaskStatus.TODO).filter_by_project("proj_1")
+        expected = collection.filter_by_status(TaskStatus.TODO).filter_by_project("proj_1")
+        assert query.to_list() == expected.tasks
+
+        query = query.filter_by_assignee("user_2").filter_by_priority("high")
+        expected = expected.filter_by_assignee("user_2").filter_by_priority(TaskPriority.HIGH)
+        assert query.to_list() == expected.tasks
+        assert indexed.query().filter_by_project("missing").count() == 0
+
+    def test_sorting_matches_task_collection(self, collection):
+        """Test that sorting (with ties and missing values) matches TaskCollection."""
+        indexed = IndexedTaskCollection.from_collection(collection)
+        for ascending in (True, False):
+            expected = collection.filter_by_status(TaskStatus.DONE).sort_by_priority(ascending)
+            query = indexed.query().filter_by_status(TaskStatus.DONE).sort_by_priority(ascending)
+            assert query.to_list() == expected.tasks
+
+        with_due = TaskCollection(tasks=[t for t in collection if t.due_date])
+        expected = with_due.filter_by_project("proj_2").sort_by_due_date()
+        result = indexed.query().filter_by_project("proj_2").sort_by_due_date().to_list()
+        assert [t for t in result if t.due_date] == expected.tasks
+        assert all(t.due_date is None for t in result[len(expected):])
+
+    def test_scheduled_date_uses_each_tasks_time_zone(self, collection):
+        """Test that date filtering matches TaskCollection across UTC offsets."""
+        indexed = IndexedTaskCollection.from_collection(collection)
+        for day in range(17, 27):
+            date = datetime(2024, 3, day)
+            expected = collection.filter_by_scheduled_date(date).filter_by_assignee("user_1")
+            query = indexed.query().filter_by_scheduled_date(date).filter_by_assignee("user_1")
+            assert query.to_list() == expected.tasks
+
+    def test_ranges_and_limit(self, collection):
+        """Test range filters on the sorted indexes and result limits."""
+        indexed = IndexedTaskCollection.from_collection(collection)
+        start = datetime(2024, 3, 20, tzinfo=timezone.utc)
+        end = datetime(2024, 3, 21, 12, tzinfo=timezone.utc)
+        expected = [
+            t for t in collection
+            if t.scheduled_start and start <= t.scheduled_start < end and t.status == TaskStatus.TODO
+        ]
+        query = indexed.query().scheduled_between(start, end).filter_by_status("todo")
+        assert query.to_list() == expected
+        assert query.limit(3).to_list() == expected[:3]
+
+        due = indexed.query().due_between(None, datetime(2024, 3, 19, tzinfo=timezone.utc))
+        assert {t.id for t in due} == {
+            t.id for t in collection if t.due_date and t.due_date < datetime(2024, 3, 19, tzinfo=timezone.utc)
+        }
+
+    def test_queries_are_immutable(self, collection):
+        """Test that builder steps do not modify the query they extend."""
+        indexed = IndexedTaskCollection.from_collection(collection)
+        todo = indexed.query().filter_by_status(TaskStatus.TODO)
+        todo.filter_by_project("proj_1")
+
+        assert todo.count() == len(collection.filter_by_status(TaskStatus.TODO))
+        assert isinstance(todo.to_collection(), TaskCollection)
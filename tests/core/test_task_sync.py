@@ -0,0 +1,176 @@
+"""Unit tests for incremental task sync and the local task store."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.models.task import Task, TaskStatus
+from src.core.task_sync import IncrementalTaskSync, TaskStore
+from src.utils.exceptions import MotionAPIError
+
+T0 = datetime(2024, 3, 20, 8, 0, tzinfo=timezone.utc)
+
+
+def make_task(task_id: str, updated_at: datetime, **kwargs) -> Task:
+    """Helper to build a task."""
+    return Task(id=task_id, name=f"Task {task_id}", status=TaskStatus.TODO, updated_at=updated_at, **kwargs)
+
+
+@pytest.fixture
+def client():
+    """Create a mocked Motion client."""
+    return Mock()
+
+
+class TestTaskStore:
+    """Test TaskStore functionality."""
+
+    def test_upsert_keeps_newest_version(self):
+        """Test that older updates do not overwrite newer ones."""
+        store = TaskStore()
+        assert store.upsert(make_task("t1", T0 + timedelta(hours=1)))
+        assert not store.upsert(make_task("t1", T0))
+        assert store.get("t1").updated_at == T0 + timedelta(hours=1)
+
+    def test_tombstone_blocks_stale_resurrection(self):
+        """Test that a deleted task is not re-added by an older update."""
+        store = TaskStore()
+        store.upsert(make_task("t1", T0))
+        assert store.delete("t1", T0 + timedelta(minutes=5))
+        assert not store.upsert(make_task("t1", T0))
+        assert "t1" not in store
+        assert store.upsert(make_task("t1", T0 + timedelta(hours=1)))
+        assert "t1" in store
+
+    def test_delete_keeps_task_updated_after_tombstone(self):
+        """Test that a deletion older than the stored task does not remove it."""
+        store = TaskStore()
+        store.upsert(make_task("t1", T0 + timedelta(hours=2)))
+
+        result = store.merge([], deleted=[make_task("t1", T0 + timedelta(hours=1))], watermark=T0)
+
+        assert result.deleted == 0
+        assert store.get("t1").updated_at == T0 + timedelta(hours=2)
+        assert "t1" not in store.tombstones
+        assert store.delete("t1", T0 + timedelta(hours=3))
+        assert "t1" not in store
+
+    def test_merge_advances_watermark_monotonically(self):
+        """Test that the watermark never moves backwards."""
+        store = TaskStore()
+        store.merge([make_task("t1", T0)], watermark=T0 + timedelta(hours=1))
+        store.merge([], watermark=T0)
+        assert store.watermark == T0 + timedelta(hours=1)
+
+    def test_merge_tombstones_deleted_tasks_at_their_own_time(self):
+        """Test that deletions use each task's updated_at and only count removed tasks."""
+        store = TaskStore()
+        store.merge([make_task("t1", T0)], watermark=T0)
+
+        result = store.merge(
+            [],
+            deleted=[make_task("t1", T0 + timedelta(hours=1)), make_task("t9", T0 + timedelta(hours=2))],
+            watermark=T0 + timedelta(hours=3),
+        )
+
+        assert result.deleted == 1
+        assert store.tombstones["t1"] == T0 + timedelta(hours=1)
+        assert store.tombstones["t9"] == T0 + timedelta(hours=2)
+        assert store.upsert(make_task("t1", T0 + timedelta(hours=2)))
+
+    def test_persistence_round_trip(self, tmp_path):
+        """Test that tasks, tombstones and watermark survive a save/load."""
+        path = tmp_path / "tasks.json"
+        store = TaskStore(path)
+        store.merge([make_task("t1", T0), make_task("t2", T0)], deleted=["t3"], watermark=T0)
+        store.save()
+
+        reloaded = TaskStore(path)
+        assert len(reloaded) == 2
+        assert "t3" in reloaded.tombstones
+        assert reloaded.watermark == T0
+
+    def test_purge_tombstones(self):
+        """Test that expired tombstones are dropped."""
+        store = TaskStore(tombstone_ttl=timedelta(days=1))
+        store.delete("t1", T0)
+        assert store.purge_tombstones(now=T0 + timedelta(days=2)) == 1
+        assert store.tombstones == {}
+
+
+class TestIncrementalTaskSync:
+    """Test IncrementalTaskSync functionality."""
+
+    def test_first_sync_is_full(self, client):
+        """Test that the first sync fetches everything and sets the watermark."""
+        client.iter_tasks.return_value = iter([make_task("t1", T0), make_task("t2", T0 + timedelta(hours=1))])
+        sync = IncrementalTaskSync(client, TaskStore())
+
+        result = sync.sync()
+
+        assert result.full
+        client.iter_tasks.assert_called_once_with(updated_since=None)
+        assert len(sync.store) == 2
+        assert sync.store.watermark == T0 + timedelta(hours=1)
+
+    def test_incremental_sync_fetches_changes_since_watermark(self, client):
+        """Test that later syncs request only changes and merge them."""
+        store = TaskStore()
+        store.merge([make_task("t1", T0), make_task("t2", T0)], watermark=T0)
+        client.iter_tasks.return_value = iter([
+            make_task("t1", T0 + timedelta(hours=2), description="changed"),
+            make_task("t2", T0 + timedelta(hours=2), metadata={"deleted": True}),
+            make_task("t3", T0 + timedelta(hours=3)),
+        ])
+        sync = IncrementalTaskSync(client, store, overlap=timedelta(minutes=5))
+
+        result = sync.sync()
+
+        assert not result.full
+        client.iter_tasks.assert_called_once_with(updated_since=T0 - timedelta(minutes=5))
+        assert sorted(t.id for t in sync.get_tasks(sync=False)) == ["t1", "t3"]
+        assert store.get("t1").description == "changed"
+        assert "t2" in store.tombstones
+        assert store.watermark == T0 + timedelta(hours=3)
+
+    def test_full_sync_tombstones_missing_tasks(self, client):
+        """Test that a full resync removes tasks the API no longer returns."""
+        store = TaskStore()
+        store.merge([make_task("t1", T0), make_task("t2", T0 + timedelta(hours=1))], watermark=T0)
+        client.iter_tasks.return_value = iter([make_task("t1", T0)])
+
+        IncrementalTaskSync(client, store).sync(full=True)
+
+        assert "t2" not in store
+        assert "t2" in store.tombstones
+
+    def test_failed_sync_leaves_store_unchanged(self, client):
+        """Test that an API failure mid-sync does not advance the watermark."""
+        store = TaskStore()
+        store.merge([make_task("t1", T0)], watermark=T0)
+
+        def failing_pages(**kwargs):
+            yield make_task("t9", T0 + timedelta(hours=1))
+            raise MotionAPIError(message="boom", status_code=500)
+
+        client.iter_tasks.side_effect = failing_pages
+        with pytest.raises(MotionAPIError):
+            IncrementalTaskSync(client, store).sync()
+
+        assert store.watermark == T0
+        assert "t9" not in store
+
+    def test_scheduled_for_today_served_from_store(self, client):
+        """Test that today's tasks are filtered from the local store."""
+        now = datetime.now(timezone.utc)
+        store = TaskStore()
+        store.merge([
+            make_task("today", T0, scheduled_start=now),
+            make_task("later", T0, scheduled_start=now + timedelta(days=3)),
+        ], watermark=T0)
+
+        tasks = IncrementalTaskSync(client, store).get_tasks_scheduled_for_today(sync=False)
+
+        assert [t.id for t in tasks] == ["today"]
+        client.iter_tasks.assert_not_called()
@@ -11,6 +11,7 @@ from src.api.motion import MotionClient
 from src.core.models.task import Task, TaskCollection, TaskStatus, TaskPriority
 from src.utils.config import MotionAPIConfig
 from src.utils.exceptions import MotionAPIError, ValidationError
+from src.utils.adaptive_rate import global_rate_controller
 from src.utils.rate_limiter import global_rate_limiter
 
 
@@ -32,9 +33,11 @@ def mock_motion_client(api_config):
         client.session = mock_session.return_value
         # Reset rate limiter before each test
         global_rate_limiter.reset()
+        global_rate_controller.reset()
         yield client
         # Reset rate limiter after each test
         global_rate_limiter.reset()
+        global_rate_controller.reset()
 
 
 @pytest.fixture
@@ -252,6 +255,10 @@ class TestMotionAPIClientIntegration:
         assert error.status_code == 429
         assert "Rate limit exceeded" in str(error)
 
+        # The 429s above throttled the shared limiter; start the next case fresh
+        global_rate_controller.reset()
+        global_rate_limiter.reset()
+
         # Test network error
         mock_motion_client.session.request.side_effect = RequestException("Connection failed")
         with pytest.raises(MotionAPIError) as exc_info:
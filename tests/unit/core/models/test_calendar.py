@@ -6,6 +6,7 @@ of calendar event models.
 """
 
 from datetime import datetime, timedelta
+from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -18,6 +19,9 @@ from src.core.models.calendar import (
     EventType,
     SYDNEY_TIMEZONE,
 )
+from src.utils.timezone import dst_transition_index
+from src.core.models.quarantine import Quarantine
+from src.core.models.recurrence import iter_starts, occurrence_cache
 from src.utils.exceptions import ValidationError
 
 
@@ -287,4 +291,152 @@ def test_event_collection_timezone_conversion():
         assert event.start_time.tzinfo == SYDNEY_TIMEZONE
         assert event.end_time.tzinfo == SYDNEY_TIMEZONE
         assert event.start_time.hour == expected_hour
-        assert event.end_time.hour == expected_hour + 1 
\ No newline at end of file
+        assert event.end_time.hour == expected_hour + 1 
+
+
+def test_event_collection_to_timezone_reuses_unchanged_events(monkeypatch):
+    """Test that bulk conversion keeps converted events and skips validation."""
+    utc_event = CalendarEvent.from_api_data({
+        **VALID_EVENT_DATA,
+        "id": "event_utc",
+        "start": "2024-03-20T00:00:00+00:00",
+        "end": "2024-03-20T01:00:00+00:00",
+    })
+    sydney_event = utc_event.to_sydney_time()
+    collection = CalendarEventCollection([utc_event, sydney_event])
+    
+    is_near_transition = MagicMock(return_value=False)
+    monkeypatch.setattr(dst_transition_index, "is_near_transition", is_near_transition)
+    converted = collection.to_timezone(SYDNEY_TIMEZONE)
+    
+    assert converted.events[1] is sydney_event
+    assert converted.events[0] is not utc_event
+    assert converted.events[0].start_time == utc_event.start_time
+    assert converted.events[0].start_time.tzinfo is SYDNEY_TIMEZONE
+    assert converted.events[0].created_at.tzinfo is SYDNEY_TIMEZONE
+    assert utc_event.start_time.hour == 0
+    is_near_transition.assert_not_called()
+    
+    again = converted.to_sydney_time()
+    assert all(a is b for a, b in zip(again, converted))
+
+
+def test_bulk_from_api_data_quarantines_bad_events():
+    """Test that tolerant parsing keeps valid events and quarantines bad ones."""
+    quarantine = Quarantine()
+    bad_times = {**VALID_EVENT_DATA, "id": "event_bad", "end": "2024-03-20T09:00:00+10:00"}
+    bad_type = {**VALID_EVENT_DATA, "id": "event_type", "type": "party"}
+    events = CalendarEvent.bulk_from_api_data([VALID_EVENT_DATA, bad_times, bad_type], quarantine=quarantine)
+    
+    assert [e.id for e in events] == ["event_123"]
+    assert [(r.record_id, r.field) for r in quarantine.records()] == [
+        ("event_bad", "end_time"),
+        ("event_type", "type"),
+    ]
+    
+    with pytest.raises(ValidationError):
+        CalendarEvent.bulk_from_api_data([VALID_EVENT_DATA, bad_type])
+
+
+def test_bulk_from_api_data_quarantines_null_fields_and_non_objects():
+    """Test that a null start or a non-object record is quarantined instead of aborting the batch."""
+    quarantine = Quarantine()
+    null_start = {**VALID_EVENT_DATA, "id": "event_null", "start": None}
+    events = CalendarEvent.bulk_from_api_data(
+        [null_start, VALID_EVENT_DATA, None, "event_123"], quarantine=quarantine
+    )
+    
+    assert [e.id for e in events] == ["event_123"]
+    assert [(r.record_id, r.field) for r in quarantine.records()] == [
+        ("event_null", "start_time"),
+        (None, None),
+        (None, None),
+    ]
+    
+    for bad in (null_start, None):
+        with pytest.raises(ValidationError):
+            CalendarEvent.bulk_from_api_data([VALID_EVENT_DATA, bad])
+
+
+def test_recurring_event_expands_only_inside_window():
+    """Test lazy RRULE expansion, including wall-clock times across DST."""
+    occurrence_cache.clear()
+    event = CalendarEvent.from_api_data({
+        **VALID_EVENT_DATA,
+        "id": "standup",
+        "start": "2024-03-04T09:00:00+11:00",
+        "end": "2024-03-04T09:15:00+11:00",
+        "recurrence": ["RRULE:FREQ=WEEKLY;BYDAY=MO,WE", "EXDATE:20240313T090000"],
+    }).to_sydney_time()
+    
+    window_start = datetime(2024, 3, 11, tzinfo=SYDNEY_TIMEZONE)
+    occurrences = list(event.occurrences(window_start, window_start + timedelta(days=28)))
+    
+    # The 13th is excluded; DST ends on 7 April but meetings stay at 9am
+    assert [o.start_time.day for o in occurrences] == [11, 18, 20, 25, 27, 1, 3]
+    assert all(o.start_time.hour == 9 and o.end_time.minute == 15 for o in occurrences)
+    assert occurrences[0].id == "standup_20240311T090000"
+    assert occurrences[0].metadata["series_id"] == "standup"
+    assert not any(o.is_recurring for o in occurrences)
+    
+    list(event.occurrences(window_start, window_start + timedelta(days=28)))
+    assert occurrence_cache.stats()["hits"] == 1
+
+
+def test_recurring_event_converts_utc_and_tzid_exdates():
+    """Test that timezone-aware EXDATEs exclude the occurrence at the same instant."""
+    event = CalendarEvent.from_api_data({
+        **VALID_EVENT_DATA,
+        "id": "standup",
+        "start": "2024-03-04T09:00:00+11:00",
+        "end": "2024-03-04T09:15:00+11:00",
+        "recurrence": [
+            "RRULE:FREQ=WEEKLY;BYDAY=MO,WE",
+            "EXDATE:20240312T220000Z",
+            "EXDATE;TZID=Asia/Tokyo:20240318T070000",
+        ],
+    }).to_sydney_time()
+    
+    window_start = datetime(2024, 3, 11, tzinfo=SYDNEY_TIMEZONE)
+    occurrences = event.occurrences(window_start, window_start + timedelta(days=14))
+    
+    assert [o.start_time.day for o in occurrences] == [11, 20]
+
+
+def test_iter_starts_keeps_zero_length_occurrence_at_window_start():
+    """Test that an instant occurrence exactly at the window start is yielded."""
+    dtstart = datetime(2024, 3, 1, 9, tzinfo=SYDNEY_TIMEZONE)
+    window_start = datetime(2024, 3, 5, 9, tzinfo=SYDNEY_TIMEZONE)
+    
+    starts = list(iter_starts("FREQ=DAILY", dtstart, window_start, window_start + timedelta(days=2)))
+    
+    assert starts == [window_start, window_start + timedelta(days=1)]
+    # With a length, an occurrence ending exactly at the window start does not overlap it
+    later = window_start + timedelta(hours=1)
+    assert list(iter_starts("FREQ=DAILY", dtstart, later, later + timedelta(hours=1), timedelta(hours=1))) == []
+
+
+def test_collection_expand_recurring():
+    """Test that collections replace series with occurrences in the window."""
+    single = CalendarEvent.from_api_data(VALID_EVENT_DATA)
+    collection = CalendarEventCollection([single])
+    assert collection.expand_recurring(datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE), datetime(2024, 3, 21, tzinfo=SYDNEY_TIMEZONE)) is collection
+    
+    daily = CalendarEvent.from_api_data({
+        **VALID_EVENT_DATA,
+        "id": "daily",
+        "start": "2024-03-01T08:00:00+11:00",
+        "end": "2024-03-01T08:30:00+11:00",
+        "recurrence": "FREQ=DAILY;COUNT=30",
+    })
+    collection = CalendarEventCollection([single, daily])
+    day = datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE)
+    expanded = collection.expand_recurring(day, day + timedelta(days=1))
+    assert [e.id for e in expanded] == ["event_123", "daily_20240320T080000"]
+
+
+def test_invalid_recurrence_rule():
+    """Test that unparseable rules are rejected on the recurrence field."""
+    with pytest.raises(ValidationError) as exc_info:
+        CalendarEvent.from_api_data({**VALID_EVENT_DATA, "recurrence": "FREQ=SOMETIMES"})
+    assert exc_info.value.details["field"] == "recurrence"
@@ -0,0 +1,98 @@
+"""Unit tests for the calendar event interval index."""
+
+import random
+from datetime import datetime, timedelta
+
+from src.core.models.calendar import (
+    CalendarEvent,
+    CalendarEventCollection,
+    EventStatus,
+    EventType,
+    SYDNEY_TIMEZONE,
+)
+from src.core.models.event_index import EventIntervalIndex
+
+BASE = datetime(2024, 5, 6, tzinfo=SYDNEY_TIMEZONE)
+
+
+def make_event(event_id: str, start_hour: float, hours: float) -> CalendarEvent:
+    """Create a confirmed meeting starting ``start_hour`` hours after BASE."""
+    start = BASE + timedelta(hours=start_hour)
+    return CalendarEvent(
+        id=event_id,
+        title=event_id,
+        start_time=start,
+        end_time=start + timedelta(hours=hours),
+        status=EventStatus.CONFIRMED,
+        type=EventType.MEETING,
+    )
+
+
+def test_events_in_range_matches_linear_scan():
+    """Test that range queries agree with a brute-force overlap check."""
+    rng = random.Random(7)
+    events = [
+        make_event(f"event_{i}", rng.randrange(0, 24 * 28), rng.choice([0.5, 1, 3, 30, 200]))
+        for i in range(300)
+    ]
+    index = EventIntervalIndex(events)
+    
+    for _ in range(50):
+        start = BASE + timedelta(hours=rng.randrange(-48, 24 * 30))
+        end = start + timedelta(hours=rng.randrange(1, 24 * 7))
+        expected = [e for e in events if e.start_time < end and e.end_time > start]
+        assert index.events_in_range(start, end) == expected
+
+
+def test_events_in_range_inclusive_keeps_events_ending_at_start():
+    """Test that inclusive queries also return events ending exactly at the range start."""
+    events = [make_event("before", 0, 2), make_event("after", 2, 1)]
+    index = EventIntervalIndex(events)
+    start, end = BASE + timedelta(hours=2), BASE + timedelta(hours=4)
+    
+    assert [e.id for e in index.events_in_range(start, end)] == ["after"]
+    assert [e.id for e in index.events_in_range(start, end, inclusive=True)] == ["before", "after"]
+
+
+def test_overlapping_excludes_the_event_itself():
+    """Test overlap lookup for a single event."""
+    events = [make_event("long", 0, 8), make_event("a", 1, 1), make_event("b", 9, 1)]
+    collection = CalendarEventCollection(events)
+    
+    assert [e.id for e in collection.overlapping(events[0])] == ["a"]
+    assert [e.id for e in collection.overlapping(events[2])] == []
+
+
+def test_all_conflicts_finds_non_adjacent_overlaps():
+    """Test that a long event conflicts with every event it spans, not just the next one."""
+    events = [
+        make_event("c", 3, 1),
+        make_event("long", 0, 8),
+        make_event("a", 1, 1),
+        make_event("b", 2, 0.5),
+        make_event("later", 10, 1),
+    ]
+    conflicts = CalendarEventCollection(events).all_conflicts()
+    
+    assert [(a.id, b.id) for a, b in conflicts] == [("long", "a"), ("long", "b"), ("long", "c")]
+
+
+def test_collection_rebuilds_index_when_events_change():
+    """Test that the cached index follows changes to the event list."""
+    collection = CalendarEventCollection([make_event("a", 1, 1)])
+    first = collection.index()
+    assert collection.index() is first
+    
+    collection.events.append(make_event("b", 1.5, 1))
+    assert collection.index() is not first
+    assert len(collection.all_conflicts()) == 1
+    
+    collection.events[1] = make_event("c", 5, 1)
+    assert collection.all_conflicts() == []
+    assert [e.id for e in collection.events_in_range(BASE, BASE + timedelta(days=1)).events] == ["a", "c"]
+    
+    indexed = collection.index()
+    assert collection.index() is indexed
+    collection.events = [make_event("d", 1, 1), make_event("e", 1, 1)]
+    assert collection.index() is not indexed
+    assert len(collection.all_conflicts()) == 1
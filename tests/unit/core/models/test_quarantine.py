@@ -0,0 +1,42 @@
+"""Unit tests for the ingestion quarantine."""
+
+from src.core.models.quarantine import Quarantine, fingerprint
+from src.utils.exceptions import ValidationError
+
+
+def test_quarantine_keeps_only_compact_records():
+    """Test that quarantined entries hold a fingerprint, id and field, not the payload."""
+    quarantine = Quarantine()
+    data = {"id": "task_1", "status": "todo", "description": "x" * 10_000}
+    record = quarantine.add("task", data, ValidationError("Task name is required", field="name"))
+    
+    assert record.record_id == "task_1"
+    assert record.field == "name"
+    assert record.fingerprint == fingerprint(dict(reversed(list(data.items()))))
+    assert "x" * 100 not in repr(record)
+
+
+def test_quarantine_is_bounded():
+    """Test that old records are dropped but still counted."""
+    quarantine = Quarantine(max_records=2)
+    for i in range(5):
+        quarantine.add("event", {"id": f"event_{i}"}, KeyError("title"))
+    
+    assert [r.record_id for r in quarantine.records()] == ["event_3", "event_4"]
+    assert quarantine.records()[0].field == "title"
+    assert quarantine.stats() == {
+        "quarantined": 5,
+        "retained": 2,
+        "dropped": 3,
+        "by_kind": {"event": 5},
+    }
+
+
+def test_quarantine_from_env(monkeypatch):
+    """Test that tolerant ingestion is opt-in via environment variables."""
+    monkeypatch.delenv("MOTION_QUARANTINE_ENABLED", raising=False)
+    assert Quarantine.from_env() is None
+    
+    monkeypatch.setenv("MOTION_QUARANTINE_ENABLED", "true")
+    monkeypatch.setenv("MOTION_QUARANTINE_MAX_RECORDS", "7")
+    assert Quarantine.from_env().max_records == 7
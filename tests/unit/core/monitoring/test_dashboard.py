@@ -1,8 +1,10 @@
 import pytest
+from unittest.mock import MagicMock
 from src.core.monitoring.dashboard import MonitoringDashboard
 from src.core.monitoring.monitor import MonitoringSystem
 from src.core.monitoring.alert import AlertSystem
 from src.core.monitoring.health import HealthCheckSystem
+from src.utils.circuit_breaker import CircuitBreakerRegistry
 
 def test_dashboard_status_aggregation():
     monitor = MonitoringSystem()
@@ -17,4 +19,13 @@ def test_dashboard_status_aggregation():
     assert status['metrics'] == {'cpu': 0.7}
     assert status['kpis'] == {'uptime': 99.8}
     assert status['alerts'] == ['cpu']
-    assert status['health']['db']['status'] is True 
\ No newline at end of file
+    assert status['health']['db']['status'] is True 
+def test_dashboard_reports_circuit_breakers():
+    breakers = CircuitBreakerRegistry(minimum_calls=1)
+    breakers.get('motion:/tasks').record_failure()
+    breakers.get('weather:forecast/days:lookup').record_success()
+    alert = MagicMock(rules=[])
+    dashboard = MonitoringDashboard(monitor=MonitoringSystem(), alert=alert, health=HealthCheckSystem(), circuit_breakers=breakers)
+    status = dashboard.get_status()
+    assert status['circuit_breakers']['motion:/tasks']['state'] == 'open'
+    assert status['circuit_breakers']['weather:forecast/days:lookup']['state'] == 'closed'
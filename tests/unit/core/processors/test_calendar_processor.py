@@ -5,7 +5,9 @@ This module tests the processing of calendar events for the daily digest email,
 including filtering, sorting, formatting, and grouping operations.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from unittest.mock import patch
 from zoneinfo import ZoneInfo
 
 import pytest
@@ -17,7 +19,7 @@ from src.core.models.calendar import (
     EventType,
     SYDNEY_TIMEZONE,
 )
-from src.core.processors.calendar import CalendarEventProcessor
+from src.core.processors.calendar import CalendarEventProcessor, FormatCache
 from src.utils.exceptions import ValidationError
 
 # Rename module to avoid conflict
@@ -145,19 +147,16 @@ def test_group_events_by_time_of_day(test_events):
     
     groups = processor.group_events_by_time_of_day(daily_events)
     
-    # The processor uses datetime.now for time boundaries, so all test events are grouped as 'morning'.
-    assert len(groups["morning"]) == 6
-    assert len(groups["afternoon"]) == 0
-    assert len(groups["evening"]) == 0
+    # Boundaries come from each event's own date
+    assert len(groups["morning"]) == 3
+    assert len(groups["afternoon"]) == 2
+    assert len(groups["evening"]) == 1
     
     # Verify event assignments
     morning_titles = {event.title for event in groups["morning"]}
-    assert "Early Call" in morning_titles
-    assert "Morning Meeting" in morning_titles
-    assert "All Day Event" in morning_titles
-    assert "Team Lunch" in morning_titles
-    assert "Project Review" in morning_titles
-    assert "Dinner" in morning_titles
+    assert morning_titles == {"Early Call", "Morning Meeting", "All Day Event"}
+    assert {event.title for event in groups["afternoon"]} == {"Team Lunch", "Project Review"}
+    assert [event.title for event in groups["evening"]] == ["Dinner"]
 
 
 def test_format_event_for_digest(test_events):
@@ -190,10 +189,10 @@ def test_get_digest_summary(test_events):
     assert summary["date"] == "Wednesday, March 20, 2024"
     assert summary["total_events"] == 6
     
-    # The processor uses datetime.now for time boundaries, so all test events are grouped as 'morning'.
-    assert summary["events_by_period"]["morning"] == 6
-    assert summary["events_by_period"]["afternoon"] == 0
-    assert summary["events_by_period"]["evening"] == 0
+    # Periods use the boundaries of the summary date
+    assert summary["events_by_period"]["morning"] == 3
+    assert summary["events_by_period"]["afternoon"] == 2
+    assert summary["events_by_period"]["evening"] == 1
     
     # Check event type distribution
     assert summary["events_by_type"][EventType.MEETING] == 4
@@ -202,8 +201,8 @@ def test_get_digest_summary(test_events):
     
     # Check formatted events
     assert "Morning Meeting" in [e["title"] for e in summary["formatted_events"]["morning"]]
-    assert "Team Lunch" in [e["title"] for e in summary["formatted_events"]["morning"]]
-    assert "Dinner" in [e["title"] for e in summary["formatted_events"]["morning"]]
+    assert "Team Lunch" in [e["title"] for e in summary["formatted_events"]["afternoon"]]
+    assert "Dinner" in [e["title"] for e in summary["formatted_events"]["evening"]]
 
 
 def test_validate_digest_events(test_events):
@@ -260,4 +259,168 @@ def test_validate_digest_events(test_events):
     is_valid, messages = processor.validate_digest_events(invalid_collection)
     assert not is_valid
     assert any("is not confirmed" in msg for msg in messages)
-    assert any("Events overlap" in msg for msg in messages) 
\ No newline at end of file
+    assert any("Events overlap" in msg for msg in messages) 
+
+def test_validate_digest_events_reports_non_adjacent_overlaps(test_events):
+    """Test that an event overlapping several later events is reported for each."""
+    processor = CalendarEventProcessor(test_events)
+    base_time = datetime(2024, 3, 21, tzinfo=SYDNEY_TIMEZONE)
+    events = CalendarEventCollection([
+        create_test_event("long", "Workshop", base_time.replace(hour=9), base_time.replace(hour=17)),
+        create_test_event("short_1", "Standup", base_time.replace(hour=10), base_time.replace(hour=10, minute=15)),
+        create_test_event("short_2", "Review", base_time.replace(hour=14), base_time.replace(hour=15)),
+    ])
+    
+    is_valid, messages = processor.validate_digest_events(events)
+    assert not is_valid
+    assert messages == [
+        "Events overlap: 'Workshop' and 'Standup'",
+        "Events overlap: 'Workshop' and 'Review'",
+    ]
+
+
+def test_daily_digest_includes_recurring_occurrences(test_events):
+    """Test that a recurring series shows up on the days it occurs."""
+    series = create_test_event(
+        "weekly",
+        "Weekly Sync",
+        datetime(2024, 1, 3, 16, tzinfo=SYDNEY_TIMEZONE),
+        datetime(2024, 1, 3, 17, tzinfo=SYDNEY_TIMEZONE),
+        recurrence="FREQ=WEEKLY;BYDAY=WE",
+    )
+    processor = CalendarEventProcessor(CalendarEventCollection([*test_events, series]))
+    
+    wednesday = processor.get_daily_digest_events(datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE))
+    assert "weekly_20240320T160000" in [e.id for e in wednesday]
+    assert "weekly" not in [e.id for e in wednesday]
+    
+    thursday = processor.get_daily_digest_events(datetime(2024, 3, 21, tzinfo=SYDNEY_TIMEZONE))
+    assert not any(e.id.startswith("weekly") for e in thursday)
+
+
+def test_digest_summary_reports_validation_findings(test_events):
+    """Test that the single-pass summary also reports overlaps."""
+    processor = CalendarEventProcessor(test_events)
+    summary = processor.get_digest_summary(datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE))
+    
+    assert not summary["validation"]["is_valid"]
+    assert summary["validation"]["messages"]
+    assert all("Events overlap" in msg for msg in summary["validation"]["messages"])
+    assert sum(summary["events_by_type"].values()) == summary["total_events"]
+
+
+def test_digest_summary_memoizes_formatting(test_events):
+    """Test that formatted events are reused across summaries sharing a cache."""
+    updated = datetime(2024, 3, 1, tzinfo=SYDNEY_TIMEZONE)
+    events = CalendarEventCollection([
+        event.model_copy(update={"updated_at": updated}) for event in test_events
+    ])
+    date = datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE)
+    cache = {}
+    first = CalendarEventProcessor(events, format_cache=cache)
+    expected = first.get_digest_summary(date)["formatted_events"]
+    
+    second = CalendarEventProcessor(events, format_cache=cache)
+    with patch.object(second, "format_event_for_digest", wraps=second.format_event_for_digest) as fmt:
+        assert second.get_digest_summary(date)["formatted_events"] == expected
+    fmt.assert_not_called()
+    assert len(cache) == sum(len(v) for v in expected.values())
+
+
+def test_default_format_cache_is_bounded(test_events):
+    """Test that the default format cache evicts the least recently used entries."""
+    cache = FormatCache(max_entries=2)
+    cache["a"] = 1
+    cache["b"] = 2
+    assert cache.get("a") == 1
+    cache["c"] = 3
+    
+    assert list(cache) == ["a", "c"]
+    assert cache.get("b", "missing") == "missing"
+    assert isinstance(CalendarEventProcessor(test_events).format_cache, FormatCache)
+
+
+def test_format_cache_is_thread_safe():
+    """Test that concurrent lookups and inserts with constant eviction do not fail."""
+    cache = FormatCache(max_entries=8)
+    
+    def worker(offset):
+        for i in range(2000):
+            key = (offset + i) % 16
+            if cache.get(key) is None:
+                cache[key] = key
+    
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(worker, range(4)))
+    
+    assert len(cache) == 8
+    assert all(cache.get(key) == key for key in list(cache))
+
+
+def test_get_digest_range_matches_daily_summaries(test_events):
+    """Test that the range API agrees with per-day summaries."""
+    processor = CalendarEventProcessor(test_events)
+    start = datetime(2024, 3, 19, 15, tzinfo=SYDNEY_TIMEZONE)
+    
+    result = processor.get_digest_range(start, days=3)
+    
+    assert [day["date"] for day in result["days"]] == [
+        "Tuesday, March 19, 2024",
+        "Wednesday, March 20, 2024",
+        "Thursday, March 21, 2024",
+    ]
+    for offset, day in enumerate(result["days"]):
+        date = datetime(2024, 3, 19 + offset, tzinfo=SYDNEY_TIMEZONE)
+        assert day == processor.get_digest_summary(date)
+    
+    overview = result["overview"]
+    # The all-day event ends at midnight, so it also touches the 21st
+    assert [day["total_events"] for day in result["days"]] == [0, 6, 2]
+    assert overview["total_events"] == 7
+    assert overview["busiest_day"] == "Wednesday, March 20, 2024"
+    assert overview["days_with_conflicts"] == ["Wednesday, March 20, 2024"]
+    assert overview["busy_minutes"] == sum(day["free_busy"]["busy_minutes"] for day in result["days"])
+
+
+def test_get_digest_range_uses_working_hours_timezone(test_events):
+    """Test that a start in another timezone is read as a working-hours date."""
+    processor = CalendarEventProcessor(test_events)
+    # 10am on the 20th in Auckland is also the 20th in Sydney, but Auckland's
+    # midnight is still the 19th there
+    start = datetime(2024, 3, 20, 10, tzinfo=ZoneInfo("Pacific/Auckland"))
+    
+    result = processor.get_digest_range(start, days=1)
+    
+    assert result["days"] == [processor.get_digest_summary(datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE))]
+
+
+def test_get_digest_summary_uses_working_hours_timezone(test_events):
+    """Test that events, periods and free/busy all use the working-hours date."""
+    processor = CalendarEventProcessor(test_events)
+    # 00:30 on the 21st in Auckland is still 10:30pm on the 20th in Sydney
+    date = datetime(2024, 3, 21, 0, 30, tzinfo=ZoneInfo("Pacific/Auckland"))
+    
+    summary = processor.get_digest_summary(date)
+    
+    assert summary == processor.get_digest_summary(datetime(2024, 3, 20, tzinfo=SYDNEY_TIMEZONE))
+    assert summary["total_events"] == 6
+
+
+def test_get_digest_range_spans_dst_change():
+    """Test that day buckets follow local midnight across a DST change."""
+    events = CalendarEventCollection([
+        create_test_event(
+            "standup",
+            "Standup",
+            datetime(2024, 4, 1, 9, tzinfo=SYDNEY_TIMEZONE),
+            datetime(2024, 4, 1, 9, 15, tzinfo=SYDNEY_TIMEZONE),
+            recurrence="FREQ=DAILY",
+        ),
+    ])
+    processor = CalendarEventProcessor(events)
+    
+    result = processor.get_digest_range(datetime(2024, 4, 5, tzinfo=SYDNEY_TIMEZONE), days=4)
+    
+    assert [day["total_events"] for day in result["days"]] == [1, 1, 1, 1]
+    assert all(day["events_by_period"]["morning"] == 1 for day in result["days"])
+    assert [day["formatted_events"]["morning"][0]["time"] for day in result["days"]] == ["9:00 AM - 9:15 AM"] * 4
@@ -0,0 +1,172 @@
+"""
+Unit tests for the free/busy calculator.
+
+This module tests interval merging, working-hour clipping and the free/busy
+section of the digest summary.
+"""
+
+import random
+from datetime import date, datetime, time, timedelta
+
+import pytest
+
+from src.core.models.calendar import (
+    CalendarEvent,
+    CalendarEventCollection,
+    EventStatus,
+    EventType,
+    SYDNEY_TIMEZONE,
+)
+from src.core.processors.calendar import CalendarEventProcessor
+from src.core.processors.free_busy import (
+    FreeBusyCalculator,
+    WorkingHours,
+    merge_intervals,
+)
+from src.utils.exceptions import ValidationError
+
+MONDAY = datetime(2024, 5, 6, tzinfo=SYDNEY_TIMEZONE)
+
+
+def at(hour: float, day: int = 0) -> datetime:
+    """Time on MONDAY plus ``day`` days."""
+    return MONDAY + timedelta(days=day, hours=hour)
+
+
+def create_event(
+    event_id: str,
+    start: datetime,
+    end: datetime,
+    status: EventStatus = EventStatus.CONFIRMED,
+) -> CalendarEvent:
+    """Helper function to create test events."""
+    return CalendarEvent(
+        id=event_id,
+        title=event_id,
+        start_time=start,
+        end_time=end,
+        status=status,
+        type=EventType.MEETING,
+    )
+
+
+def blocks(items):
+    """(start hour, end hour) pairs for comparing blocks."""
+    return [(b.start.hour + b.start.minute / 60, b.end.hour + b.end.minute / 60) for b in items]
+
+
+def test_merge_intervals_merges_overlapping_and_touching_events():
+    """Test the sort-and-sweep merge."""
+    events = [
+        create_event("c", at(13), at(14)),
+        create_event("a", at(9), at(10)),
+        create_event("b", at(9.5), at(11)),
+        create_event("d", at(14), at(15)),
+        create_event("e", at(16), at(16.5)),
+    ]
+    
+    merged = merge_intervals(events)
+    assert blocks(merged) == [(9, 11), (13, 15), (16, 16.5)]
+    assert merged[0].event_ids == ("a", "b")
+    assert merged[1].event_ids == ("c", "d")
+
+
+def test_merge_intervals_matches_brute_force():
+    """Test merging against a minute-by-minute occupancy count."""
+    rng = random.Random(3)
+    events = []
+    for i in range(200):
+        start = at(0) + timedelta(minutes=rng.randrange(0, 24 * 60 * 3))
+        events.append(create_event(f"event_{i}", start, start + timedelta(minutes=rng.randrange(5, 240))))
+    
+    merged = merge_intervals(events)
+    busy_minutes = {
+        minute
+        for e in events
+        for minute in range(int((e.start_time - at(0)).total_seconds() // 60), int((e.end_time - at(0)).total_seconds() // 60))
+    }
+    assert sum(b.duration.total_seconds() // 60 for b in merged) == len(busy_minutes)
+    assert all(a.end < b.start for a, b in zip(merged, merged[1:]))
+
+
+def test_compute_clips_to_working_hours_across_calendars():
+    """Test busy and free blocks from two calendars within one working day."""
+    mine = CalendarEventCollection([
+        create_event("early", at(7), at(9.5)),
+        create_event("standup", at(10), at(10.25)),
+        create_event("cancelled", at(13), at(15), status=EventStatus.CANCELLED),
+    ])
+    team = CalendarEventCollection([
+        create_event("review", at(10.25), at(11)),
+        create_event("late", at(16.5), at(19)),
+    ])
+    
+    result = FreeBusyCalculator().compute([mine, team], MONDAY)
+    assert blocks(result.busy) == [(9, 9.5), (10, 11), (16.5, 17)]
+    assert blocks(result.free) == [(9.5, 10), (11, 16.5)]
+    assert result.busy_time == timedelta(hours=2)
+    assert result.free_time == timedelta(hours=6)
+
+
+def test_compute_spans_multiple_days_and_skips_weekends():
+    """Test a block running over several days and non-working days."""
+    calendar = CalendarEventCollection([
+        create_event("offsite", at(15), at(11, day=1)),
+        create_event("friday", at(9, day=4), at(10, day=4)),
+    ])
+    
+    result = FreeBusyCalculator().compute(calendar, MONDAY, days=7)
+    assert [(b.start.date(), b.start.hour, b.end.hour) for b in result.busy] == [
+        (date(2024, 5, 6), 15, 17),
+        (date(2024, 5, 7), 9, 11),
+        (date(2024, 5, 10), 9, 10),
+    ]
+    assert {b.start.weekday() for b in result.free} == {0, 1, 2, 3, 4}
+
+
+def test_compute_respects_min_free_and_all_day_events():
+    """Test that short gaps and all-day events are ignored by default."""
+    calendar = CalendarEventCollection([
+        create_event("holiday", at(0), at(0, day=1)),
+        create_event("a", at(9), at(12)),
+        create_event("b", at(12.1), at(17)),
+    ])
+    
+    result = FreeBusyCalculator().compute(calendar, MONDAY)
+    assert result.free == []
+    assert blocks(result.busy) == [(9, 12), (12.1, 17)]
+    
+    busy_all_day = FreeBusyCalculator(include_all_day=True).compute(calendar, MONDAY)
+    assert blocks(busy_all_day.busy) == [(9, 17)]
+
+
+def test_working_hours_validation():
+    """Test that working hours must end after they start."""
+    with pytest.raises(ValidationError):
+        WorkingHours(start=time(17), end=time(9))
+
+
+def test_digest_summary_includes_free_busy():
+    """Test that the digest summary reports free/busy time."""
+    events = CalendarEventCollection([create_event("standup", at(9), at(9.5))])
+    team = CalendarEventCollection([create_event("planning", at(14), at(15))])
+    processor = CalendarEventProcessor(
+        events,
+        free_busy=FreeBusyCalculator(working_hours=WorkingHours(end=time(16))),
+        calendars=[team],
+    )
+    
+    summary = processor.get_digest_summary(MONDAY)
+    assert summary["free_busy"] == {
+        "working_hours": "9:00 AM - 4:00 PM",
+        "busy_minutes": 90,
+        "free_minutes": 330,
+        "busy": [
+            {"start": "9:00 AM", "end": "9:30 AM"},
+            {"start": "2:00 PM", "end": "3:00 PM"},
+        ],
+        "free": [
+            {"start": "9:30 AM", "end": "2:00 PM"},
+            {"start": "3:00 PM", "end": "4:00 PM"},
+        ],
+    }
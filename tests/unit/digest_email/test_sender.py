@@ -1,7 +1,11 @@
+import smtplib
+from types import SimpleNamespace
+
 import pytest
 from unittest.mock import patch, MagicMock
 from src.digest_email.sender import EmailSender
 from src.utils.config import load_config
+from src.utils.retry import RetryPolicy
 
 @pytest.fixture
 def email_sender():
@@ -29,4 +33,21 @@ def test_send_templated_email_success(mock_smtp, email_sender):
     result = email_sender.send_templated_email('daily_digest', context, 'recipient@example.com')
     assert result is True
     instance = mock_smtp.return_value.__enter__.return_value
-    instance.sendmail.assert_called_once() 
\ No newline at end of file
+    instance.sendmail.assert_called_once() 
+
+def _smtp_config():
+    email = SimpleNamespace(recipient_email='r@example.com', sender_email='s@example.com', smtp_host='smtp.example.com', smtp_port=587, smtp_username='user', smtp_password='secret')
+    return SimpleNamespace(email=email)
+
+@patch('smtplib.SMTP', side_effect=smtplib.SMTPAuthenticationError(535, b'Authentication failed'))
+def test_send_email_does_not_retry_permanent_errors(mock_smtp):
+    sender = EmailSender(config=_smtp_config(), logger=MagicMock(), retry_policy=RetryPolicy(base_delay=0))
+    with pytest.raises(smtplib.SMTPAuthenticationError):
+        sender.send_email('Test Subject', 'Test Body', retries=3)
+    assert mock_smtp.call_count == 1
+
+@patch('smtplib.SMTP', side_effect=[smtplib.SMTPServerDisconnected('dropped'), MagicMock()])
+def test_send_email_retries_transient_errors(mock_smtp):
+    sender = EmailSender(config=_smtp_config(), logger=MagicMock(), retry_policy=RetryPolicy(base_delay=0))
+    assert sender.send_email('Test Subject', 'Test Body') is True
+    assert mock_smtp.call_count == 2
@@ -5,7 +5,7 @@ This module tests the timezone handling functions, including conversion,
 validation, and DST transition detection.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import pytest
 from zoneinfo import ZoneInfo
 
@@ -18,6 +18,7 @@ from src.utils.timezone import (
     is_dst_transition,
     get_dst_transition_info,
     format_timezone_info,
+    TransitionIndex,
 )
 
 # Test data
@@ -136,4 +137,35 @@ def test_timezone_edge_cases():
     info = format_timezone_info(transition_time)
     assert "Australia/Sydney" in info
     assert "+1100" in info  # DST offset
-    assert "DST" in info 
\ No newline at end of file
+    assert "DST" in info
+
+def test_transition_index_finds_transitions():
+    """Test that transition instants are found to the second and cached."""
+    index = TransitionIndex()
+    transitions = index.transitions(SYDNEY_TIMEZONE, 2024)
+    assert [datetime.fromtimestamp(t, timezone.utc) for t in transitions] == [
+        datetime(2024, 4, 6, 16, 0, tzinfo=timezone.utc),
+        datetime(2024, 10, 5, 16, 0, tzinfo=timezone.utc),
+    ]
+    assert index.transitions(SYDNEY_TIMEZONE, 2024) is transitions
+    assert index.transitions(ZoneInfo("UTC"), 2024) == ()
+    assert index.transitions(timezone(timedelta(hours=10)), 2024) == ()
+
+def test_transition_index_near_transition():
+    """Test instant-based checks within an hour of a transition."""
+    index = TransitionIndex()
+    assert index.is_near_transition(SYDNEY_DST_START_2024)
+    assert index.is_near_transition(SYDNEY_DST_END_2024)
+    assert not index.is_near_transition(SYDNEY_DST_END_2024 + timedelta(minutes=30))
+    assert not index.is_near_transition(datetime(2024, 1, 15, 12, 0, tzinfo=SYDNEY_TIMEZONE))
+    assert not index.is_near_transition(datetime(2024, 10, 6, 2, 0))
+
+def test_transition_index_vectorized_matches_scalar():
+    """Test that bulk checks agree with single checks, across a year boundary."""
+    index = TransitionIndex(window=timedelta(days=2))
+    new_york = ZoneInfo("America/New_York")
+    start = datetime(2023, 10, 1, tzinfo=timezone.utc)
+    instants = [start + timedelta(hours=7 * i) for i in range(1500)]
+    expected = [index.is_near_transition(dt.astimezone(new_york)) for dt in instants]
+    assert index.near_transitions([dt.timestamp() for dt in reversed(instants)], new_york) == expected[::-1]
+    assert sum(expected) > 0
@@ -0,0 +1,150 @@
+"""Unit tests for adaptive per-endpoint rate control."""
+
+import time
+
+from src.utils.adaptive_rate import (
+    AdaptiveRateController,
+    RatePolicy,
+    parse_rate_limit_reset,
+    parse_retry_after,
+)
+from src.utils.rate_limiter import RateLimiter
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 500.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHeaderParsing:
+    """Test rate-limit header parsing."""
+
+    def test_retry_after_seconds_and_date(self):
+        """Test both Retry-After formats."""
+        assert parse_retry_after("30") == 30.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=1445412480.0) == 30.0
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(None) is None
+
+    def test_rate_limit_reset_epoch_and_delta(self):
+        """Test that reset values are accepted as epoch times or deltas."""
+        assert parse_rate_limit_reset("15") == 15.0
+        assert parse_rate_limit_reset("1700000060", now=1700000000.0) == 60.0
+        assert parse_rate_limit_reset("never") is None
+
+
+class TestAdaptiveRateController:
+    """Test AdaptiveRateController functionality."""
+
+    def test_429_decreases_rate_multiplicatively(self):
+        """Test that a 429 halves the endpoint rate, bounded by the minimum."""
+        controller = AdaptiveRateController(default_policy=RatePolicy(initial_rate=12, min_rate=4))
+        controller.record_response("api:/tasks", 429)
+        assert controller.snapshot()["api:/tasks"]["requests_per_minute"] == 6
+        controller.record_response("api:/tasks", 429)
+        assert controller.snapshot()["api:/tasks"]["requests_per_minute"] == 4
+
+    def test_429_scales_burst_with_rate(self):
+        """Test that cutting the rate does not let a drained bucket admit a new burst."""
+        limiter = RateLimiter(requests_per_minute=12, clock=FakeClock())
+        policy = RatePolicy(initial_rate=12, success_threshold=1)
+        controller = AdaptiveRateController(policies={"api:*": policy}, shared_limiters={"api:*": limiter})
+        assert all(controller.acquire("api:/tasks", wait=False) for _ in range(12))
+
+        controller.record_response("api:/tasks", 429)
+
+        assert limiter.burst == 6
+        assert not controller.acquire("api:/tasks", wait=False)
+        controller.record_response("api:/tasks", 200)
+        assert (limiter.requests_per_minute, limiter.burst) == (7, 7)
+        controller.reset()
+        assert (limiter.requests_per_minute, limiter.burst) == (12, 12)
+
+    def test_sustained_success_increases_rate_additively(self):
+        """Test that a run of successes raises the rate, bounded by the maximum."""
+        policy = RatePolicy(initial_rate=10, max_rate=11, increase=1, success_threshold=3)
+        controller = AdaptiveRateController(default_policy=policy)
+        for _ in range(9):
+            controller.record_response("api:/tasks", 200)
+        assert controller.snapshot()["api:/tasks"]["requests_per_minute"] == 11
+
+    def test_endpoints_are_tracked_separately(self):
+        """Test that throttling one endpoint leaves others untouched."""
+        controller = AdaptiveRateController()
+        controller.record_response("api:/tasks", 429)
+        controller.record_response("api:/events", 200)
+        snapshot = controller.snapshot()
+        assert snapshot["api:/tasks"]["requests_per_minute"] == 6
+        assert snapshot["api:/events"]["requests_per_minute"] == 12
+
+    def test_shared_limiter_is_tuned_for_all_matching_endpoints(self):
+        """Test that endpoints under a shared limiter adjust that one limiter."""
+        limiter = RateLimiter(requests_per_minute=10)
+        policy = RatePolicy(initial_rate=10, max_rate=20, increase=1, success_threshold=2)
+        controller = AdaptiveRateController(
+            policies={"api:*": policy}, shared_limiters={"api:*": limiter}
+        )
+        controller.record_response("api:/tasks", 200)
+        controller.record_response("api:/events", 200)
+        assert limiter.requests_per_minute == 11
+        controller.record_response("api:/events", 429)
+        assert limiter.requests_per_minute == 5.5
+        assert controller.snapshot()["api:/tasks"]["requests_per_minute"] == 5.5
+
+        controller.reset()
+        assert limiter.requests_per_minute == 10
+
+    def test_shared_limiter_spends_one_token_per_acquire(self):
+        """Test that acquiring through the controller draws from the shared limiter only once."""
+        limiter = RateLimiter(requests_per_minute=2)
+        controller = AdaptiveRateController(shared_limiters={"api:*": limiter})
+        assert controller.acquire("api:/tasks", wait=False)
+        assert controller.acquire("api:/events", wait=False)
+        assert not controller.acquire("api:/tasks", wait=False)
+
+    def test_policies_match_by_pattern(self):
+        """Test that endpoints pick up the first matching policy."""
+        weather = RatePolicy(initial_rate=60)
+        controller = AdaptiveRateController(policies={"weather:*": weather})
+        assert controller.policy_for("weather:forecast") is weather
+        assert controller.policy_for("motion:/tasks") is controller.default_policy
+
+    def test_retry_after_pauses_endpoint(self):
+        """Test that Retry-After blocks the endpoint until it expires."""
+        clock = FakeClock()
+        controller = AdaptiveRateController(clock=clock)
+        controller.record_response("api:/tasks", 429, {"Retry-After": "20"})
+
+        assert not controller.acquire("api:/tasks", wait=False)
+        assert not controller.acquire("api:/tasks", timeout=5)
+        assert controller.retry_after("api:/tasks") == 20.0
+        clock.now += 20
+        assert controller.acquire("api:/tasks", wait=False)
+
+    def test_exhausted_quota_honours_reset_header(self):
+        """Test that X-RateLimit-Remaining: 0 pauses until X-RateLimit-Reset."""
+        clock = FakeClock()
+        controller = AdaptiveRateController(clock=clock)
+        controller.record_response(
+            "api:/tasks", 200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}
+        )
+        assert controller.snapshot()["api:/tasks"]["paused_for"] == 10.0
+
+    def test_short_pause_is_waited_out(self):
+        """Test that acquire sleeps through a short server-requested pause."""
+        controller = AdaptiveRateController()
+        controller.record_response("api:/tasks", 429, {"Retry-After": "0.05"})
+        started = time.monotonic()
+        assert controller.acquire("api:/tasks")
+        assert time.monotonic() - started >= 0.04
+
+    def test_non_numeric_status_is_ignored(self):
+        """Test that missing status codes do not change the rate."""
+        controller = AdaptiveRateController()
+        controller.record_response("api:/tasks", None)
+        assert controller.snapshot() == {}
@@ -0,0 +1,141 @@
+"""Unit tests for circuit breakers."""
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitState
+from src.utils.exceptions import CircuitOpenError
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock, **kwargs):
+    """Helper to build a breaker that trips quickly."""
+    settings = {"minimum_calls": 4, "failure_threshold": 0.5, "window": 10.0, "open_timeout": 5.0}
+    settings.update(kwargs)
+    return CircuitBreaker("test", clock=clock, **settings)
+
+
+class TestCircuitBreaker:
+    """Test CircuitBreaker functionality."""
+
+    def test_opens_when_error_rate_crosses_threshold(self):
+        """Test that the breaker opens once enough calls fail."""
+        breaker = make_breaker(FakeClock())
+        breaker.record_success()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+
+    def test_needs_minimum_calls(self):
+        """Test that a few failures alone do not open the breaker."""
+        breaker = make_breaker(FakeClock())
+        for _ in range(3):
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_old_outcomes_leave_the_window(self):
+        """Test that failures outside the rolling window no longer count."""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        for _ in range(3):
+            breaker.record_failure()
+        clock.now += 11
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.snapshot()["calls"] == 1
+
+    def test_half_open_trial_success_closes(self):
+        """Test that a successful trial after the cool-down closes the breaker."""
+        clock = FakeClock()
+        breaker = make_breaker(clock, minimum_calls=1)
+        breaker.record_failure()
+        assert breaker.retry_after() == 5.0
+        clock.now += 5
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_trial_failure_reopens(self):
+        """Test that a failed trial reopens the breaker for another cool-down."""
+        clock = FakeClock()
+        breaker = make_breaker(clock, minimum_calls=1)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.retry_after() == 5.0
+
+    def test_released_trial_can_be_retaken(self):
+        """Test that a trial slot given back without an outcome is reusable."""
+        clock = FakeClock()
+        breaker = make_breaker(clock, minimum_calls=1)
+        breaker.record_failure()
+        clock.now += 5
+        assert breaker.allow_request()
+        breaker.release()
+        assert breaker.allow_request()
+
+    def test_call_fails_fast_when_open(self):
+        """Test that call() raises CircuitOpenError without calling the function."""
+        breaker = make_breaker(FakeClock(), minimum_calls=1)
+        with pytest.raises(ValueError):
+            breaker.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+        called = []
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.call(lambda: called.append(1))
+        assert not called
+        assert exc_info.value.breaker == "test"
+
+    def test_call_ignores_non_failures(self):
+        """Test that exceptions rejected by is_failure do not count against the breaker."""
+        breaker = make_breaker(FakeClock(), minimum_calls=1)
+        with pytest.raises(KeyError):
+            breaker.call(lambda: {}["missing"], is_failure=lambda e: not isinstance(e, KeyError))
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_interrupted_call_releases_trial(self):
+        """Test that a call interrupted by a non-Exception is neither a success nor a failure."""
+        clock = FakeClock()
+        breaker = make_breaker(clock, minimum_calls=1)
+        breaker.record_failure()
+        clock.now += 5
+
+        def interrupted():
+            raise KeyboardInterrupt
+
+        with pytest.raises(KeyboardInterrupt):
+            breaker.call(interrupted)
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+
+
+class TestCircuitBreakerRegistry:
+    """Test CircuitBreakerRegistry functionality."""
+
+    def test_one_breaker_per_name(self):
+        """Test that breakers are created once and share defaults."""
+        registry = CircuitBreakerRegistry(open_timeout=12.0)
+        assert registry.get("motion:/tasks") is registry.get("motion:/tasks")
+        assert registry.get("weather:x").open_timeout == 12.0
+
+    def test_snapshot_and_reset(self):
+        """Test that the registry reports and clears breaker state."""
+        registry = CircuitBreakerRegistry(minimum_calls=1)
+        registry.get("smtp:mail").record_failure()
+        assert registry.snapshot()["smtp:mail"]["state"] == "open"
+        registry.reset()
+        assert registry.snapshot() == {}
@@ -1,7 +1,8 @@
 """Tests for the error handling system."""
 
+import asyncio
 import time
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -15,7 +16,9 @@ from src.utils.exceptions import (
     WeatherAPIError,
     handle_error,
     retry_on_error,
+    retry_on_status,
 )
+from src.utils.retry import deadline
 
 
 def test_daily_digest_error_creation():
@@ -220,7 +223,7 @@ def test_retry_on_error_specific_exceptions():
 
 def test_retry_on_error_logging():
     """Test retry decorator logging."""
-    with patch("src.utils.exceptions.logger") as mock_logger:
+    with patch("src.utils.retry.logger") as mock_logger:
         attempts = 0
         
         @retry_on_error(max_attempts=3, delay=0.1)
@@ -236,8 +239,101 @@ def test_retry_on_error_logging():
         # Verify warning logs for retries
         assert mock_logger.warning.call_count == 2
         for call in mock_logger.warning.call_args_list:
-            assert call[1]["function"] == "failing_function"
+            assert call[1]["operation"] == "failing_function"
             assert "attempt" in call[1]
             assert "max_attempts" in call[1]
             assert "delay" in call[1]
-            assert "error" in call[1] 
\ No newline at end of file
+            assert "error" in call[1]
+
+
+def test_retry_on_error_async_uses_asyncio_sleep():
+    """Test retry decorator on a coroutine function without blocking the loop."""
+    attempts = 0
+    
+    @retry_on_error(max_attempts=3, delay=0.5)
+    async def flaky_coroutine():
+        nonlocal attempts
+        attempts += 1
+        if attempts < 3:
+            raise ValueError("Temporary error")
+        return "success"
+    
+    with patch("src.utils.retry.asyncio") as mock_asyncio, \
+            patch("src.utils.retry.time.sleep") as mock_time_sleep:
+        mock_asyncio.sleep = AsyncMock()
+        result = asyncio.run(flaky_coroutine())
+    
+    assert result == "success"
+    assert [c.args[0] for c in mock_asyncio.sleep.await_args_list] == [0.5, 1.0]
+    mock_time_sleep.assert_not_called()
+    assert flaky_coroutine.__name__ == "flaky_coroutine"
+
+
+def test_retry_on_error_jitter_bounds():
+    """Test that full and decorrelated jitter stay within their ranges."""
+    for jitter, low, high in (("full", 0.0, 1.0), ("decorrelated", 1.0, 3.0)):
+        @retry_on_error(max_attempts=2, delay=1.0, jitter=jitter)
+        def failing_function():
+            raise ValueError("Temporary error")
+        
+        with patch("src.utils.retry.time.sleep") as mock_sleep:
+            with pytest.raises(ValidationError):
+                failing_function()
+        
+        assert low <= mock_sleep.call_args.args[0] <= high
+
+
+def test_retry_on_error_stops_at_deadline():
+    """Test that no retry is started that would sleep past the total deadline."""
+    attempts = 0
+    
+    @retry_on_error(max_attempts=10, delay=1.0, backoff=1.0, deadline=2.5)
+    def failing_function():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("Persistent error")
+    
+    clock = [0.0]
+    with patch("src.utils.retry.time.monotonic", side_effect=lambda: clock[0]), \
+            patch("src.utils.retry.time.sleep", side_effect=lambda d: clock.__setitem__(0, clock[0] + d)):
+        with pytest.raises(ValidationError):
+            failing_function()
+    
+    assert attempts == 3
+
+
+def test_retry_on_error_respects_enclosing_deadline():
+    """Test that retries stop at a deadline set by the caller's deadline() scope."""
+    attempts = 0
+    
+    @retry_on_error(max_attempts=10, delay=1.0, backoff=1.0)
+    def failing_function():
+        nonlocal attempts
+        attempts += 1
+        raise ValueError("Persistent error")
+    
+    with patch("src.utils.retry.time.sleep") as mock_sleep:
+        with deadline(0.5):
+            with pytest.raises(ValidationError):
+                failing_function()
+    
+    assert attempts == 1
+    mock_sleep.assert_not_called()
+
+
+def test_retry_on_error_status_predicate_and_metrics():
+    """Test status-based retry decisions and per-attempt metrics."""
+    metrics = []
+    statuses = iter([503, 404])
+    
+    @retry_on_error(max_attempts=5, delay=0, retry_if=retry_on_status(429, 503), on_attempt=metrics.append)
+    def api_call():
+        raise MotionAPIError(message="API error", status_code=next(statuses))
+    
+    with pytest.raises(MotionAPIError) as exc_info:
+        api_call()
+    
+    assert exc_info.value.status_code == 404
+    assert [m["outcome"] for m in metrics] == ["retry", "failure"]
+    assert [m["status_code"] for m in metrics] == [503, 404]
+    assert metrics[0]["operation"] == "api_call"
@@ -0,0 +1,150 @@
+"""Unit tests for the HTTP response cache."""
+
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from src.utils.http_cache import (
+    DiskCacheBackend,
+    MemoryCacheBackend,
+    ResponseCache,
+)
+
+
+class TestResponseCache:
+    """Test ResponseCache functionality."""
+
+    def test_key_normalizes_params(self):
+        """Test that parameter order and None values do not change the key."""
+        key_a = ResponseCache.make_key("get", "https://x/tasks", {"b": 1, "a": "x", "c": None})
+        key_b = ResponseCache.make_key("GET", "https://x/tasks", {"a": "x", "b": "1"})
+        assert key_a == key_b
+        assert key_a != ResponseCache.make_key("GET", "https://x/tasks", {"a": "y", "b": 1})
+        assert key_a != ResponseCache.make_key("GET", "https://x/tasks", {"a": "x", "b": 1}, vary="user2")
+
+    def test_endpoint_ttls(self):
+        """Test that TTLs are chosen per endpoint pattern."""
+        cache = ResponseCache(default_ttl=10, endpoint_ttls={"/tasks": 60, "/tasks/*": 120})
+        assert cache.ttl_for("/tasks") == 60
+        assert cache.ttl_for("/tasks/abc") == 120
+        assert cache.ttl_for("/events") == 10
+
+    def test_hit_miss_and_expiry(self):
+        """Test fresh hits, misses and stale lookups are counted."""
+        cache = ResponseCache(default_ttl=60)
+        key = cache.make_key("GET", "https://x/tasks")
+        assert cache.lookup(key) is None
+
+        cache.store(key, "/tasks", {"tasks": []}, {"ETag": '"v1"'})
+        entry = cache.lookup(key)
+        assert entry.is_fresh()
+        assert entry.value == {"tasks": []}
+        assert entry.conditional_headers() == {"If-None-Match": '"v1"'}
+
+        with patch("src.utils.http_cache.time.time", return_value=time.time() + 120):
+            stale = cache.lookup(key)
+            assert not stale.is_fresh()
+            cache.refresh(stale, {})
+            assert stale.is_fresh()
+
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["stale"] == 1
+        assert stats["revalidated"] == 1
+
+    def test_memory_lru_eviction(self):
+        """Test that the least recently used entry is evicted."""
+        cache = ResponseCache(tiers=[MemoryCacheBackend(max_entries=2)])
+        keys = [cache.make_key("GET", f"https://x/tasks/{i}") for i in range(3)]
+        cache.store(keys[0], "/tasks/0", 0)
+        cache.store(keys[1], "/tasks/1", 1)
+        cache.lookup(keys[0])
+        cache.store(keys[2], "/tasks/2", 2)
+
+        assert cache.lookup(keys[1]) is None
+        assert cache.lookup(keys[0]).value == 0
+        assert cache.stats()["evictions"] == 1
+
+    def test_invalidate_endpoint(self):
+        """Test that invalidation removes every entry for an endpoint."""
+        cache = ResponseCache()
+        list_key = cache.make_key("GET", "https://x/tasks", {"status": "todo"})
+        item_key = cache.make_key("GET", "https://x/tasks/1")
+        cache.store(list_key, "/tasks", [])
+        cache.store(item_key, "/tasks/1", {})
+
+        assert cache.invalidate(["/tasks"]) == 1
+        assert cache.lookup(list_key) is None
+        assert cache.lookup(item_key) is not None
+
+    def test_disk_tier_survives_new_cache_and_promotes(self, tmp_path):
+        """Test that the disk tier persists entries and promotes them to memory."""
+        first = ResponseCache(tiers=[MemoryCacheBackend(), DiskCacheBackend(tmp_path)])
+        key = first.make_key("GET", "https://x/events")
+        first.store(key, "/events", {"events": [1]}, {"Last-Modified": "Wed, 20 Mar 2024 10:00:00 GMT"})
+
+        memory = MemoryCacheBackend()
+        second = ResponseCache(tiers=[memory, DiskCacheBackend(tmp_path)])
+        entry = second.lookup(key)
+        assert entry.value == {"events": [1]}
+        assert entry.last_modified == "Wed, 20 Mar 2024 10:00:00 GMT"
+        assert memory.get(key) is not None
+
+        assert second.invalidate(["/events"]) == 2
+        assert DiskCacheBackend(tmp_path).get(key) is None
+
+    def test_memory_tier_returns_copies(self):
+        """Test that mutating a looked-up or stored value does not change the cache."""
+        cache = ResponseCache()
+        key = cache.make_key("GET", "https://x/tasks")
+        value = {"tasks": [{"id": "t1"}]}
+        cache.store(key, "/tasks", value)
+        value["tasks"].append({"id": "t2"})
+
+        cache.lookup(key).value["tasks"].clear()
+        assert cache.lookup(key).value == {"tasks": [{"id": "t1"}]}
+
+    def test_disk_tier_reads_entry_by_key_hash(self, tmp_path):
+        """Test that disk lookups open the key's own file without scanning the directory."""
+        disk = DiskCacheBackend(tmp_path, max_entries=1)
+        cache = ResponseCache(tiers=[disk])
+        first = cache.make_key("GET", "https://x/tasks/1")
+        second = cache.make_key("GET", "https://x/tasks/2")
+        cache.store(first, "/tasks/1", 1)
+
+        with patch.object(Path, "glob", side_effect=AssertionError("directory scanned")):
+            assert disk.get(first).value == 1
+            assert disk.get(second) is None
+
+        os.utime(next(tmp_path.glob("*.json")), (0, 0))
+        cache.store(second, "/tasks/2", 2)
+        assert disk.get(first) is None
+        assert sorted(p.suffix for p in tmp_path.iterdir()) == [".endpoint", ".json"]
+
+    def test_disk_tier_writes_below_limit_skip_directory_scan(self, tmp_path):
+        """Test that eviction only scans the directory once the limit is exceeded."""
+        disk = DiskCacheBackend(tmp_path, max_entries=10)
+        cache = ResponseCache(tiers=[disk])
+        cache.store(cache.make_key("GET", "https://x/tasks/0"), "/tasks", 0)
+
+        with patch.object(Path, "glob", side_effect=AssertionError("directory scanned")):
+            for i in range(1, 10):
+                cache.store(cache.make_key("GET", f"https://x/tasks/{i}"), "/tasks", i)
+            cache.store(cache.make_key("GET", "https://x/tasks/1"), "/tasks", 1)
+
+        cache.store(cache.make_key("GET", "https://x/tasks/10"), "/tasks", 10)
+        assert len(list(tmp_path.glob("*.json"))) == 9
+        assert cache.invalidate(["/tasks"]) == 9
+        assert list(tmp_path.iterdir()) == []
+
+    def test_from_env_disabled_by_default(self, monkeypatch):
+        """Test that caching is opt-in."""
+        monkeypatch.delenv("MOTION_CACHE_ENABLED", raising=False)
+        assert ResponseCache.from_env() is None
+        monkeypatch.setenv("MOTION_CACHE_ENABLED", "true")
+        monkeypatch.setenv("MOTION_CACHE_TTL", "30")
+        cache = ResponseCache.from_env()
+        assert cache.default_ttl == 30
+        assert len(cache.tiers) == 1
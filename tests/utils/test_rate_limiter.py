@@ -1,5 +1,7 @@
 """Unit tests for rate limiter utility."""
 
+import asyncio
+import threading
 import time
 from unittest.mock import patch
 
@@ -152,4 +154,129 @@ class TestRateLimiter:
         with patch("time.time") as mock_time:
             mock_time.return_value = current_time + 2.1
             assert not limiter.is_rate_limited
-            assert len(limiter.requests) == 1  # Only the most recent request should remain 
\ No newline at end of file
+            assert len(limiter.requests) == 1  # Only the most recent request should remain 
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucketRateLimiter:
+    """Test the GCRA token-bucket engine."""
+
+    def test_burst_then_reject_without_waiting(self):
+        """Test that a full bucket allows a burst and then rejects non-blocking callers."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, burst=3, clock=clock)
+        assert all(limiter.acquire(wait=False) for _ in range(3))
+        assert not limiter.acquire(wait=False)
+        assert limiter.get_current_usage() == (3, 1.0)
+
+    def test_tokens_refill_over_time(self):
+        """Test that tokens refill at the configured rate."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=60, burst=1, clock=clock)
+        assert limiter.acquire(wait=False)
+        assert not limiter.acquire(wait=False)
+        clock.now += 1.0
+        assert limiter.acquire(wait=False)
+
+    def test_timeout_does_not_reserve(self):
+        """Test that a caller whose slot is beyond the timeout gives up without consuming a token."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=6, burst=1, clock=clock)
+        assert limiter.acquire()
+        assert not limiter.acquire(timeout=1.0)
+        clock.now += 10.0
+        assert limiter.acquire(wait=False)
+
+    def test_waits_happen_outside_the_lock(self):
+        """Test that a waiting thread does not block other callers from the lock."""
+        limiter = RateLimiter(requests_per_minute=600, burst=1)
+        limiter.acquire()
+        waiter = threading.Thread(target=limiter.acquire)
+        waiter.start()
+        time.sleep(0.02)
+        acquired = limiter.lock.acquire(timeout=0.01)
+        assert acquired
+        limiter.lock.release()
+        waiter.join()
+
+    def test_waiters_are_served_in_order(self):
+        """Test that blocked callers proceed in the order they arrived."""
+        limiter = RateLimiter(requests_per_minute=1200, burst=1)
+        limiter.acquire()
+        order = []
+
+        def worker(n):
+            limiter.acquire()
+            order.append(n)
+
+        threads = []
+        for n in range(4):
+            thread = threading.Thread(target=worker, args=(n,))
+            thread.start()
+            threads.append(thread)
+            time.sleep(0.005)
+        for thread in threads:
+            thread.join()
+        assert order == [0, 1, 2, 3]
+
+    def test_acquire_async(self):
+        """Test the asynchronous entry point."""
+        limiter = RateLimiter(requests_per_minute=1200, burst=1)
+
+        async def main():
+            return [await limiter.acquire_async() for _ in range(3)]
+
+        started = time.monotonic()
+        assert asyncio.run(main()) == [True, True, True]
+        assert time.monotonic() - started >= 0.09
+
+    def test_cancelled_async_waiter_returns_its_slot(self):
+        """Test that cancelling a waiting coroutine releases its reservation."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=6, burst=1, clock=clock)
+        limiter.acquire()
+
+        async def main():
+            task = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        assert limiter.get_current_usage() == (1, 10.0)
+
+    def test_cancelled_waiter_keeps_slot_reserved_after_it(self):
+        """Test that cancelling an earlier waiter does not roll back a later caller's slot."""
+        clock = FakeClock()
+        limiter = RateLimiter(requests_per_minute=6, burst=1, clock=clock)
+        limiter.acquire()
+
+        async def main():
+            task = asyncio.create_task(limiter.acquire_async())
+            await asyncio.sleep(0)
+            assert limiter.acquire(timeout=30.0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        with patch("src.utils.rate_limiter.time.sleep"):
+            asyncio.run(main())
+        assert limiter.get_current_usage() == (1, 30.0)
+
+    def test_set_rate(self):
+        """Test changing the rate at runtime."""
+        limiter = RateLimiter(requests_per_minute=12)
+        limiter.set_rate(30, burst=2)
+        assert limiter.requests_per_minute == 30
+        assert limiter.burst == 2
+        with pytest.raises(ValueError):
+            limiter.set_rate(0)
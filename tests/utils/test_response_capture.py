@@ -0,0 +1,101 @@
+"""Unit tests for the response capture ring buffer."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.response_capture import ResponseCapture
+
+
+class TestResponseCapture:
+    """Test ResponseCapture functionality."""
+
+    def test_disabled_by_default(self):
+        """Test that nothing is captured unless enabled."""
+        capture = ResponseCapture()
+        assert not capture.record("/tasks", {}, {"tasks": []})
+        assert capture.entries() == []
+
+    def test_ring_buffer_evicts_oldest_entries(self):
+        """Test that the buffer keeps only the most recent entries."""
+        capture = ResponseCapture(enabled=True, max_entries=3)
+        for i in range(5):
+            capture.record("/tasks", {"page": i}, {"i": i})
+        assert [e.params["page"] for e in capture.entries()] == [2, 3, 4]
+
+    def test_total_size_cap(self):
+        """Test that the buffer is bounded by total serialized size."""
+        capture = ResponseCapture(enabled=True, max_entries=100, max_bytes=100)
+        for i in range(10):
+            capture.record("/tasks", {}, {"data": "x" * 30})
+        assert sum(len(e.body) for e in capture.entries()) <= 100
+        assert len(capture.entries()) < 10
+
+    def test_large_entries_are_truncated(self):
+        """Test that a single oversized response is truncated."""
+        capture = ResponseCapture(enabled=True, max_entry_bytes=20)
+        capture.record("/tasks", {}, {"data": "x" * 100})
+        entry = capture.entries()[0]
+        assert entry.truncated
+        assert len(entry.body) == 20
+        assert entry.size > 20
+
+    def test_limits_are_measured_in_utf8_bytes(self):
+        """Test that multi-byte responses stay within the byte limits."""
+        capture = ResponseCapture(enabled=True, max_entries=100, max_bytes=100, max_entry_bytes=21)
+        for _ in range(10):
+            capture.record("/tasks", {}, {"data": "é" * 30})
+        entries = capture.entries()
+        assert all(e.truncated and len(e.body.encode("utf-8")) <= 21 for e in entries)
+        assert entries[0].body.startswith('{"data":"é')
+        assert sum(len(e.body.encode("utf-8")) for e in entries) <= 100
+
+    def test_sampling(self):
+        """Test that only sampled responses are captured."""
+        capture = ResponseCapture(enabled=True, sample_rate=0.5)
+        with patch("src.utils.response_capture.random.random", side_effect=[0.1, 0.9]):
+            assert capture.record("/tasks", {}, {})
+            assert not capture.record("/tasks", {}, {})
+        assert len(capture.entries()) == 1
+
+    def test_invalid_sample_rate(self):
+        """Test that sample rate must be a fraction."""
+        with pytest.raises(ValueError):
+            ResponseCapture(sample_rate=1.5)
+
+    def test_background_flush_to_disk(self, tmp_path):
+        """Test that the background writer flushes the buffer as JSON Lines."""
+        output = tmp_path / "capture" / "responses.jsonl"
+        capture = ResponseCapture(enabled=True, max_entries=2, output_path=output)
+        for i in range(3):
+            capture.record("/tasks", {"page": i}, {"tasks": [i]})
+        assert capture.flush(timeout=5.0)
+        capture.close()
+
+        lines = output.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["params"]["page"] for line in lines] == [1, 2]
+        assert json.loads(json.loads(lines[-1])["body"]) == {"tasks": [2]}
+
+    def test_clear_is_flushed_to_disk(self, tmp_path):
+        """Test that clearing wakes the writer so a later flush completes."""
+        output = tmp_path / "responses.jsonl"
+        capture = ResponseCapture(enabled=True, output_path=output)
+        capture.record("/tasks", None, {"tasks": []})
+        assert capture.flush(timeout=5.0)
+
+        capture.clear()
+        assert capture.flush(timeout=5.0)
+        capture.close()
+        assert output.read_text(encoding="utf-8") == ""
+
+    def test_from_env(self, monkeypatch):
+        """Test configuring capture from environment variables."""
+        monkeypatch.setenv("MOTION_CAPTURE_ENABLED", "true")
+        monkeypatch.setenv("MOTION_CAPTURE_SAMPLE_RATE", "0.25")
+        monkeypatch.setenv("MOTION_CAPTURE_MAX_ENTRIES", "7")
+        capture = ResponseCapture.from_env()
+        assert capture.enabled
+        assert capture.sample_rate == 0.25
+        assert capture.max_entries == 7
+        assert capture.output_path is None
@@ -0,0 +1,146 @@
+"""Unit tests for the retry policy and deadline propagation."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from src.utils.exceptions import DeadlineExceededError, MotionAPIError
+from src.utils.retry import (
+    RetryPolicy,
+    attempt_timeout,
+    deadline,
+    remaining_time,
+)
+
+NO_DELAY = RetryPolicy(max_attempts=3, base_delay=0)
+
+
+def flaky(*errors, result="ok"):
+    """Build a callable that raises the given errors before succeeding."""
+    return Mock(side_effect=[*errors, result])
+
+
+class TestDeadline:
+    """Test deadline scopes."""
+
+    def test_no_deadline_by_default(self):
+        """Test that there is no budget outside a deadline scope."""
+        assert remaining_time() is None
+        assert attempt_timeout(10.0) == 10.0
+
+    def test_nested_deadlines_only_tighten(self):
+        """Test that an inner scope cannot extend the outer budget."""
+        with deadline(1.0):
+            with deadline(60.0):
+                assert remaining_time() <= 1.0
+            with deadline(0.5):
+                assert remaining_time() <= 0.5
+        assert remaining_time() is None
+
+    def test_attempt_timeout_is_capped(self):
+        """Test that per-attempt timeouts never outlive the deadline."""
+        with deadline(2.0):
+            assert attempt_timeout(10.0) <= 2.0
+            assert attempt_timeout(1.0) == 1.0
+
+    def test_expired_deadline_raises(self):
+        """Test that an exhausted budget raises DeadlineExceededError."""
+        with deadline(0.0):
+            with pytest.raises(DeadlineExceededError):
+                attempt_timeout(10.0)
+
+
+class TestRetryPolicy:
+    """Test RetryPolicy functionality."""
+
+    def test_retries_transient_errors_until_success(self):
+        """Test that retryable errors are retried."""
+        func = flaky(MotionAPIError("busy", status_code=503), MotionAPIError("down", status_code=None))
+        assert NO_DELAY.call(func) == "ok"
+        assert func.call_count == 3
+
+    def test_gives_up_after_max_attempts(self):
+        """Test that the last error propagates once attempts are exhausted."""
+        func = Mock(side_effect=MotionAPIError("busy", status_code=503))
+        with pytest.raises(MotionAPIError):
+            NO_DELAY.call(func)
+        assert func.call_count == 3
+
+    def test_does_not_retry_client_errors(self):
+        """Test that non-transient statuses fail immediately."""
+        func = Mock(side_effect=MotionAPIError("not found", status_code=404))
+        with pytest.raises(MotionAPIError):
+            NO_DELAY.call(func)
+        assert func.call_count == 1
+
+    def test_custom_predicate_and_exception_filter(self):
+        """Test retry_on and exceptions narrowing what is retried."""
+        func = Mock(side_effect=KeyError("x"))
+        with pytest.raises(KeyError):
+            NO_DELAY.call(func, exceptions=(MotionAPIError,))
+        assert func.call_count == 1
+
+        func = flaky(ValueError("once"))
+        assert NO_DELAY.call(func, retry_on=lambda e: isinstance(e, ValueError)) == "ok"
+
+    def test_backoff_is_exponential_and_capped(self):
+        """Test the backoff schedule without jitter."""
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0, max_delay=5.0, jitter=False)
+        assert [policy.backoff(n) for n in (1, 2, 3, 4)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_full_jitter_stays_within_backoff(self):
+        """Test that jittered delays never exceed the exponential backoff."""
+        policy = RetryPolicy(base_delay=1.0, multiplier=2.0)
+        assert all(0 <= policy.backoff(3) <= 4.0 for _ in range(50))
+
+    def test_decorrelated_jitter_grows_from_previous_delay(self):
+        """Test that decorrelated delays stay between the base and three times the last delay."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=10.0, jitter="decorrelated")
+        assert all(1.0 <= policy.backoff(2, previous=2.0) <= 6.0 for _ in range(50))
+        with pytest.raises(ValueError):
+            RetryPolicy(jitter="sometimes")
+
+    def test_call_async_retries_without_blocking(self):
+        """Test that coroutine attempts are retried with asyncio.sleep."""
+        func = AsyncMock(side_effect=[MotionAPIError("busy", status_code=503), "ok"])
+        with patch("src.utils.retry.asyncio") as mock_asyncio, patch("src.utils.retry.time.sleep") as mock_sleep:
+            mock_asyncio.sleep = AsyncMock()
+            assert asyncio.run(RetryPolicy(jitter=False).call_async(func)) == "ok"
+        mock_asyncio.sleep.assert_awaited_once_with(0.5)
+        mock_sleep.assert_not_called()
+
+    def test_retry_after_overrides_backoff(self):
+        """Test that a server-provided retry_after is used as the delay."""
+        error = MotionAPIError("slow down", status_code=429, details={"retry_after": 0.25})
+        func = flaky(error)
+        with patch("src.utils.retry.time.sleep") as sleep:
+            assert RetryPolicy(base_delay=10).call(func) == "ok"
+        sleep.assert_called_once_with(0.25)
+
+    def test_excessive_retry_after_is_not_waited(self):
+        """Test that a Retry-After beyond max_retry_after fails immediately."""
+        error = MotionAPIError("slow down", status_code=429, details={"retry_after": 600})
+        func = flaky(error)
+        with pytest.raises(MotionAPIError):
+            RetryPolicy(max_retry_after=60).call(func)
+        assert func.call_count == 1
+
+    def test_retry_that_would_miss_deadline_is_abandoned(self):
+        """Test that no retry is attempted when its delay exceeds the remaining budget."""
+        func = Mock(side_effect=MotionAPIError("busy", status_code=503))
+        started = time.monotonic()
+        with deadline(0.2):
+            with pytest.raises(MotionAPIError):
+                RetryPolicy(base_delay=5.0, jitter=False).call(func)
+        assert func.call_count == 1
+        assert time.monotonic() - started < 0.2
+
+    def test_expired_deadline_prevents_first_attempt(self):
+        """Test that no attempt starts once the deadline has passed."""
+        func = Mock(return_value="ok")
+        with deadline(0.0):
+            with pytest.raises(DeadlineExceededError):
+                NO_DELAY.call(func)
+        func.assert_not_called()
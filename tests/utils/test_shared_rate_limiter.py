@@ -0,0 +1,132 @@
+"""Unit tests for the SQLite-backed cross-process rate limiter."""
+
+import multiprocessing
+import os
+
+import pytest
+
+from src.utils.exceptions import ConfigurationError
+from src.utils.rate_limiter import RateLimiter, create_rate_limiter
+from src.utils.shared_rate_limiter import SQLiteRateLimiter
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self):
+        self.now = 1_700_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+def _acquire_in_child(path, results):
+    """Try to take tokens from a shared limiter in a separate process."""
+    limiter = SQLiteRateLimiter(path=path, requests_per_minute=1, burst=4, name="shared")
+    results.put(sum(limiter.acquire(wait=False) for _ in range(4)))
+    limiter.close()
+
+
+def _acquire_in_forked_child(limiter, results):
+    """Acquire from a limiter inherited across fork and report which connection was used."""
+    inherited = limiter._conn
+    acquired = [limiter.acquire(wait=False) for _ in range(2)]
+    results.put((acquired, limiter._conn is not inherited))
+
+
+class TestSQLiteRateLimiter:
+    """Test SQLiteRateLimiter functionality."""
+
+    def test_instances_share_one_budget(self, tmp_path):
+        """Test that two limiters on the same database draw from the same bucket."""
+        clock = FakeClock()
+        path = tmp_path / "limits.sqlite3"
+        first = SQLiteRateLimiter(path=path, requests_per_minute=60, burst=2, clock=clock)
+        second = SQLiteRateLimiter(path=path, requests_per_minute=60, burst=2, clock=clock)
+
+        assert first.acquire(wait=False)
+        assert second.acquire(wait=False)
+        assert not first.acquire(wait=False)
+        assert second.get_current_usage() == (2, 1.0)
+
+        clock.now += 1.0
+        assert second.acquire(wait=False)
+
+    def test_names_are_independent(self, tmp_path):
+        """Test that differently named limiters keep separate budgets."""
+        clock = FakeClock()
+        path = tmp_path / "limits.sqlite3"
+        motion = SQLiteRateLimiter(path=path, requests_per_minute=60, burst=1, name="motion", clock=clock)
+        weather = SQLiteRateLimiter(path=path, requests_per_minute=60, burst=1, name="weather", clock=clock)
+
+        assert motion.acquire(wait=False)
+        assert weather.acquire(wait=False)
+        assert not motion.acquire(wait=False)
+
+    def test_timeout_and_reset(self, tmp_path):
+        """Test that timeouts do not reserve and reset refills the shared bucket."""
+        clock = FakeClock()
+        limiter = SQLiteRateLimiter(path=tmp_path / "l.sqlite3", requests_per_minute=6, burst=1, clock=clock)
+        assert limiter.acquire()
+        assert not limiter.acquire(timeout=1.0)
+        assert limiter.get_current_usage() == (1, 10.0)
+        limiter.reset()
+        assert limiter.get_current_usage() == (0, 0.0)
+
+    def test_budget_is_shared_across_processes(self, tmp_path):
+        """Test that separate processes cannot exceed the combined burst."""
+        path = tmp_path / "limits.sqlite3"
+        ctx = multiprocessing.get_context("spawn")
+        results = ctx.Queue()
+        workers = [ctx.Process(target=_acquire_in_child, args=(path, results)) for _ in range(3)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=30)
+
+        assert sum(results.get(timeout=5) for _ in workers) == 4
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork()")
+    def test_forked_child_opens_its_own_connection(self, tmp_path):
+        """Test that a limiter inherited across fork reconnects and shares the budget."""
+        limiter = SQLiteRateLimiter(path=tmp_path / "l.sqlite3", requests_per_minute=1, burst=2)
+        assert limiter.acquire(wait=False)
+
+        ctx = multiprocessing.get_context("fork")
+        results = ctx.Queue()
+        child = ctx.Process(target=_acquire_in_forked_child, args=(limiter, results))
+        child.start()
+        child.join(timeout=30)
+
+        assert child.exitcode == 0
+        assert results.get(timeout=5) == ([True, False], True)
+        assert not limiter.acquire(wait=False)
+        limiter.close()
+
+
+class TestCreateRateLimiter:
+    """Test backend selection from the environment."""
+
+    def test_memory_backend_by_default(self, monkeypatch):
+        """Test that the in-process limiter is used by default."""
+        monkeypatch.delenv("RATE_LIMITER_BACKEND", raising=False)
+        limiter = create_rate_limiter(requests_per_minute=30)
+        assert type(limiter) is RateLimiter
+        assert limiter.requests_per_minute == 30
+
+    def test_sqlite_backend(self, monkeypatch, tmp_path):
+        """Test selecting the shared SQLite backend."""
+        monkeypatch.setenv("RATE_LIMITER_BACKEND", "sqlite")
+        monkeypatch.setenv("RATE_LIMITER_PATH", str(tmp_path / "limits.sqlite3"))
+        monkeypatch.setenv("RATE_LIMITER_BURST", "3")
+        limiter = create_rate_limiter(name="motion")
+        assert isinstance(limiter, SQLiteRateLimiter)
+        assert limiter.path == tmp_path / "limits.sqlite3"
+        assert limiter.burst == 3
+        limiter.close()
+
+    def test_unknown_backend(self, monkeypatch):
+        """Test that an unknown backend is a configuration error."""
+        monkeypatch.setenv("RATE_LIMITER_BACKEND", "redis")
+        with pytest.raises(ConfigurationError):
+            create_rate_limiter()
@@ -0,0 +1,90 @@
+"""Unit tests for single-flight request coalescing."""
+
+import threading
+import time
+
+import pytest
+
+from src.utils.exceptions import DeadlineExceededError
+from src.utils.retry import deadline
+from src.utils.singleflight import SingleFlight
+
+
+class TestSingleFlight:
+    """Test SingleFlight functionality."""
+
+    def test_concurrent_threads_share_one_call(self):
+        """Test that overlapping calls with the same key execute once."""
+        group = SingleFlight()
+        calls = []
+        release = threading.Event()
+
+        def work():
+            calls.append(1)
+            release.wait(timeout=2)
+            return {"value": 42}
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(group.do("k", work)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.1)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert all(result is results[0] for result in results)
+        assert group.stats() == {"calls": 5, "executions": 1, "coalesced": 4}
+
+    def test_different_keys_are_not_coalesced(self):
+        """Test that distinct keys run independently."""
+        group = SingleFlight()
+        assert group.do("a", lambda: 1) == 1
+        assert group.do("b", lambda: 2) == 2
+        assert group.stats()["executions"] == 2
+
+    def test_sequential_calls_rerun_without_window(self):
+        """Test that completed calls are not reused by default."""
+        group = SingleFlight()
+        counter = iter(range(10))
+        assert group.do("k", lambda: next(counter)) == 0
+        assert group.do("k", lambda: next(counter)) == 1
+
+    def test_window_reuses_recent_result(self):
+        """Test that a completed result is shared within the window."""
+        group = SingleFlight(window=60)
+        counter = iter(range(10))
+        assert group.do("k", lambda: next(counter)) == 0
+        assert group.do("k", lambda: next(counter)) == 0
+        assert group.stats()["coalesced"] == 1
+
+    def test_errors_are_shared_and_not_cached(self):
+        """Test that followers see the leader's error and later calls retry."""
+        group = SingleFlight(window=60)
+
+        def fail():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            group.do("k", fail)
+        assert group.do("k", lambda: "ok") == "ok"
+
+    def test_follower_wait_is_bounded_by_deadline(self):
+        """Test that a coalesced caller gives up when its deadline passes."""
+        group = SingleFlight()
+        release = threading.Event()
+        leader = threading.Thread(target=lambda: group.do("k", lambda: release.wait(timeout=2)))
+        leader.start()
+        time.sleep(0.05)
+
+        with deadline(0.05):
+            with pytest.raises(DeadlineExceededError):
+                group.do("k", lambda: "never")
+        release.set()
+        leader.join()
+        assert group.stats()["coalesced"] == 1